@@ -1,5 +1,7 @@
-import json
-import os
+"""
+Fallback anchor names and product definitions, keyed by base product code
+Used by build_catalog.py when the PDF extraction leaves a field empty
+"""
 
 # Define product definitions for each anchor type based on the PDF catalog
 PRODUCT_DEFINITIONS = {
@@ -136,62 +138,3 @@ PRODUCT_NAMES = {
     "GBSF": "GreenBolt Screw Fixing",
     "GBSFPB": "GreenBolt Screw Fixing Plastic Body"
 }
-
-def get_base_code(code):
-    """Extract base product code without size numbers"""
-    import re
-    return re.sub(r'\d+$', '', code)
-
-def fix_anchor_catalog():
-    # Load the catalog
-    with open('data/anchor-catalog.json', 'r', encoding='utf-8') as f:
-        catalog = json.load(f)
-    
-    products_updated = 0
-    
-    # Process each product
-    for product in catalog['category']['products']:
-        code = product['code']
-        base_code = get_base_code(code)
-        
-        # Update product name/description
-        if base_code in PRODUCT_NAMES:
-            old_desc = product['description']
-            product['description'] = PRODUCT_NAMES[base_code]
-            
-            # Update title to include full name
-            size = product.get('size', '')
-            product['title'] = f"{PRODUCT_NAMES[base_code]} - {code}"
-            
-            if old_desc != PRODUCT_NAMES[base_code]:
-                products_updated += 1
-                print(f"Updated {code}: '{old_desc}' -> '{PRODUCT_NAMES[base_code]}'")
-        
-        # Add product definition
-        if base_code in PRODUCT_DEFINITIONS:
-            product['product_definition'] = PRODUCT_DEFINITIONS[base_code]
-        
-        # Fix image paths to match actual file names
-        if base_code:
-            product['images'] = [
-                f"assets/Anchors/3d/{base_code}.png",
-                f"assets/Anchors/Drawing/{base_code}.png"
-            ]
-        
-        # Ensure ID matches the product code format
-        expected_id = f"anchor-{code.lower()}"
-        if product['id'] != expected_id:
-            print(f"Fixed ID: {product['id']} -> {expected_id}")
-            product['id'] = expected_id
-    
-    # Save the updated catalog
-    with open('data/anchor-catalog.json', 'w', encoding='utf-8') as f:
-        json.dump(catalog, f, indent=2, ensure_ascii=False)
-    
-    print(f"\n✓ Updated {products_updated} product descriptions")
-    print(f"✓ Added product definitions for all products")
-    print(f"✓ Fixed image paths to match actual filenames")
-    print(f"✓ Ensured IDs match product codes")
-
-if __name__ == "__main__":
-    fix_anchor_catalog()
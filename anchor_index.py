@@ -0,0 +1,245 @@
+"""
+Array-backed anchor selection index
+Flattens every variant in data/anchor-catalog.json into one NumPy column per
+property, pre-sorted by size (thread diameter, then length), so a query is a
+few vectorized comparisons and its hits come out already in size order.
+query_batch() answers a whole fixing schedule with one broadcast.
+
+The same columns are written to data/anchor-index.json for js/anchor-index.js
+(AnchorIndex in the browser), which runs the identical filter client-side.
+
+Usage:
+    python anchor_index.py build
+    python anchor_index.py query --tensile 5 --shear 4 --fixture 10
+    python anchor_index.py schedule fixings.csv -o fixings-selected.csv
+"""
+
+import argparse
+import csv
+import json
+import math
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+
+import catalog_model
+
+ROOT = Path(__file__).resolve().parent
+ANCHOR_CATALOG = 'data/anchor-catalog.json'
+INDEX_OUTPUT = 'data/anchor-index.json'
+INDEX_VERSION = 1
+
+# Numeric variant fields; null in the catalogue becomes NaN and never matches a limit
+COLUMNS = ['tensileLoadKN', 'shearLoadKN', 'maxFixtureThickness', 'drillDiameter', 'installationTorque']
+
+# query keyword -> column it sets a minimum on
+LIMITS = {
+    'tensile': 'tensileLoadKN',
+    'shear': 'shearLoadKN',
+    'fixture': 'maxFixtureThickness',
+}
+
+# Schedule column names per query keyword, first found wins
+SCHEDULE_COLUMNS = {
+    'tensile': ('tensile_kN', 'tensile'),
+    'shear': ('shear_kN', 'shear'),
+    'fixture': ('fixture_mm', 'fixture'),
+}
+
+SIZE_RE = re.compile(r'M(\d+(?:\.\d+)?)\s*[x×]\s*(\d+(?:\.\d+)?)', re.IGNORECASE)
+
+
+def parse_size(size):
+    """'M10 x 100' (or 'M12 × 110') -> (10.0, 100.0); unparsable sizes sort last"""
+    match = SIZE_RE.search(size or '')
+    return (float(match.group(1)), float(match.group(2))) if match else (np.inf, np.inf)
+
+
+class AnchorIndex:
+    def __init__(self, codes, families, names, sizes, columns):
+        self.codes = codes            # variant product codes, in size order
+        self.families = families      # family product code per variant
+        self.names = names            # family code -> family name
+        self.sizes = sizes
+        self.columns = columns        # column -> float array aligned with codes
+
+    @classmethod
+    def build(cls, catalog_path=None, root=ROOT):
+        catalogue = catalog_model.load(Path(root) / (catalog_path or ANCHOR_CATALOG))
+
+        records = [(family, variant) for family in catalogue for variant in family.variants]
+        records.sort(key=lambda r: (*parse_size(r[1].get('size')), r[1].code or ''))
+
+        columns = {
+            column: np.array([np.nan if v.get(column) is None else float(v[column]) for _, v in records])
+            for column in COLUMNS
+        }
+        return cls(
+            codes=[v.code or '' for _, v in records],
+            families=[f.code for f, _ in records],
+            names={f.code: f.name for f in catalogue},
+            sizes=[v.get('size', '') for _, v in records],
+            columns=columns,
+        )
+
+    def __len__(self):
+        return len(self.codes)
+
+    def query_batch(self, **limits):
+        """
+        Matches for many queries at once
+        Each keyword in LIMITS takes a scalar or an array of minimums (None or
+        NaN = no limit). Returns a list with one array of row positions per
+        query, in size order.
+        """
+        arrays = {key: np.atleast_1d(np.asarray(value, dtype=float))
+                  for key, value in limits.items() if value is not None}
+        unknown = set(arrays) - set(LIMITS)
+        if unknown:
+            raise ValueError(f"Unknown limits: {', '.join(sorted(unknown))}")
+
+        n_queries = max((len(a) for a in arrays.values()), default=1)
+        mask = np.ones((n_queries, len(self)), dtype=bool)
+        for key, minimum in arrays.items():
+            values = self.columns[LIMITS[key]][None, :]
+            minimum = minimum[:, None]
+            # NaN minimum = no limit; NaN value fails any limit
+            mask &= np.isnan(minimum) | (values >= minimum)
+        return [np.flatnonzero(row) for row in mask]
+
+    def query(self, tensile=None, shear=None, fixture=None):
+        """All anchors with tensile >= tensile kN, shear >= shear kN and max fixture >= fixture mm"""
+        return [self.record(i) for i in self.query_batch(tensile=tensile, shear=shear, fixture=fixture)[0]]
+
+    def record(self, i):
+        family = self.families[i]
+        record = {'productCode': self.codes[i], 'family': family, 'name': self.names.get(family, ''),
+                  'size': self.sizes[i]}
+        for column in COLUMNS:
+            value = self.columns[column][i]
+            record[column] = None if np.isnan(value) else (int(value) if value.is_integer() else float(value))
+        return record
+
+    def to_json(self):
+        """Columnar form read by js/anchor-index.js"""
+        family_codes = list(self.names)
+        family_pos = {code: i for i, code in enumerate(family_codes)}
+        return {
+            'version': INDEX_VERSION,
+            'families': [[code, self.names[code]] for code in family_codes],
+            'codes': self.codes,
+            'family': [family_pos[code] for code in self.families],
+            'sizes': self.sizes,
+            'columns': {column: [self.record(i)[column] for i in range(len(self))] for column in COLUMNS},
+        }
+
+    def write(self, root=ROOT):
+        path = Path(root) / INDEX_OUTPUT
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f, ensure_ascii=False, separators=(',', ':'))
+        return path
+
+
+def read_limit(row, *keys):
+    """
+    (minimum, problem) from the first non-blank of keys: blank = no limit (NaN);
+    a non-numeric, nan or inf cell gives the problem 'invalid input: <key>'
+    """
+    for key in keys:
+        value = (row.get(key) or '').strip()
+        if value:
+            try:
+                number = float(value)
+            except ValueError:
+                number = math.nan
+            if not math.isfinite(number):
+                return np.nan, f"invalid input: {key}"
+            return number, None
+    return np.nan, None
+
+
+def select_schedule(rows, index, list_all=False):
+    """
+    Annotate fixing rows (tensile_kN, shear_kN, fixture_mm) with the smallest matching anchor
+    A row with a cell that is not a number gets the status 'invalid input: <column>'
+    and no anchor; the other rows are still answered.
+    """
+    limits = {key: [] for key in SCHEDULE_COLUMNS}
+    problems = []
+    for row in rows:
+        row_problems = []
+        for key, columns in SCHEDULE_COLUMNS.items():
+            value, problem = read_limit(row, *columns)
+            limits[key].append(value)
+            if problem:
+                row_problems.append(problem)
+        problems.append(row_problems[0] if row_problems else None)
+    matches = index.query_batch(**limits)
+
+    selected = []
+    for row, hits, problem in zip(rows, matches, problems):
+        if problem:
+            hits = hits[:0]
+        out = dict(row)
+        first = index.record(hits[0]) if len(hits) else None
+        out.update({
+            'anchor': first['productCode'] if first else '',
+            'size': first['size'] if first else '',
+            'matches': len(hits),
+            'status': problem or ('ok' if first else 'no matching anchor'),
+        })
+        if list_all:
+            out['all_matches'] = ';'.join(index.codes[i] for i in hits)
+        selected.append(out)
+    return selected
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query GreenBolt anchors by load and fixture thickness")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('build', help=f"write {INDEX_OUTPUT} for the browser")
+
+    query = commands.add_parser('query', help="list anchors meeting the given minimums, by size")
+    query.add_argument('--tensile', type=float, help="minimum tensile load (kN)")
+    query.add_argument('--shear', type=float, help="minimum shear load (kN)")
+    query.add_argument('--fixture', type=float, help="minimum max. fixture thickness (mm)")
+
+    schedule = commands.add_parser('schedule', help="smallest anchor for every row of a CSV")
+    schedule.add_argument('fixings', type=Path, help="CSV with tensile_kN, shear_kN and/or fixture_mm columns")
+    schedule.add_argument('-o', '--output', type=Path, help="output CSV (default: stdout)")
+    schedule.add_argument('--all', action='store_true', help="also list every matching code")
+
+    args = parser.parse_args(argv)
+    index = AnchorIndex.build()
+
+    if args.command == 'build':
+        path = index.write()
+        print(f"OK {len(index)} anchor variants -> {INDEX_OUTPUT} ({path.stat().st_size / 1024:.0f} KB)")
+
+    elif args.command == 'query':
+        results = index.query(tensile=args.tensile, shear=args.shear, fixture=args.fixture)
+        for r in results:
+            print(f"{r['productCode']:14} {r['size']:12} tensile {r['tensileLoadKN']} kN  "
+                  f"shear {r['shearLoadKN']} kN  fixture {r['maxFixtureThickness']} mm  {r['name']}")
+        print(f"{len(results)} of {len(index)} anchors match")
+
+    else:
+        with open(args.fixings, 'r', encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+        selected = select_schedule(rows, index, list_all=args.all)
+        if selected:
+            out = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+            try:
+                writer = csv.DictWriter(out, fieldnames=list(selected[0]))
+                writer.writeheader()
+                writer.writerows(selected)
+            finally:
+                if args.output:
+                    out.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,267 @@
+"""
+Asset manifest and image reference check
+One os.scandir walk of assets/ records every file's size, content hash and
+(for images) pixel size in .cache/asset-manifest.json:
+    {"version": 1, "files": {"assets/CLAMPS/GGCP.png": [48213, 1718..., "3fa9c2...", 2400, 1800], ...}}
+Files whose size and mtime are unchanged keep their hash and dimensions from
+the previous manifest, so a re-scan reads no image data. build_images.py
+takes its content hashes from here instead of re-reading every source.
+
+The check collects every assets/ reference in data/*.json, the HTML pages,
+stylesheets and js/ and compares them with the manifest in one pass:
+    missing          no file at that path
+    case mismatch    only a file differing in case (.PNG vs .png) - works
+                     on a laptop, 404s on the Linux host
+    unreferenced     a file nothing points at
+Template references like assets/Anchors/3d/${code}.png count as patterns:
+files they match are not unreferenced. assets/derived/ belongs to
+build_images.py and is not scanned.
+
+Usage:
+    python asset_manifest.py
+    python asset_manifest.py --all                  # list every finding, not the first few
+    python asset_manifest.py --report .cache/reports/assets.json
+    python asset_manifest.py --strict               # exit 1 on missing or case-mismatched references
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from urllib.parse import unquote
+
+from PIL import Image
+
+ROOT = Path(__file__).resolve().parent
+ASSET_DIR = 'assets'
+SKIP_DIRS = {'assets/derived'}
+MANIFEST = '.cache/asset-manifest.json'
+MANIFEST_VERSION = 1
+HASH_LENGTH = 16
+
+IMAGE_SUFFIXES = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif'}
+
+# Where references live: data catalogues, pages, stylesheets, page scripts
+REFERENCE_GLOBS = ['data/*.json', '*.html', '*.css', 'js/*.js']
+# data/*.json holding asset paths as keys of a generated map, not references
+GENERATED_DATA = {'data/images.json'}
+
+# In pages and scripts: an assets/ path inside quotes (names have spaces and
+# brackets), or unquoted in a CSS url()
+QUOTED_RE = re.compile(r'''(["'`])\.?/?(assets[/\\][^"'`<>\n]*)\1''')
+URL_RE = re.compile(r'''url\(\s*\.?/?(assets[/\\][^)"'\s]*)\s*\)''')
+# ${...} in JS template literals
+TEMPLATE_RE = re.compile(r'\$\{[^}]*\}')
+# A reference that is only the start of a path ('assets/Anchors/3d/' + code + '.png')
+PREFIX_RE = re.compile(r'[/\\ ]$')
+
+
+def content_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def image_size(path):
+    """(width, height) from the image header, or (None, None)"""
+    try:
+        with Image.open(path) as image:
+            return image.size
+    except Exception:
+        return None, None
+
+
+def walk(directory, rel_dir):
+    """(relative path, DirEntry) of every file under directory, skipping SKIP_DIRS"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                if rel_path not in SKIP_DIRS:
+                    yield from walk(entry.path, rel_path)
+            elif entry.is_file():
+                yield rel_path, entry
+
+
+def load(root=ROOT):
+    """The saved manifest's files ({} when missing or from another version)"""
+    try:
+        with open(Path(root) / MANIFEST, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest.get('files', {}) if manifest.get('version') == MANIFEST_VERSION else {}
+
+
+def scan(root=ROOT, previous=None):
+    """
+    {path: [size, mtime_ns, hash, width, height]} for every file under assets/
+    Entries of previous whose size and mtime match are reused as they are.
+    """
+    root = Path(root)
+    previous = load(root) if previous is None else previous
+    files = {}
+    for rel_path, entry in walk(root / ASSET_DIR, ASSET_DIR):
+        stat = entry.stat()
+        old = previous.get(rel_path)
+        if old and old[0] == stat.st_size and old[1] == stat.st_mtime_ns:
+            files[rel_path] = old
+            continue
+        width = height = None
+        if Path(rel_path).suffix.lower() in IMAGE_SUFFIXES:
+            width, height = image_size(entry.path)
+        files[rel_path] = [stat.st_size, stat.st_mtime_ns, content_hash(entry.path), width, height]
+    return dict(sorted(files.items()))
+
+
+def save(files, root=ROOT):
+    path = Path(root) / MANIFEST
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': MANIFEST_VERSION, 'files': files}, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    return path
+
+
+def build(root=ROOT):
+    """Scan assets/ (reusing the saved manifest) and save the result"""
+    files = scan(root)
+    save(files, root)
+    return files
+
+
+def normalise(reference):
+    """A reference as a manifest path: forward slashes, no query/fragment, %-escapes decoded"""
+    reference = reference.replace('\\', '/').split('?', 1)[0].split('#', 1)[0]
+    return unquote(reference)
+
+
+def source_files(root):
+    for pattern in REFERENCE_GLOBS:
+        for path in sorted(root.glob(pattern)):
+            rel_path = path.relative_to(root).as_posix()
+            if rel_path not in GENERATED_DATA:
+                yield rel_path, path
+
+
+def json_strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from json_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from json_strings(item)
+
+
+def references_in(rel_path, path):
+    """The assets/ references in one source file"""
+    if rel_path.endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            strings = json_strings(json.load(f))
+        return [string.lstrip('./') for string in strings if string.lstrip('./').startswith(('assets/', 'assets\\'))]
+    text = path.read_text(encoding='utf-8', errors='replace')
+    return [m.group(2) for m in QUOTED_RE.finditer(text)] + [m.group(1) for m in URL_RE.finditer(text)]
+
+
+def collect_references(root=ROOT):
+    """{reference: [file it appears in, ...]} for every assets/ reference in the sources"""
+    root = Path(root)
+    references = {}
+    for rel_path, path in source_files(root):
+        for reference in references_in(rel_path, path):
+            sources = references.setdefault(normalise(reference), [])
+            if rel_path not in sources:
+                sources.append(rel_path)
+    return references
+
+
+def check(files, references):
+    """Findings: missing and case-mismatched references, unreferenced files"""
+    by_lower = {}
+    for rel_path in files:
+        by_lower.setdefault(rel_path.lower(), []).append(rel_path)
+
+    referenced = set()
+    patterns = []
+    missing, case_mismatch = {}, {}
+    for reference, sources in references.items():
+        if TEMPLATE_RE.search(reference) or PREFIX_RE.search(reference):
+            parts = TEMPLATE_RE.split(reference)
+            pattern = '[^/]+'.join(map(re.escape, parts))
+            patterns.append(re.compile(pattern + ('[^/]*' if PREFIX_RE.search(reference) else '') + '$', re.IGNORECASE))
+        elif reference in files:
+            referenced.add(reference)
+        elif reference.lower() in by_lower:
+            matches = by_lower[reference.lower()]
+            referenced.update(matches)
+            case_mismatch[reference] = {'files': matches, 'sources': sources}
+        else:
+            missing[reference] = {'sources': sources}
+
+    unreferenced = [rel_path for rel_path in files
+                    if rel_path not in referenced and not any(p.match(rel_path) for p in patterns)]
+    return {'missing': missing, 'case_mismatch': case_mismatch, 'unreferenced': unreferenced}
+
+
+def print_findings(findings, limit):
+    def shown(items):
+        return items if limit is None else items[:limit]
+
+    missing, case_mismatch, unreferenced = (findings['missing'], findings['case_mismatch'],
+                                            findings['unreferenced'])
+    for reference in shown(sorted(missing)):
+        print(f"❌ missing: {reference}  ({', '.join(missing[reference]['sources'])})")
+    for reference in shown(sorted(case_mismatch)):
+        entry = case_mismatch[reference]
+        print(f"⚠️  case: {reference} -> {', '.join(entry['files'])}  ({', '.join(entry['sources'])})")
+    for rel_path in shown(unreferenced):
+        print(f"   unreferenced: {rel_path}")
+    hidden = sum(max(0, len(items) - limit) for items in (missing, case_mismatch, unreferenced)) if limit else 0
+    if hidden:
+        print(f"   ... {hidden} more (--all to list them)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the asset manifest and check every assets/ reference against it")
+    parser.add_argument('--all', action='store_true', help="list every finding")
+    parser.add_argument('--report', type=Path, default=None, help="also write the findings as JSON here")
+    parser.add_argument('--strict', action='store_true', help="exit 1 on missing or case-mismatched references")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    files = build(ROOT)
+    scanned = time.perf_counter()
+    references = collect_references(ROOT)
+    findings = check(files, references)
+    finished = time.perf_counter()
+
+    print_findings(findings, None if args.all else 10)
+    print(f"\n{'='*60}")
+    print(f"{len(files)} files in {ASSET_DIR}/ ({sum(f[0] for f in files.values()) / 2**20:.1f} MB), "
+          f"{len(references)} distinct references")
+    print(f"{len(findings['missing'])} missing, {len(findings['case_mismatch'])} case mismatches, "
+          f"{len(findings['unreferenced'])} unreferenced")
+    print(f"Manifest {(scanned - started) * 1000:.0f} ms, check {(finished - scanned) * 1000:.0f} ms - {MANIFEST}")
+    print(f"{'='*60}")
+
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(findings, f, indent=2)
+        print(f"Report: {args.report}")
+
+    if args.strict and (findings['missing'] or findings['case_mismatch']):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
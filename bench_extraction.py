@@ -0,0 +1,371 @@
+"""
+Benchmark the PDF extractors against stored baselines
+Runs extract_all_anchors.extract_product_from_page over
+Product-Catalogues-PDF/Anchors rev1.pdf, then the anchor and strut
+extractors over synthetic PDFs of growing size written by
+write_synthetic_pdf(). Each case runs in a fresh process so its peak RSS is
+its own, and reports:
+  pages/sec, per-page latency (p50 / p95 / max ms), table read ms/page
+  (anchors: the extract_tables and table_regex stages), pages where the
+  regex text fallback had to supply rows, peak RSS (MB)
+Table timings and fallback pages come from the extractors' own run report
+stages and counters (variants_from_text, properties_from_text). The strut
+case runs pdf_engine.extract_pages with one worker, as the CLI does.
+
+Results are compared with benchmarks/extraction-baseline.json; a case that
+is slower or larger than its baseline beyond the tolerance fails the run
+(exit 1). Every run is appended as one JSON line to the history file for
+trend tracking, and --json writes the full result document.
+
+Synthetic pages mimic the catalogue layouts: a ruled installation-parameters
+table placed where pdf_layouts.ANCHOR_PAGE expects it (anchors) or a
+section-properties table (struts), with every fourth page leaving rows out
+of the ruling. Strut pages then need the regex fallback; the anchor layout
+grid still reads the unruled rows.
+
+Usage:
+    python bench_extraction.py
+    python bench_extraction.py --sizes 10 40 --anchor-pages 10
+    python bench_extraction.py --json bench.json --tolerance 0.3
+    python bench_extraction.py --update-baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+ANCHORS_PDF = 'Product-Catalogues-PDF/Anchors rev1.pdf'
+BASELINE = 'benchmarks/extraction-baseline.json'
+HISTORY = '.cache/bench/extraction.jsonl'
+DEFAULT_SIZES = [10, 40, 160]
+DEFAULT_TOLERANCE = 0.25      # timing noise allowed before a case counts as slower
+RSS_TOLERANCE = 0.15
+MIN_PAGES_FOR_P95 = 20        # fewer pages make p95 just the slowest page
+FALLBACK_EVERY = 4            # every Nth synthetic page has rows outside the ruled table
+
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842
+
+# Metric -> True when a higher value is better; what the baseline comparison checks
+CHECKED_METRICS = {
+    'pages_per_sec': True,
+    'p95_ms': False,
+    'peak_rss_mb': False,
+}
+
+
+# ---- synthetic PDFs ----
+
+def pdf_text(text):
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+class PageCanvas:
+    """Content stream for one page: Helvetica text and stroked rectangles"""
+
+    def __init__(self):
+        self.ops = []
+
+    def text(self, x, y, text, size=9):
+        self.ops.append(f"BT /F1 {size} Tf {x:.1f} {y:.1f} Td ({pdf_text(text)}) Tj ET")
+
+    def table(self, x, y, widths, rows, row_height=14, ruled=True, size=7):
+        """rows of cell strings, top row at y; returns the y below the table"""
+        for r, row in enumerate(rows):
+            top = y - r * row_height
+            left = x
+            for width, value in zip(widths, row):
+                if ruled:
+                    self.ops.append(f"{left:.1f} {top - row_height:.1f} {width:.1f} {row_height:.1f} re S")
+                self.text(left + 2, top - row_height + 4, value, size)
+                left += width
+        return y - len(rows) * row_height
+
+    def stream(self):
+        return '\n'.join(self.ops).encode('latin-1')
+
+
+def write_pdf(path, canvases):
+    """Minimal PDF 1.4 writer - one Helvetica font, one content stream per page"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"]
+    kids = []
+    for canvas in canvases:
+        content = canvas.stream()
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>".encode())
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    out.write(b"".join(b"%010d 00000 n \n" % offset for offset in offsets))
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    Path(path).write_bytes(out.getvalue())
+
+
+def letters(n):
+    """0 -> A, 25 -> Z, 26 -> BA: product code letters for synthetic page n"""
+    code = ''
+    while True:
+        code = chr(ord('A') + n % 26) + code
+        n //= 26
+        if not n:
+            return code
+
+
+def anchor_page(n):
+    """Blocks where pdf_layouts.ANCHOR_PAGE looks for them (the heading at top ~355, as on the real pages)"""
+    canvas = PageCanvas()
+    code = f"GBSY{letters(n)}"
+    canvas.text(285, 805, "PRODUCT RANGE", 10)
+    canvas.text(40, 755, f"GreenBolt Synthetic Anchor {n} - {code}", 14)
+    for i, line in enumerate(["Material Carbon Steel", "Surface Zinc-Plated (min. 5 um)",
+                              "Corrosion Yes (for indoor dry conditions)", "Drilling Method Hammer Drilling"]):
+        canvas.text(370, 700 - i * 9, line, 7)
+    canvas.text(40, 540, f"GreenBolt Synthetic Anchor {n} is a mechanical anchor for fastening through pre-drilled holes.")
+    canvas.text(288, 479, "Installation Parameters", 11)
+
+    rows = [[f"{code}{d:02d}{l:03d}", f"M{d} x {l}", "100", str(d), str(l - 15), "10", str(l - 30), str(d * 5),
+             f"{d * 0.9:.2f}", f"{d * 0.7:.2f}"] for d in (6, 8, 10, 12) for l in (60, 80, 100)]
+    header = [["Product Code", "Size", "Pack Size", "Drill", "Depth", "Fixture", "eff. depth", "Torque",
+               "Tensile", "Shear"],
+              ["", "", "(pcs)", "[mm]", "[mm]", "[mm]", "[mm]", "[Nm]", "kN", "kN"]]
+    widths = [80, 54, 50, 50, 55, 55, 60, 55, 50, 50]
+    split = len(rows) - 3 if n % FALLBACK_EVERY == 0 else len(rows)
+    y = canvas.table(18, 474, widths, header, row_height=16)
+    y = canvas.table(18, y, widths, rows[:split])
+    canvas.table(18, y - 6, widths, rows[split:], ruled=False)
+    return canvas
+
+
+def strut_page(n):
+    canvas = PageCanvas()
+    identification = f"GM41{2100 + n}"
+    canvas.text(40, 800, f"Strut Profile {identification}", 14)
+    canvas.text(40, 770, "Type GM41 21 1.5")
+    canvas.text(40, 740, "Section properties", 11)
+    header = ["Identification", "Weight", "Length", "Area", "CD", "Iz", "Iy", "Wy", "Wz"]
+    row = [identification, "1.19", "00", "142", "8.06", str(30000 + n), "9456", "1738", "742"]
+    widths = [80, 50, 50, 50, 50, 60, 60, 60, 60]
+    canvas.table(30, 720, widths, [header, row], ruled=n % FALLBACK_EVERY != 0)
+    return canvas
+
+
+def write_synthetic_pdf(path, kind, pages):
+    page = {'anchors': anchor_page, 'strut': strut_page}[kind]
+    write_pdf(path, [page(n) for n in range(1, pages + 1)])
+    return path
+
+
+# ---- one case, run in its own process ----
+
+def quiet(func, *args):
+    """func(*args) with the extractor's progress output swallowed"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args)
+
+
+def run_anchor_case(pdf_path, pages):
+    import pdfplumber
+
+    import extract_all_anchors
+    from pdf_run_report import record_page
+
+    latencies, table_ms, fallback_pages, products = [], [], 0, 0
+    with pdfplumber.open(pdf_path) as pdf:
+        page_numbers = range(1, min(pages or len(pdf.pages), len(pdf.pages)) + 1)
+        for page_num in page_numbers:
+            # The extractor's own stage timings and counters, as in its run report
+            with record_page(page_num) as stats:
+                product = quiet(extract_all_anchors.extract_product_from_page, pdf, page_num)
+            latencies.append(stats.seconds)
+            pdf.pages[page_num - 1].close()
+            if not product:
+                continue
+            products += 1
+            table_ms.append((stats.stages['extract_tables'] + stats.stages['table_regex']) * 1000)
+            fallback_pages += stats.counters['variants_from_text'] > 0
+    return latencies, {'products': products, 'fallback_pages': fallback_pages,
+                       'table_data_ms': round(statistics.fmean(table_ms), 3) if table_ms else None}
+
+
+def run_strut_case(pdf_path, pages):
+    import pdfplumber
+
+    import extract_all_strut_data
+    from pdf_engine import extract_pages
+    from pdf_run_report import RunReport
+
+    with pdfplumber.open(pdf_path) as pdf:
+        page_count = min(pages or len(pdf.pages), len(pdf.pages))
+
+    # The path the CLI runs: one open PDF, every page through extract_product_data
+    report = RunReport('bench_extraction', pdf_path)
+    results = quiet(extract_pages, pdf_path, range(1, page_count + 1),
+                    extract_all_strut_data.extract_product_data, 1, None, report)
+    latencies = [stats.seconds for stats in report.pages]
+    # properties_from_text: the regex supplied the row because no table row had it
+    fallback_pages = sum(1 for stats in report.pages if stats.counters['properties_from_text'])
+    return latencies, {'products': sum(1 for properties in results if properties),
+                       'fallback_pages': fallback_pages}
+
+
+def run_case(case):
+    """Worker entry point: one case, timed, with this process's peak RSS"""
+    sys.path.insert(0, str(ROOT))
+    kind, pdf_path, pages = case['kind'], case['pdf'], case.get('pages')
+    started = time.perf_counter()
+    runner = run_anchor_case if kind == 'anchors' else run_strut_case
+    latencies, extra = runner(pdf_path, pages)
+    total = time.perf_counter() - started
+
+    ms = sorted(t * 1000 for t in latencies)
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        'pages': len(ms),
+        'seconds': round(total, 3),
+        'pages_per_sec': round(len(ms) / total, 3) if total else None,
+        'p50_ms': round(statistics.median(ms), 2) if ms else None,
+        'p95_ms': round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 2) if ms else None,
+        'max_ms': round(ms[-1], 2) if ms else None,
+        # ru_maxrss is KB on Linux, bytes on macOS
+        'peak_rss_mb': round(rss_kb / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1),
+        **extra,
+    }
+
+
+# ---- suite ----
+
+def plan_cases(root, sizes, anchor_pages, workdir):
+    cases = {}
+    anchors_pdf = root / ANCHORS_PDF
+    if anchors_pdf.exists():
+        # A partial run is a different workload, so it gets its own baseline entry
+        name = f"anchors-pdf-{anchor_pages}" if anchor_pages else 'anchors-pdf'
+        cases[name] = {'kind': 'anchors', 'pdf': str(anchors_pdf), 'pages': anchor_pages}
+    else:
+        print(f"⚠️  {ANCHORS_PDF} not found, skipping the real-catalogue case")
+    for kind in ('anchors', 'strut'):
+        for pages in sizes:
+            path = write_synthetic_pdf(Path(workdir) / f"{kind}-{pages}.pdf", kind, pages)
+            cases[f"synthetic-{kind}-{pages}"] = {'kind': kind, 'pdf': str(path), 'pages': pages}
+    return cases
+
+
+def compare(results, baseline, tolerance):
+    """Regression messages for metrics worse than baseline beyond tolerance"""
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if not expected:
+            continue
+        for metric, higher_is_better in CHECKED_METRICS.items():
+            if expected.get(metric) is None or result.get(metric) is None:
+                continue
+            if metric == 'p95_ms' and result['pages'] < MIN_PAGES_FOR_P95:
+                continue
+            allowed = RSS_TOLERANCE if metric == 'peak_rss_mb' else tolerance
+            ratio = result[metric] / expected[metric] if expected[metric] else 1
+            if (ratio < 1 - allowed) if higher_is_better else (ratio > 1 + allowed):
+                regressions.append(f"{name}: {metric} {result[metric]} vs baseline {expected[metric]} "
+                                   f"({(ratio - 1) * 100:+.0f}%)")
+    return regressions
+
+
+def print_results(results, baseline):
+    print(f"{'='*60}")
+    print(f"{'case':26} {'pages':>5} {'pg/s':>7} {'p50':>7} {'p95':>7} {'RSS MB':>7} {'fallback':>8}")
+    for name, r in results.items():
+        base = baseline.get(name, {}).get('pages_per_sec')
+        delta = f" ({(r['pages_per_sec'] / base - 1) * 100:+.0f}%)" if base else ''
+        print(f"{name:26} {r['pages']:>5} {r['pages_per_sec']:>7.2f} {r['p50_ms']:>7.1f} {r['p95_ms']:>7.1f} "
+              f"{r['peak_rss_mb']:>7.1f} {r['fallback_pages']:>8}{delta}")
+    print(f"{'='*60}")
+
+
+def run(root=ROOT, sizes=DEFAULT_SIZES, anchor_pages=None, tolerance=DEFAULT_TOLERANCE):
+    root = Path(root)
+    baseline_path = root / BASELINE
+    baseline = json.loads(baseline_path.read_text(encoding='utf-8'))['cases'] if baseline_path.exists() else {}
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, case in plan_cases(root, sizes, anchor_pages, workdir).items():
+            print(f"Running {name} ...")
+            # A fresh process per case: peak RSS and import costs are the case's own
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+                results[name] = executor.submit(run_case, case).result()
+
+    report = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cases': results,
+        'regressions': compare(results, baseline, tolerance),
+    }
+    print_results(results, baseline)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the PDF extractors against stored baselines")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help=f"synthetic PDF page counts (default: {' '.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument('--anchor-pages', type=int, default=None,
+                        help=f"only the first N pages of {ANCHORS_PDF} (default: all)")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f"allowed slowdown before failing, as a fraction (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument('--json', type=Path, help="write the full result document here")
+    parser.add_argument('--history', type=Path, default=Path(HISTORY),
+                        help=f"append each run as one JSON line (default: {HISTORY})")
+    parser.add_argument('--update-baseline', action='store_true', help=f"store these results as {BASELINE}")
+    args = parser.parse_args(argv)
+
+    report = run(sizes=args.sizes, anchor_pages=args.anchor_pages, tolerance=args.tolerance)
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+        print(f"OK results -> {args.json}")
+    history = ROOT / args.history
+    history.parent.mkdir(parents=True, exist_ok=True)
+    with open(history, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(report, separators=(',', ':')) + '\n')
+
+    if args.update_baseline:
+        baseline = {'timestamp': report['timestamp'], 'machine': report['machine'],
+                    'cases': {name: {metric: r[metric] for metric in CHECKED_METRICS}
+                              for name, r in report['cases'].items()}}
+        path = ROOT / BASELINE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(baseline, indent=2) + '\n', encoding='utf-8')
+        print(f"OK baseline -> {BASELINE}")
+        return
+
+    if report['regressions']:
+        for message in report['regressions']:
+            print(f"❌ {message}")
+        sys.exit(1)
+    print("OK no regressions against the baseline")
+
+
+if __name__ == '__main__':
+    main()
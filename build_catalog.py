@@ -0,0 +1,268 @@
+"""
+Single-pass catalog build pipeline
+Replaces the hand-ordered chain of fix_anchor_catalog.py, update_anchor_images.py
+and update_products_with_anchors.py. Every registered stage runs, in order,
+over one in-memory model: each JSON file is read at most once and written at
+most once (atomically), and --dry-run shows a diff instead of writing.
+load-tables rewrites published load tables, so it only runs when named in
+--stages.
+
+Usage:
+    python build_catalog.py                 # run the default stages and write
+    python build_catalog.py --dry-run       # show what would change
+    python build_catalog.py --stages images products
+    python build_catalog.py --stages load-tables --dry-run
+    python build_catalog.py --list
+"""
+
+import argparse
+import difflib
+import json
+import os
+import re
+from pathlib import Path
+
+from anchor_definitions import PRODUCT_DEFINITIONS, PRODUCT_NAMES
+from compact_json import dumps_compact, site_path
+from load_capacity import PROFILE_CATALOGS, recompute_tables
+
+ROOT = Path(__file__).resolve().parent
+ANCHOR_CATALOG = 'data/anchor-catalog.json'
+PRODUCTS_JSON = 'data/products.json'
+ANCHOR_PDF = 'Product-Catalogues-PDF/Anchors rev1.pdf'
+
+# Variant field -> technicalTable column in products.json
+ANCHOR_TABLE_COLUMNS = [
+    ('productCode', 'Product Code'),
+    ('size', 'Size'),
+    ('packSize', 'Pack Size (pcs)'),
+    ('drillDiameter', 'Drill Ø (mm)'),
+    ('drillHoleDepth', 'Drill Hole Depth (mm)'),
+    ('maxFixtureThickness', 'Max. Fixture Thickness (mm)'),
+    ('effAnchorageDepth', 'eff. Anchorage depth (mm)'),
+    ('installationTorque', 'Installation Torque (Nm)'),
+    ('tensileLoadKN', 'Tensile Load (kN)'),
+    ('shearLoadKN', 'Shear Load (kN)'),
+]
+
+
+def dump_json(data):
+    """Serialize exactly the way the catalogue files are stored in the repo"""
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+class CatalogModel:
+    """
+    In-memory view of the data files touched by a build
+    Files are loaded on first use and only written if a stage changed them.
+    """
+
+    def __init__(self, root=ROOT):
+        self.root = Path(root)
+        self._docs = {}
+        self._originals = {}
+        self.notes = []
+
+    def get(self, rel_path):
+        if rel_path not in self._docs:
+            with open(self.root / rel_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            self._originals[rel_path] = text
+            self._docs[rel_path] = json.loads(text)
+        return self._docs[rel_path]
+
+    def changed(self):
+        """(rel_path, old_text, new_text) for every file whose content differs"""
+        for rel_path, data in self._docs.items():
+            new_text = dump_json(data)
+            if new_text != self._originals[rel_path]:
+                yield rel_path, self._originals[rel_path], new_text
+
+    def diff(self):
+        lines = []
+        for rel_path, old_text, new_text in self.changed():
+            lines.extend(difflib.unified_diff(
+                old_text.splitlines(), new_text.splitlines(),
+                fromfile=f"a/{rel_path}", tofile=f"b/{rel_path}", lineterm=''))
+        return '\n'.join(lines)
+
+    def write(self):
+        """
+        Write each changed file once, via a temp file so readers never see half
+        a file, and refresh its compact site copy in data/min/
+        """
+        written = []
+        for rel_path, _, new_text in self.changed():
+            path = self.root / rel_path
+            compact_path = site_path(rel_path, self.root)
+            for target, text in ((path, new_text), (compact_path, dumps_compact(self._docs[rel_path]))):
+                tmp_path = target.with_name(f".{target.name}.tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                os.replace(tmp_path, target)
+            self._originals[rel_path] = new_text
+            written.append(rel_path)
+        return written
+
+    def note(self, message):
+        self.notes.append(message)
+        print(f"  {message}")
+
+
+# Registered stages, run in registration order
+STAGES = []
+# Stages left out of a run unless named in --stages
+OPT_IN = set()
+
+
+def stage(name, description, default=True):
+    """Register a build stage: func(model) mutates the model in place"""
+    def register(func):
+        STAGES.append((name, description, func))
+        if not default:
+            OPT_IN.add(name)
+        return func
+    return register
+
+
+def base_code(code):
+    """GBGTA06070 -> GBGTA"""
+    return re.sub(r'\d.*$', '', code or '')
+
+
+def camel_to_snake(key):
+    return re.sub(r'(?<!^)([A-Z])', r'_\1', key).lower()
+
+
+@stage('enrich', "fill missing anchor names and definitions from anchor_definitions.py")
+def enrich_anchor_names(model):
+    for product in model.get(ANCHOR_CATALOG)['products']:
+        code = base_code(product['productCode'])
+
+        # Extracted names win; the fallback table only covers gaps
+        if not product.get('name') and code in PRODUCT_NAMES:
+            product['name'] = PRODUCT_NAMES[code]
+            model.note(f"{code}: name <- {PRODUCT_NAMES[code]}")
+
+        if len(product.get('description') or '') < 50 and code in PRODUCT_DEFINITIONS:
+            product['description'] = PRODUCT_DEFINITIONS[code]
+            model.note(f"{code}: description <- fallback definition")
+
+
+@stage('images', "point anchor images at the files that exist under assets/Anchors")
+def resolve_anchor_images(model):
+    # One listing per folder instead of an exists() call per product
+    available = {
+        folder: {p.name for p in (model.root / 'assets/Anchors' / folder).glob('*.png')}
+        for folder in ('3d', 'Drawing')
+    }
+
+    for product in model.get(ANCHOR_CATALOG)['products']:
+        code = base_code(product['productCode'])
+        filename = f"{code}.png"
+        if filename in available['3d'] and filename in available['Drawing']:
+            product['images'] = {
+                '3d': f"assets/Anchors/3d/{filename}",
+                'drawing': f"assets/Anchors/Drawing/{filename}",
+            }
+        else:
+            model.note(f"Warning: Images not found for {code}")
+
+
+@stage('products', "regroup anchor families into the metal-anchors category of products.json")
+def group_anchor_products(model):
+    anchors = model.get(ANCHOR_CATALOG)['products']
+    products_data = model.get(PRODUCTS_JSON)
+
+    entries = []
+    for product in anchors:
+        code = base_code(product['productCode'])
+        name = product.get('name') or PRODUCT_NAMES.get(code, code)
+        images = product.get('images') or {}
+
+        technical_table = []
+        for idx, variant in enumerate(product.get('variants', []), 1):
+            row = {'Sr#': str(idx)}
+            for field, column in ANCHOR_TABLE_COLUMNS:
+                row[column] = variant.get(field)
+            technical_table.append(row)
+
+        entries.append({
+            'id': f"anchor-{code.lower()}",
+            'title': name,
+            'subtitle': code,
+            'description': f"{name} provides reliable anchoring solutions for concrete and masonry applications.",
+            'images': [path for path in (images.get('3d'), images.get('drawing')) if path],
+            'specifications': {camel_to_snake(k): v for k, v in product.get('specifications', {}).items()},
+            'technicalData': {},
+            'technicalTable': technical_table,
+        })
+
+    category = next((c for c in products_data['categories'] if c['id'] in ('anchors', 'metal-anchors')), None)
+    if category is None:
+        category = {}
+        products_data['categories'].append(category)
+
+    category.update({
+        'id': 'metal-anchors',
+        'name': 'Metal Anchors',
+        'badge': 'Anchors Collection',
+        'catalogPdf': ANCHOR_PDF,
+        'products': entries,
+    })
+    model.note(f"{len(entries)} anchor product types, "
+               f"{sum(len(e['technicalTable']) for e in entries)} variants")
+
+
+@stage('load-tables', "recompute strut and C-channel load tables from section properties (load_capacity.py)",
+       default=False)
+def regenerate_load_tables(model):
+    for rel_path, settings in PROFILE_CATALOGS.items():
+        products = model.get(rel_path)['category']['products']
+        updated, skipped = recompute_tables(products, settings)
+        model.note(f"{rel_path}: recomputed {len(updated)} load tables")
+        for product_id, reason in skipped.items():
+            model.note(f"{product_id}: kept published table ({reason})")
+
+
+def run(stage_names=None, dry_run=False, root=ROOT):
+    """Run the selected stages (default: all but the opt-in ones) and write or diff the result"""
+    model = CatalogModel(root)
+    if stage_names is None:
+        stage_names = [name for name, _, _ in STAGES if name not in OPT_IN]
+    selected = [s for s in STAGES if s[0] in stage_names]
+
+    for name, description, func in selected:
+        print(f"▶ {name}: {description}")
+        func(model)
+
+    if dry_run:
+        diff = model.diff()
+        print(diff if diff else "No changes.")
+        return model
+
+    written = model.write()
+    print(f"{'='*60}")
+    print(f"Wrote {len(written)} file(s): {', '.join(written) if written else 'nothing changed'}")
+    print(f"{'='*60}")
+    return model
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the catalog build stages over data/*.json")
+    parser.add_argument('--stages', nargs='+', choices=[s[0] for s in STAGES],
+                        help="only run these stages (still in pipeline order)")
+    parser.add_argument('--dry-run', action='store_true', help="print a unified diff instead of writing")
+    parser.add_argument('--list', action='store_true', help="list the registered stages")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, description, _ in STAGES:
+            print(f"{name:12} {description}{' (opt-in)' if name in OPT_IN else ''}")
+        return
+
+    run(args.stages, dry_run=args.dry_run)
+
+
+if __name__ == '__main__':
+    main()
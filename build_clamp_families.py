@@ -0,0 +1,82 @@
+"""
+Split the GreenGrip clamp catalogue into per-family files
+data/greengrip-ggip-catalog.json holds ~35 product families (ggcp, gght, ...)
+plus the GGIP family itself at the top level. The catalogue page only ever
+shows one family, so this writes:
+  data/ggip/<family>.json     one family, in compact column format
+  data/ggip/manifest.json     family -> file, name, image, row count
+js/catalog-families.js reads the manifest and fetches families on demand.
+
+Usage:
+    python build_clamp_families.py
+"""
+
+from pathlib import Path
+
+import catalog_model
+from compact_json import dumps_compact
+
+ROOT = Path(__file__).resolve().parent
+MANIFEST_VERSION = 1
+
+# (source catalogue, output folder, key for the top-level family)
+CATALOGS = [
+    ('data/greengrip-ggip-catalog.json', 'data/ggip', 'ggip'),
+]
+
+
+def is_family(value):
+    return isinstance(value, dict) and 'products' in value
+
+
+def split_families(catalogue, root_key):
+    """Return {family_key: family_data}; top-level fields form the root family"""
+    families = {root_key: {k: v for k, v in catalogue.to_json().items() if not is_family(v)}}
+    for family in catalogue:
+        if family.key is not None:
+            families[family.key] = family.to_json()
+    return families
+
+
+def write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(dumps_compact(data))
+
+
+def build_catalog(source, output_dir, root_key):
+    output_dir.mkdir(parents=True, exist_ok=True)
+    families = split_families(catalog_model.load(source), root_key)
+    manifest = {'version': MANIFEST_VERSION, 'default': root_key, 'families': {}}
+
+    for key, family in families.items():
+        filename = f"{key}.json"
+        write_json(output_dir / filename, family)
+        manifest['families'][key] = {
+            'file': filename,
+            'productName': family.get('productName', key.upper()),
+            'image': family.get('image', ''),
+            'rows': len(family.get('products', [])),
+            'bytes': (output_dir / filename).stat().st_size,
+        }
+
+    write_json(output_dir / 'manifest.json', manifest)
+
+    # Drop families that were removed from the source
+    keep = {entry['file'] for entry in manifest['families'].values()} | {'manifest.json'}
+    for path in output_dir.glob('*.json'):
+        if path.name not in keep:
+            path.unlink()
+
+    largest = max(entry['bytes'] for entry in manifest['families'].values())
+    print(f"OK {source.name}: {len(families)} families -> {output_dir.name}/ "
+          f"(largest {largest / 1024:.1f} KB vs {source.stat().st_size / 1024:.0f} KB whole)")
+    return manifest
+
+
+def build(root=ROOT):
+    root = Path(root)
+    return [build_catalog(root / source, root / output, root_key) for source, output, root_key in CATALOGS]
+
+
+if __name__ == '__main__':
+    build()
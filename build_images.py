@@ -0,0 +1,253 @@
+"""
+Build responsive image derivatives
+Every PNG/JPEG under assets/ gets resized copies at a few widths in AVIF and
+WebP, written to assets/derived/<content hash>-<width>.<format>. Files are
+named by content, so identical images share one set and a changed image gets
+new URLs that can be cached forever.
+
+data/images.json maps each source path (exactly as the catalogue JSON image
+fields and templates reference it) to its derivatives, intrinsic size and a
+placeholder - the average colour and a 16px-wide blurred WebP (base64):
+    {"assets/CLAMPS/GGCP.png": ["3fa9c2...", 2400, 1800, [320, 640, 1280], "#c8ccd0", "UklGR..."]}
+js/responsive-images.js turns that into <picture> srcset markup with
+width/height set (no layout shift) and the placeholder painted underneath
+until the real image arrives.
+
+Sources whose hash matches the manifest (and whose files exist) are skipped,
+the rest are encoded by a process pool. Hashes come from asset_manifest.py's
+scan, which only re-reads files whose size or mtime changed.
+
+Usage:
+    python build_images.py
+    python build_images.py --workers 4 --force
+"""
+
+import argparse
+import base64
+import hashlib
+import html
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageFilter
+
+import asset_manifest
+
+ROOT = Path(__file__).resolve().parent
+SOURCE_DIR = 'assets'
+OUTPUT_DIR = 'assets/derived'
+MANIFEST = 'data/images.json'
+MANIFEST_VERSION = 2
+
+SOURCE_SUFFIXES = {'.png', '.jpg', '.jpeg'}
+WIDTHS = (320, 640, 1280)
+HASH_LENGTH = 16
+PLACEHOLDER_WIDTH = 16
+
+# Format -> Pillow save options; listed in order of preference for <source>
+FORMATS = {
+    'avif': {'quality': 55, 'speed': 6},
+    'webp': {'quality': 80, 'method': 6},
+}
+
+
+def content_hash(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()[:HASH_LENGTH]
+
+
+def target_widths(width):
+    """Widths to produce for a source this wide - never upscale"""
+    widths = [w for w in WIDTHS if w < width]
+    if width <= WIDTHS[-1]:
+        widths.append(width)
+    return widths
+
+
+def derived_name(digest, width, fmt):
+    return f"{digest}-{width}.{fmt}"
+
+
+def open_source(source):
+    image = Image.open(source)
+    image.load()
+    has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+    return image.convert('RGBA' if has_alpha else 'RGB')
+
+
+def placeholder(image):
+    """(average colour as #rrggbb, tiny blurred WebP as base64) for an RGB/RGBA image"""
+    width, height = image.size
+    small = image.resize((PLACEHOLDER_WIDTH, max(1, round(height * PLACEHOLDER_WIDTH / width))), Image.BOX)
+    small = small.filter(ImageFilter.GaussianBlur(1))
+
+    # Average over a white page, which is what transparent product shots sit on
+    flat = Image.new('RGB', image.size, 'white')
+    flat.paste(image, mask=image.getchannel('A') if image.mode == 'RGBA' else None)
+    r, g, b = flat.resize((1, 1), Image.BOX).getpixel((0, 0))
+
+    buffer = io.BytesIO()
+    small.save(buffer, format='WEBP', quality=30, method=6)
+    return f"#{r:02x}{g:02x}{b:02x}", base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def render(source, output_dir, digest):
+    """Encode one source at every width and format (runs in a worker process)"""
+    with open_source(source) as image:
+        width, height = image.size
+        widths = target_widths(width)
+        for w in widths:
+            resized = image if w == width else image.resize((w, round(height * w / width)), Image.LANCZOS)
+            for fmt, options in FORMATS.items():
+                resized.save(Path(output_dir) / derived_name(digest, w, fmt), format=fmt.upper(), **options)
+        color, lqip = placeholder(image)
+    return width, height, widths, color, lqip
+
+
+def _render_job(job):
+    rel_path, source, output_dir, digest = job
+    try:
+        return rel_path, digest, render(source, output_dir, digest), None
+    except Exception as error:
+        return rel_path, digest, None, str(error)
+
+
+def load_manifest(root=ROOT):
+    path = Path(root) / MANIFEST
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def picture(manifest, src, alt='', sizes='100vw', attrs=''):
+    """
+    Static twin of ResponsiveImages.picture() in js/responsive-images.js
+    <picture> with AVIF/WebP srcsets, width/height and the placeholder for
+    images in the manifest; a plain lazy <img> for anything else.
+    """
+    img = f'<img src="{html.escape(src or "")}" alt="{html.escape(alt)}"'
+    entry = (manifest or {}).get('images', {}).get(src)
+    if not entry:
+        return img + ' loading="lazy" decoding="async"' + (f' {attrs}' if attrs else '') + '>'
+
+    digest, width, height, widths = entry[:4]
+    if len(entry) >= 6:
+        color, lqip = entry[4], entry[5]
+        attrs = (f'{attrs} ' if attrs else '') + (
+            f'style="background:{color} url(data:image/webp;base64,{lqip}) center/contain no-repeat" '
+            "onload=\"this.style.background=''\"")
+    sources = ''.join(
+        f'<source type="image/{fmt}" srcset="'
+        + ', '.join(f"{manifest['dir']}{derived_name(digest, w, fmt)} {w}w" for w in widths)
+        + f'" sizes="{sizes}">'
+        for fmt in manifest['formats']
+    )
+    return (f'<picture>{sources}{img} width="{width}" height="{height}" loading="lazy" decoding="async"'
+            + (f' {attrs}' if attrs else '') + '></picture>')
+
+
+def find_sources(root):
+    source_dir, output_dir = root / SOURCE_DIR, root / OUTPUT_DIR
+    for path in sorted(source_dir.rglob('*')):
+        if path.is_file() and path.suffix.lower() in SOURCE_SUFFIXES and output_dir not in path.parents:
+            yield path.relative_to(root).as_posix(), path
+
+
+def is_encoded(entry, digest, output_dir):
+    """Derivatives for this content already exist (placeholder may still be missing)"""
+    if not entry or entry[0] != digest:
+        return False
+    return all((output_dir / derived_name(digest, w, fmt)).exists() for w in entry[3] for fmt in FORMATS)
+
+
+def build(root=ROOT, workers=None, force=False):
+    root = Path(root)
+    output_dir = root / OUTPUT_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = root / MANIFEST
+
+    previous = {}
+    if not force:
+        previous = (load_manifest(root) or {}).get('images', {})
+
+    assets = asset_manifest.build(root)
+    images, jobs, queued = {}, [], set()
+    for rel_path, source in find_sources(root):
+        digest = assets[rel_path][2] if rel_path in assets else content_hash(source)
+        entry = previous.get(rel_path)
+        if is_encoded(entry, digest, output_dir):
+            if len(entry) < 6:
+                # Manifest from before placeholders: add them without re-encoding
+                with open_source(source) as image:
+                    entry = entry[:4] + list(placeholder(image))
+            images[rel_path] = entry
+        elif digest in queued:
+            images[rel_path] = digest  # same content as a queued job, filled in below
+        else:
+            queued.add(digest)
+            jobs.append((rel_path, str(source), str(output_dir), digest))
+
+    print(f"{len(jobs)} image(s) to encode, {len(images)} unchanged")
+    results = {}
+    failed = []
+    if jobs:
+        workers = workers or max(1, min(os.cpu_count() or 1, len(jobs)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for rel_path, digest, result, error in executor.map(_render_job, jobs):
+                if error:
+                    failed.append(rel_path)
+                    print(f"❌ {rel_path}: {error}")
+                    continue
+                width, height, widths, color, lqip = result
+                results[digest] = [digest, width, height, widths, color, lqip]
+                images[rel_path] = results[digest]
+                print(f"OK {rel_path} -> {', '.join(map(str, widths))} px")
+
+    # Duplicates of an image encoded in this run
+    for rel_path, entry in list(images.items()):
+        if isinstance(entry, str):
+            if entry in results:
+                images[rel_path] = results[entry]
+            else:
+                del images[rel_path]
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'dir': OUTPUT_DIR + '/',
+        'formats': list(FORMATS),
+        'images': dict(sorted(images.items())),
+    }
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+
+    # Drop derivatives no source points at any more
+    keep = {derived_name(e[0], w, fmt) for e in images.values() for w in e[3] for fmt in FORMATS}
+    removed = 0
+    for path in output_dir.iterdir():
+        if path.name not in keep:
+            path.unlink()
+            removed += 1
+
+    source_bytes = sum((root / rel_path).stat().st_size for rel_path in images)
+    derived_bytes = sum((output_dir / name).stat().st_size for name in keep)
+    print(f"{'='*60}")
+    print(f"{len(images)} images: {source_bytes / 2**20:.1f} MB of sources -> "
+          f"{derived_bytes / 2**20:.1f} MB of derivatives in {OUTPUT_DIR}/ "
+          f"({len(failed)} failed, {removed} stale removed)")
+    print(f"{'='*60}")
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build AVIF/WebP derivatives of assets/ images")
+    parser.add_argument('--workers', type=int, help="encoder processes (default: one per core)")
+    parser.add_argument('--force', action='store_true', help="re-encode everything")
+    args = parser.parse_args(argv)
+    build(workers=args.workers, force=args.force)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""
+Inline the navbar and footer partials into every page
+Pages used to fetch navbar.html and footer.html after load and inject them,
+costing two round-trips and a visible header pop-in on every navigation.
+This writes the partials straight into each page's placeholder instead:
+
+    <div id="navbar-placeholder"><!-- partial:navbar.html -->...<!-- /partial:navbar.html --></div>
+
+Re-running replaces whatever is between the markers, so edit navbar.html /
+footer.html and run this again (then build_precache.py, since index.html
+is precached by the service worker). It also keeps the includes tidy: exactly one
+navbar.css link in <head>, no navbar.js tag outside the inlined navbar (which
+brings its own), and js/partials.js, which fills any placeholder still empty
+(a new page in local dev) at runtime.
+
+Usage:
+    python build_partials.py
+    python build_partials.py --check        # exit 1 if any page is stale
+    python build_partials.py about.html index.html
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+# placeholder name -> partial; the div id is <name>-placeholder or <name>-container
+PARTIALS = {
+    'navbar': 'navbar.html',
+    'footer': 'footer.html',
+}
+
+# Files that are partials or scratch pages rather than site pages
+SKIP = {'navbar.html', 'footer.html', 'navbarold.html', 'test-mobile-menu.html'}
+
+NAVBAR_CSS = '<link rel="stylesheet" href="navbar.css">'
+FALLBACK_SCRIPT = '<script src="js/partials.js" defer></script>'
+
+NAVBAR_CSS_RE = re.compile(r'[ \t]*<link rel="stylesheet" href="/?navbar\.css">[ \t]*\n?')
+NAVBAR_JS_RE = re.compile(r'[ \t]*<script src="/?navbar\.js"( defer)?></script>[ \t]*\n?')
+RUNTIME_LOADER_RE = re.compile(r"fetch\(['\"]/?(navbar|footer)\.html['\"]\)")
+
+
+def placeholder_re(name, partial):
+    start, end = re.escape(f"<!-- partial:{partial} -->"), re.escape(f"<!-- /partial:{partial} -->")
+    return re.compile(
+        rf'(<div id="{name}-(?:placeholder|container)"[^>]*>)\s*(?:{start}.*?{end}\s*)?(</div>)',
+        re.DOTALL,
+    )
+
+
+def outside(html, pattern, blocks):
+    """Matches of pattern that are not inside any of the (start, end) blocks"""
+    return [m for m in pattern.finditer(html) if not any(s <= m.start() < e for s, e in blocks)]
+
+
+def inline_page(html, partials):
+    """Page HTML with partials inlined and includes de-duplicated; also returns warnings"""
+    warnings = []
+    inlined = set()
+    for name, (partial, content) in partials.items():
+        block = f"<!-- partial:{partial} -->\n{content.strip()}\n<!-- /partial:{partial} -->"
+        html, count = placeholder_re(name, partial).subn(
+            lambda m: m.group(1) + block + m.group(2), html)
+        if count:
+            inlined.add(name)
+        if count > 1:
+            warnings.append(f"{count} {name} placeholders")
+    if not inlined:
+        return html, warnings
+
+    blocks = [(m.start(), m.end()) for name, (partial, _) in partials.items()
+              for m in re.finditer(rf"<!-- partial:{re.escape(partial)} -->.*?<!-- /partial:{re.escape(partial)} -->",
+                                   html, re.DOTALL)]
+
+    # navbar.js comes with the inlined navbar; page-level copies would run it twice
+    if 'navbar' in inlined:
+        for m in reversed(outside(html, NAVBAR_JS_RE, blocks)):
+            html = html[:m.start()] + html[m.end():]
+
+    # Exactly one navbar.css, in <head>
+    head_end = html.find('</head>')
+    links = list(NAVBAR_CSS_RE.finditer(html[:head_end]))
+    for m in reversed(links[1:]):
+        html = html[:m.start()] + html[m.end():]
+    if 'navbar' in inlined and not links:
+        styles = re.search(r'([ \t]*)<link rel="stylesheet" href="/?styles\.css">[ \t]*\n', html[:head_end])
+        if styles:
+            html = html[:styles.end()] + f"{styles.group(1)}{NAVBAR_CSS}\n" + html[styles.end():]
+        else:
+            html = html.replace('</head>', f"    {NAVBAR_CSS}\n</head>", 1)
+
+    # Runtime fallback for placeholders the build has not filled
+    if FALLBACK_SCRIPT not in html:
+        link = NAVBAR_CSS_RE.search(html[:html.find('</head>')])
+        indent = re.match(r'[ \t]*', link.group(0)).group(0) if link else '    '
+        at = link.end() if link else html.find('</head>')
+        html = html[:at] + f"{indent}{FALLBACK_SCRIPT}\n" + html[at:]
+
+    if RUNTIME_LOADER_RE.search(html):
+        warnings.append("still fetches a partial at runtime - remove the page's own loader")
+    return html, warnings
+
+
+def pages(root, names=None):
+    if names:
+        return [root / name for name in names]
+    return [path for path in sorted(root.glob('*.html')) if path.name not in SKIP]
+
+
+def build(names=None, check=False, root=ROOT):
+    root = Path(root)
+    partials = {name: (partial, (root / partial).read_text(encoding='utf-8'))
+                for name, partial in PARTIALS.items()}
+
+    changed = []
+    for path in pages(root, names):
+        html = path.read_text(encoding='utf-8')
+        updated, warnings = inline_page(html, partials)
+        for warning in warnings:
+            print(f"⚠️  {path.name}: {warning}")
+        if updated != html:
+            changed.append(path.name)
+            if not check:
+                path.write_text(updated, encoding='utf-8')
+
+    verb = 'stale' if check else 'updated'
+    print(f"{'='*60}")
+    print(f"{len(changed)} page(s) {verb}" + (f": {', '.join(changed)}" if changed and check else ''))
+    print(f"{'='*60}")
+    return changed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inline navbar.html and footer.html into the site pages")
+    parser.add_argument('pages', nargs='*', help="pages to process (default: every *.html page)")
+    parser.add_argument('--check', action='store_true', help="only report pages that are out of date")
+    args = parser.parse_args(argv)
+
+    changed = build(args.pages, check=args.check)
+    if args.check and changed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Build the service worker precache manifest
+Hashes the site shell (PRECACHE files) and writes the result into the
+generated block at the top of sw.js:
+    const PRECACHE_MANIFEST = {"version": "9c1e...", "files": [["/index.html", "3fa9c2..."], ...]};
+
+The service worker keys each precached file by its hash, so a deploy only
+re-fetches files whose content changed. Because the manifest lives inside
+sw.js, any change to a precached file also changes sw.js and the browser
+installs the new worker.
+
+Run after editing any PRECACHE file (--check exits 1 if sw.js is stale).
+
+Usage:
+    python build_precache.py
+    python build_precache.py --check
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+SERVICE_WORKER = 'sw.js'
+HASH_LENGTH = 16
+
+# Site shell, precached on install. URL '/' is served from index.html.
+PRECACHE = [
+    'index.html',
+    'navbar.css',
+    'styles.css',
+    'tailwind.min.css',
+    'navbar.js',
+    'assets/favicon.svg',
+    'js/catalog-worker.js',
+    'js/ggip-table-rows.js',
+    'js/partials.js',
+    'js/product-renderer.js',
+    'js/responsive-images.js',
+    'js/table-utils.js',
+    'js/table-window.js',
+]
+
+BLOCK_RE = re.compile(
+    r'(// <precache-manifest>[^\n]*\n).*?(\n// </precache-manifest>)',
+    re.DOTALL,
+)
+
+
+def content_hash(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()[:HASH_LENGTH]
+
+
+def build_manifest(root=ROOT):
+    root = Path(root)
+    files = [['/' + rel_path, content_hash(root / rel_path)] for rel_path in PRECACHE]
+    version = hashlib.sha256(json.dumps(files).encode('utf-8')).hexdigest()[:HASH_LENGTH]
+    return {'version': version, 'files': files}
+
+
+def render(source, manifest):
+    """sw.js source with its generated block replaced"""
+    if not BLOCK_RE.search(source):
+        raise ValueError(f"{SERVICE_WORKER} has no // <precache-manifest> block")
+    line = f"const PRECACHE_MANIFEST = {json.dumps(manifest, separators=(',', ':'))};"
+    return BLOCK_RE.sub(lambda m: m.group(1) + line + m.group(2), source, count=1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=f"Write the precache manifest into {SERVICE_WORKER}")
+    parser.add_argument('--check', action='store_true', help=f"only report whether {SERVICE_WORKER} is up to date")
+    args = parser.parse_args(argv)
+
+    path = ROOT / SERVICE_WORKER
+    source = path.read_text(encoding='utf-8')
+    manifest = build_manifest()
+    updated = render(source, manifest)
+
+    if updated == source:
+        print(f"OK {SERVICE_WORKER} is up to date (precache {manifest['version']}, {len(manifest['files'])} files)")
+        return
+    if args.check:
+        print(f"❌ {SERVICE_WORKER} is stale - run python build_precache.py")
+        sys.exit(1)
+    path.write_text(updated, encoding='utf-8')
+    print(f"OK {SERVICE_WORKER}: precache {manifest['version']}, {len(manifest['files'])} files")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""
+Build the product index and per-product JSON shards
+Detail pages used to download a whole catalogue (3,000+ lines) to show one
+product. This writes:
+  data/products/<slug>.json          one product plus its category header
+  data/products/listing-<cat>.json   id/title/images for a category grid
+  data/products/index.json           id -> category, category -> listing
+Shard names are derived from the product id (see shard_name), so a client
+that already knows the id can fetch its shard directly without the index.
+Files use the compact column format from compact_json.py.
+
+Usage:
+    python build_product_index.py
+"""
+
+import re
+from pathlib import Path
+
+import catalog_model
+from compact_json import dumps_compact
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = 'data/products'
+INDEX_VERSION = 1
+
+# Dedicated catalogues come first: on an id or listing clash the earlier source wins
+SOURCES = [
+    'data/strut-channel-catalog.json',
+    'data/c-channel-catalog.json',
+    'data/anchor-catalog.json',
+    'data/products.json',
+]
+
+CATEGORY_FIELDS = ('id', 'name', 'badge', 'description', 'catalogPdf')
+
+
+def shard_name(product_id):
+    """Stable, URL-safe file name for a product id (mirrored in js/product-index.js)"""
+    return re.sub(r'[^a-z0-9_-]+', '-', product_id.lower()) + '.json'
+
+
+def category_header(category):
+    return {key: category[key] for key in CATEGORY_FIELDS if key in category}
+
+
+def read_source(catalogue):
+    """Yield (category_header, [(product_id, product), ...]) for one catalog_model.Catalogue"""
+    if catalogue.shape == 'profiles':
+        category = catalogue.data['category']
+        yield category_header(category), [(family.fields['id'], family.to_json()) for family in catalogue]
+
+    elif catalogue.shape == 'products':
+        # Families are flat in the model; the category headers live in the file
+        for category in catalogue.data['categories']:
+            yield category_header(category), [(p['id'], p) for p in category['products']]
+
+    elif catalogue.shape == 'anchors':
+        # anchor-template.html looks families up by ?code=GBGTA
+        header = {'id': 'metal-anchors', 'name': 'Metal Anchors', 'badge': 'Anchors Collection'}
+        yield header, [(family.code, family.to_json()) for family in catalogue]
+
+    else:
+        raise ValueError(f"{catalogue.name}: no product shards for {catalogue.shape} catalogues")
+
+
+def listing_item(product_id, product):
+    """Just enough of a product to draw a grid card"""
+    images = product.get('images')
+    if isinstance(images, dict):
+        images = list(images.values())
+    return {
+        'id': product_id,
+        'title': product.get('title') or product.get('name') or product_id,
+        'images': (images or [])[:2],
+    }
+
+
+def write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(dumps_compact(data))
+
+
+def build(root=ROOT):
+    root = Path(root)
+    output_dir = root / OUTPUT_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # products maps id -> position in categories, keeping the index a few KB
+    index = {'version': INDEX_VERSION, 'categories': [], 'listings': {}, 'products': {}}
+    shard_owner = {}
+    written = set()
+
+    for rel_path in SOURCES:
+        source = root / rel_path
+        if not source.exists():
+            print(f"⚠️  Skipping missing source: {rel_path}")
+            continue
+
+        for header, products in read_source(catalog_model.load(source)):
+            if header['id'] not in index['categories']:
+                index['categories'].append(header['id'])
+            category_pos = index['categories'].index(header['id'])
+            items = []
+            for product_id, product in products:
+                if product_id in index['products']:
+                    continue
+
+                name = shard_name(product_id)
+                if name in shard_owner:
+                    raise ValueError(f"Shard name clash: {product_id!r} and {shard_owner[name]!r} -> {name}")
+                shard_owner[name] = product_id
+
+                write_json(output_dir / name, {'category': header, 'product': product, 'source': rel_path})
+                written.add(name)
+                index['products'][product_id] = category_pos
+                items.append(listing_item(product_id, product))
+
+            if items and header['id'] not in index['listings']:
+                listing_name = f"listing-{shard_name(header['id'])}"
+                write_json(output_dir / listing_name, {'category': dict(header, products=items)})
+                written.add(listing_name)
+                index['listings'][header['id']] = listing_name
+
+        print(f"OK {rel_path}")
+
+    write_json(output_dir / 'index.json', index)
+    written.add('index.json')
+
+    # Drop shards for products that no longer exist
+    removed = 0
+    for path in output_dir.glob('*.json'):
+        if path.name not in written:
+            path.unlink()
+            removed += 1
+
+    total_bytes = sum((output_dir / name).stat().st_size for name in written)
+    print(f"{'='*60}")
+    print(f"Wrote {len(index['products'])} product shards, {len(index['listings'])} listings "
+          f"({total_bytes / 1024:.0f} KB) to {OUTPUT_DIR}/, removed {removed} stale")
+    print(f"{'='*60}")
+    return index
+
+
+if __name__ == '__main__':
+    build()
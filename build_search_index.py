@@ -0,0 +1,241 @@
+"""
+Build the client-side search index over every catalogue
+Walks data/*.json and turns each catalogue row into a search document
+(product code, name, size or clamping range, page URL), then writes a token
+prefix index to data/search/index.json for js/catalog-search.js:
+  terms      sorted vocabulary, so the browser can binary-search a prefix
+  postings   doc ids per term, delta-encoded
+  docs       [code, name id, size, page id, range min, range max]
+The file holds only arrays of arrays, so it is plain minified JSON.
+Codes are also split at letter/digit boundaries (GBGTA06110 -> gbgta, 06110)
+so a search can start anywhere in a code.
+
+Each catalogue's documents are cached in .cache/search/ under a hash of the
+file, so a rebuild only re-reads the catalogues that changed.
+
+Usage:
+    python build_search_index.py
+    python build_search_index.py --force    # ignore the cache
+"""
+
+import argparse
+import hashlib
+import json
+import re
+from pathlib import Path
+
+import catalog_model
+
+ROOT = Path(__file__).resolve().parent
+DATA_DIR = 'data'
+OUTPUT = 'data/search/index.json'
+DEFAULT_CACHE_DIR = Path('.cache/search')
+INDEX_VERSION = 2
+
+# Same rules as CatalogSearch.tokenize in js/catalog-search.js
+TOKEN_RE = re.compile(r'[a-z0-9]+(?:\.[0-9]+)?')
+PART_RE = re.compile(r'[a-z]+|[0-9]+(?:\.[0-9]+)?')
+RANGE_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*(?:-\s*(\d+(?:\.\d+)?))?\s*$')
+CLAMP_MM_KEYS = ('mm', 'Ømm', 'D(mm)')
+
+
+def tokenize(text):
+    """Lowercase word tokens plus their letter/digit parts (single letters dropped)"""
+    tokens = []
+    for token in TOKEN_RE.findall(str(text).lower()):
+        tokens.append(token)
+        parts = PART_RE.findall(token)
+        if len(parts) > 1:
+            tokens.extend(part for part in parts if len(part) > 1 or part.isdigit())
+    return tokens
+
+
+def doc(code, name, size, url, clamping=None):
+    """
+    A search document; clamping is a {'mm': '10-14', ...} dict where present.
+    A size given in the same dict form (GGSM, GGUB, ...) is shown as text and
+    gives the range when there is no clamping range.
+    """
+    if isinstance(size, dict):
+        clamping = clamping if isinstance(clamping, dict) else size
+        size = clamping_text(size)
+    low = high = None
+    if isinstance(clamping, dict):
+        for key in CLAMP_MM_KEYS:
+            match = RANGE_RE.match(str(clamping.get(key, '')))
+            if match:
+                low = float(match.group(1))
+                high = float(match.group(2) or match.group(1))
+                break
+    return {'code': code or '', 'name': name or '', 'size': size or '', 'url': url,
+            'low': low, 'high': high}
+
+
+def clamping_text(clamping):
+    if not isinstance(clamping, dict):
+        return ''
+    return ', '.join(f"{key} {value}" for key, value in clamping.items() if value not in ('', '-'))
+
+
+def read_anchors(catalogue):
+    for family in catalogue:
+        url = f"anchor-template.html?code={family.code}"
+        yield doc(family.code, family.name, '', url)
+        for variant in family.variants:
+            yield doc(variant.code, family.name, variant.get('size'), url)
+
+
+PROFILE_TEMPLATES = {
+    'strut-channel-catalog': 'strut-template.html',
+    'c-channel-catalog': 'c-channel-template.html',
+}
+
+
+def read_profiles(catalogue):
+    template = PROFILE_TEMPLATES[catalogue.name]
+    for family in catalogue:
+        properties = family.fields.get('properties', {})
+        yield doc(family.code, family.name, properties.get('size'),
+                  f"{template}?id={family.fields['id']}")
+
+
+def read_clamp_families(catalogue):
+    # The top-level GGIP family has no key and links to the bare page
+    page = f"{catalogue.name}.html"
+    for family in catalogue:
+        url = f"{page}?product={family.key}" if family.key else page
+        for variant in family.variants:
+            clamping = variant.get('clampingRange')
+            yield doc(variant.code, family.name, variant.get('size') or clamping_text(clamping), url, clamping)
+
+
+def read_fasteners(catalogue):
+    for family in catalogue:
+        url = f"{family.key}-catalog.html"
+        yield doc(family.code, family.name, '', url)
+        for variant in family.variants:
+            yield doc(variant.code, family.name, variant.get('size'), url)
+
+
+def read_accessory(catalogue):
+    """The small <code>-catalog.json files: a title plus a 'table' of rows"""
+    url = f"{catalogue.name}.html"
+    for family in catalogue:
+        for variant in family.variants:
+            size = variant.get('Dimensions') or variant.get('Size') or variant.get('Thread') or ''
+            yield doc(variant.code, family.name, size, url)
+
+
+# Catalogue shape (catalog_model.SHAPES) -> document reader
+READERS = {
+    'anchors': read_anchors,
+    'profiles': read_profiles,
+    'clamp-families': read_clamp_families,
+    'fasteners': read_fasteners,
+    'accessory': read_accessory,
+}
+
+# products.json repeats the anchor, strut and C-channel catalogues for product-detail.html
+SKIP = {'products'}
+
+
+def source_docs(path, cache_dir, force=False):
+    """Documents for one data file, from the cache when the file is unchanged. Returns (docs, cache_hit)"""
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw + f"\0{INDEX_VERSION}".encode()).hexdigest()
+    cache_path = cache_dir / f"{path.stem}.json"
+
+    if not force and cache_path.exists():
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('hash') == digest:
+            return cached['docs'], True
+
+    data = json.loads(raw)
+    docs = None
+    if catalog_model.shape_of(path.stem, data) in READERS:
+        catalogue = catalog_model.from_json(path.stem, data)
+        docs = [d for d in READERS[catalogue.shape](catalogue) if d['code'] or d['name']]
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump({'hash': digest, 'docs': docs}, f, ensure_ascii=False)
+    return docs, False
+
+
+def build_index(docs):
+    names, pages = [], []
+    name_ids, page_ids = {}, {}
+    postings = {}
+    rows = []
+
+    for doc_id, d in enumerate(docs):
+        if d['name'] not in name_ids:
+            name_ids[d['name']] = len(names)
+            names.append(d['name'])
+        if d['url'] not in page_ids:
+            page_ids[d['url']] = len(pages)
+            pages.append(d['url'])
+        rows.append([d['code'], name_ids[d['name']], d['size'], page_ids[d['url']], d['low'], d['high']])
+
+        for term in set(tokenize(d['code']) + tokenize(d['name']) + tokenize(d['size'])):
+            postings.setdefault(term, []).append(doc_id)
+
+    terms = sorted(postings)
+    delta_postings = []
+    for term in terms:
+        ids = postings[term]
+        delta_postings.append([ids[0]] + [b - a for a, b in zip(ids, ids[1:])])
+
+    return {
+        'version': INDEX_VERSION,
+        'names': names,
+        'pages': pages,
+        'docs': rows,
+        'terms': terms,
+        'postings': delta_postings,
+    }
+
+
+def build(root=ROOT, cache_dir=DEFAULT_CACHE_DIR, force=False):
+    root = Path(root)
+    cache_dir = root / cache_dir
+    docs = []
+    hits = misses = 0
+
+    for path in sorted((root / DATA_DIR).glob('*.json')):
+        if path.stem in SKIP:
+            continue
+        source, hit = source_docs(path, cache_dir, force)
+        hits += hit
+        misses += not hit
+        if source is None:
+            print(f"⚠️  No search reader for {path.name}, skipped")
+            continue
+        docs.extend(source)
+
+    index = build_index(docs)
+    output = root / OUTPUT
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+
+    print(f"{'='*60}")
+    print(f"Indexed {len(docs)} documents, {len(index['terms'])} terms "
+          f"({output.stat().st_size / 1024:.0f} KB) -> {OUTPUT}")
+    print(f"Sources: {misses} rebuilt, {hits} unchanged")
+    print(f"{'='*60}")
+    return index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build data/search/index.json from every catalogue")
+    parser.add_argument('--force', action='store_true', help="re-read every catalogue, ignoring the cache")
+    parser.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE_DIR,
+                        help=f"per-catalogue document cache (default: {DEFAULT_CACHE_DIR})")
+    args = parser.parse_args(argv)
+    build(cache_dir=args.cache_dir, force=args.force)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,358 @@
+"""
+Incremental site build
+Runs the generators (build_images.py, prerender_catalogs.py, build_partials.py,
+build_catalog.py's products stage, compact_json.py, the indexes and
+build_precache.py) as one dependency-tracked build. Each rule lists its
+targets and the files every target reads:
+
+    catalog  gccl-catalog.html <- data/gccl-catalog.json, data/images.json, gccl-catalog.html
+    compact  data/min/gccl-catalog.json <- data/gccl-catalog.json
+    ...
+
+The graph, with a fingerprint of every input, is kept in
+.cache/build-graph.json. A run only rebuilds targets whose inputs changed
+since the target was last built (or whose generator script changed), so a
+one-line edit to data/gccl-catalog.json re-renders gccl-catalog.html, its
+data/min copy and the search index, not every page and image.
+
+Rules run in a fixed order; a rule may read what an earlier one wrote (the
+catalogue pages read data/images.json) but never the reverse. Pages are both
+template and output of the catalog and partials rules, so generated inputs
+are fingerprinted after the whole pass and a rule's own writes never make
+its targets stale.
+
+--watch polls the inputs (and their folders, for new files) and rebuilds
+after the edits settle, so a saved change is in the page well under a second
+later.
+
+Usage:
+    python build_site.py
+    python build_site.py --dry-run          # list stale targets and why
+    python build_site.py --force            # rebuild every target
+    python build_site.py --watch
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import anchor_index
+import build_catalog
+import build_clamp_families
+import build_images
+import build_partials
+import build_precache
+import build_product_index
+import build_search_index
+import compact_json
+import prerender_catalogs
+
+ROOT = Path(__file__).resolve().parent
+GRAPH = '.cache/build-graph.json'
+GRAPH_VERSION = 1
+HASH_LENGTH = 16
+
+POLL_INTERVAL = 0.2
+DEBOUNCE = 0.15
+
+# data/*.json written by a rule, never a catalogue source
+GENERATED_DATA = {build_images.MANIFEST, anchor_index.INDEX_OUTPUT}
+
+
+def rel(path, root):
+    return Path(path).relative_to(root).as_posix()
+
+
+def catalog_sources(root):
+    """data/*.json catalogues, in the form the compact copies and the search index read them"""
+    return [rel(path, root) for path in sorted((root / 'data').glob('*.json'))
+            if rel(path, root) not in GENERATED_DATA]
+
+
+# Registered rules, run in registration order
+RULES = []
+
+
+def rule(name, description, scripts, targets):
+    """
+    Register a build rule: targets(root) -> {target: [input, ...]} and
+    func(root, stale) rebuilds the stale subset of those targets. Every
+    target also depends on the rule's generator scripts.
+    """
+    def register(func):
+        RULES.append((name, description, scripts, targets, func))
+        return func
+    return register
+
+
+def image_targets(root):
+    return {build_images.MANIFEST: [path for path, _ in build_images.find_sources(root)]}
+
+
+@rule('images', "responsive derivatives and data/images.json", ['build_images.py'], image_targets)
+def build_image_manifest(root, stale):
+    build_images.build(root)
+
+
+def catalog_targets(root):
+    return {
+        name: [data_file, build_images.MANIFEST, name]
+        for name, (_, data_file, _) in prerender_catalogs.catalog_pages(root).items()
+    }
+
+
+@rule('catalog', "catalogue pages rendered from their JSON",
+      ['prerender_catalogs.py', 'build_images.py'], catalog_targets)
+def build_catalog_pages(root, stale):
+    prerender_catalogs.build(sorted(stale), root=root)
+
+
+def partial_targets(root):
+    return {path.name: list(build_partials.PARTIALS.values()) + [path.name] for path in build_partials.pages(root)}
+
+
+@rule('partials', "navbar and footer inlined into every page", ['build_partials.py'], partial_targets)
+def build_page_partials(root, stale):
+    build_partials.build(sorted(stale), root=root)
+
+
+@rule('products-json', "metal-anchors category of data/products.json (build_catalog.py products stage)",
+      ['build_catalog.py', 'anchor_definitions.py'],
+      lambda root: {build_catalog.PRODUCTS_JSON: [build_catalog.ANCHOR_CATALOG]})
+def build_products_json(root, stale):
+    build_catalog.run(['products'], root=root)
+
+
+def compact_targets(root):
+    return {rel(compact_json.site_path(source, root), root): [source] for source in catalog_sources(root)}
+
+
+@rule('compact', "data/min copies of the catalogues", ['compact_json.py'], compact_targets)
+def build_compact_copies(root, stale):
+    for target in sorted(stale):
+        source = root / stale[target][0]
+        with open(source, 'r', encoding='utf-8') as f:
+            compact_json.write_catalog(source, json.load(f), pretty=False, root=root)
+        print(f"OK {target}")
+
+
+@rule('search', "data/search/index.json", ['build_search_index.py', 'catalog_model.py'],
+      lambda root: {build_search_index.OUTPUT: catalog_sources(root)})
+def build_search(root, stale):
+    build_search_index.build(root)
+
+
+@rule('anchors', "data/anchor-index.json", ['anchor_index.py', 'catalog_model.py'],
+      lambda root: {anchor_index.INDEX_OUTPUT: [anchor_index.ANCHOR_CATALOG]})
+def build_anchor_index(root, stale):
+    index = anchor_index.AnchorIndex.build(root=root)
+    index.write(root)
+    print(f"OK {len(index)} anchor variants -> {anchor_index.INDEX_OUTPUT}")
+
+
+@rule('products', "data/products shards and index", ['build_product_index.py', 'catalog_model.py', 'compact_json.py'],
+      lambda root: {f"{build_product_index.OUTPUT_DIR}/index.json": list(build_product_index.SOURCES)})
+def build_products(root, stale):
+    build_product_index.build(root)
+
+
+@rule('clamps', "data/ggip family files", ['build_clamp_families.py', 'catalog_model.py', 'compact_json.py'],
+      lambda root: {f"{output}/manifest.json": [source] for source, output, _ in build_clamp_families.CATALOGS})
+def build_clamps(root, stale):
+    build_clamp_families.build(root)
+
+
+@rule('precache', "precache manifest in sw.js", ['build_precache.py'],
+      lambda root: {build_precache.SERVICE_WORKER: list(build_precache.PRECACHE)})
+def build_service_worker(root, stale):
+    path = root / build_precache.SERVICE_WORKER
+    manifest = build_precache.build_manifest(root)
+    path.write_text(build_precache.render(path.read_text(encoding='utf-8'), manifest), encoding='utf-8')
+    print(f"OK {build_precache.SERVICE_WORKER}: precache {manifest['version']}")
+
+
+class Fingerprints:
+    """Content hashes, re-read only when a file's mtime or size changes"""
+
+    def __init__(self, root, stats=None):
+        self.root = root
+        self.stats = stats or {}
+
+    def __call__(self, rel_path):
+        try:
+            st = os.stat(self.root / rel_path)
+        except FileNotFoundError:
+            self.stats.pop(rel_path, None)
+            return None
+        cached = self.stats.get(rel_path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        digest = hashlib.sha256((self.root / rel_path).read_bytes()).hexdigest()[:HASH_LENGTH]
+        self.stats[rel_path] = [st.st_mtime_ns, st.st_size, digest]
+        return digest
+
+
+def load_graph(root):
+    path = root / GRAPH
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            graph = json.load(f)
+        if graph.get('version') == GRAPH_VERSION:
+            return graph
+    return {'version': GRAPH_VERSION, 'rules': {}, 'stats': {}}
+
+
+def save_graph(root, graph):
+    path = root / GRAPH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(graph, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def stale_reason(target, inputs, recorded, fingerprint, root):
+    """Why target needs rebuilding, or None when it is current"""
+    if recorded is None:
+        return "never built"
+    if not (root / target).exists():
+        return "output missing"
+    if set(inputs) != set(recorded):
+        return "inputs changed: " + ', '.join(sorted(set(inputs) ^ set(recorded))[:3])
+    changed = [path for path in inputs if fingerprint(path) != recorded[path]]
+    if changed:
+        return "changed: " + ', '.join(changed[:3]) + (f" (+{len(changed) - 3})" if len(changed) > 3 else '')
+    return None
+
+
+def build(root=ROOT, force=False, dry_run=False):
+    """One pass over every rule; returns {rule: [rebuilt targets]}"""
+    root = Path(root)
+    graph = load_graph(root)
+    fingerprint = Fingerprints(root, graph['stats'])
+    started = time.perf_counter()
+
+    plans = {}
+    for name, _, scripts, targets_for, _ in RULES:
+        plans[name] = {target: inputs + scripts for target, inputs in targets_for(root).items()}
+    # Files some rule writes; their fingerprints are taken after the pass
+    generated = set().union(*plans.values())
+
+    rebuilt = {}
+    snapshots = {}
+    for name, _, _, _, build_rule in RULES:
+        recorded = graph['rules'].get(name, {})
+        stale = {}
+        for target, inputs in plans[name].items():
+            reason = "forced" if force else stale_reason(target, inputs, recorded.get(target), fingerprint, root)
+            if reason:
+                stale[target] = inputs
+                if dry_run:
+                    print(f"{name:9} {target}: {reason}")
+        # Sources as they were when the rule read them, so an edit made mid-build is seen next pass
+        snapshots[name] = {target: {path: fingerprint(path) for path in inputs}
+                           for target, inputs in plans[name].items()}
+        if dry_run:
+            rebuilt[name] = sorted(stale)
+            continue
+        if not stale:
+            continue
+
+        print(f"--- {name}: {len(stale)} of {len(plans[name])} target(s)")
+        build_rule(root, stale)
+        rebuilt[name] = sorted(stale)
+
+    if dry_run:
+        print(f"{sum(len(t) for t in rebuilt.values())} stale target(s)")
+        return rebuilt
+
+    graph['rules'] = {
+        name: {target: {path: fingerprint(path) if path in generated else digest
+                        for path, digest in inputs.items()}
+               for target, inputs in snapshots[name].items()}
+        for name in snapshots
+    }
+    tracked = {path for targets in plans.values() for inputs in targets.values() for path in inputs}
+    graph['stats'] = {path: stat for path, stat in fingerprint.stats.items() if path in tracked}
+    save_graph(root, graph)
+
+    count = sum(len(targets) for targets in rebuilt.values())
+    print(f"{'='*60}")
+    print(f"{count} target(s) rebuilt in {time.perf_counter() - started:.2f}s"
+          + (f" ({', '.join(f'{name} {len(t)}' for name, t in rebuilt.items())})" if rebuilt else ''))
+    print(f"{'='*60}")
+    return rebuilt
+
+
+def watched_files(root):
+    """Every input in the graph plus the folders holding them (a new file changes its folder's mtime)"""
+    graph = load_graph(root)
+    files = {path for targets in graph['rules'].values() for inputs in targets.values() for path in inputs}
+    return files | {Path(path).parent.as_posix() for path in files}
+
+
+def snapshot(root, paths):
+    state = {}
+    for path in paths:
+        try:
+            st = os.stat(root / path)
+            state[path] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            state[path] = None
+    return state
+
+
+def watch(root=ROOT):
+    root = Path(root)
+    build(root)
+    paths = watched_files(root)
+    state = snapshot(root, paths)
+    print(f"Watching {len(paths)} files and folders (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(POLL_INTERVAL)
+            current = snapshot(root, paths)
+            if current == state:
+                continue
+            # Debounce: wait until an editor's burst of writes has settled
+            while True:
+                time.sleep(DEBOUNCE)
+                settled = snapshot(root, paths)
+                if settled == current:
+                    break
+                current = settled
+            changed = sorted(path for path in current if current[path] != state.get(path))
+            print(f"\nChanged: {', '.join(changed[:5])}" + (f" (+{len(changed) - 5})" if len(changed) > 5 else ''))
+            try:
+                build(root)
+            except Exception as error:  # keep watching; the next save retries
+                print(f"❌ Build failed: {error}")
+            paths = watched_files(root)
+            state = snapshot(root, paths)
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild the generated site files whose inputs changed")
+    parser.add_argument('--force', action='store_true', help="rebuild every target")
+    parser.add_argument('--dry-run', action='store_true', help="list stale targets and why, without building")
+    parser.add_argument('--watch', action='store_true', help="rebuild whenever an input changes")
+    parser.add_argument('--list', action='store_true', help="list the rules")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, description, *_ in RULES:
+            print(f"{name:9} {description}")
+        return
+    if args.watch:
+        watch()
+    else:
+        build(force=args.force, dry_run=args.dry_run)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,393 @@
+"""
+Typed catalogue model shared by the Python tooling
+data/*.json comes in a handful of shapes - anchor families with variants,
+profile categories, clamp families, keyed fastener families, the small
+accessory tables - and every script used to walk them with its own key
+names. load() recognises the shape once and gives the same view of each:
+
+    catalogue = load('data/anchor-catalog.json')
+    family = catalogue.find('GBGTA')             # Family: .code, .name, .fields, .variants
+    variant = catalogue.find('GBGTA10100')       # Variant: .code, ['size'], .get('packSize')
+    family.variants.column('tensileLoadKN')      # one column of the variant table
+
+    catalogues = load_all()                      # every data/*.json catalogue, once
+    catalogues.find('GGCP0012')
+
+Variant rows are stored by column, not as one dict per row: each column is a
+list (strings interned), or an array('q') / array('d') when every row holds
+an int / a float, and a row is only materialised when asked for. Family and
+Variant use __slots__. Everything else in a file (descriptions, images,
+specifications) stays as loaded, so to_json() gives back the file exactly
+and dump() writes it with compact_json like the other generators.
+
+Usage:
+    python catalog_model.py                      # load every catalogue, print counts and timings
+    python catalog_model.py GBGTA10100 GGCP0012  # look codes up across all catalogues
+"""
+
+import argparse
+import json
+import sys
+import time
+from array import array
+from pathlib import Path
+
+from compact_json import dumps_pretty, write_catalog
+
+ROOT = Path(__file__).resolve().parent
+DATA_DIR = 'data'
+
+# Marks a key a row does not have (rows of one table need not share keys)
+_MISSING = object()
+# array('q') range; larger ints stay in a list
+_INT_MIN, _INT_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def _compact(values):
+    """A column as an array when every value is an int (or every one a float), else the list"""
+    if values and all(type(value) is int for value in values):
+        if _INT_MIN <= min(values) and max(values) <= _INT_MAX:
+            return array('q', values)
+    elif values and all(type(value) is float for value in values):
+        return array('d', values)
+    return values
+
+
+class VariantTable:
+    """Rows of one family's variant table, stored column by column"""
+
+    __slots__ = ('columns', 'code_key', '_data', '_layouts', '_layout_of', '_length', '_index')
+
+    def __init__(self, rows, code_key=None):
+        self.code_key = code_key
+        self._length = len(rows)
+        self._index = None
+
+        # Key order of each distinct row layout, so rows come back as they were
+        layouts, layout_of, columns = {}, [], {}
+        for row in rows:
+            keys = tuple(row)
+            layout_of.append(layouts.setdefault(keys, len(layouts)))
+            for key in keys:
+                columns.setdefault(key, None)
+        self.columns = list(columns)
+        self._layouts = list(layouts)
+        self._layout_of = array('B' if len(layouts) < 256 else 'H', layout_of)
+
+        self._data = {}
+        for key in self.columns:
+            values = [row.get(key, _MISSING) for row in rows]
+            values = [sys.intern(value) if type(value) is str else value for value in values]
+            self._data[key] = _compact(values)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return (Variant(self, i) for i in range(self._length))
+
+    def __getitem__(self, i):
+        if not -self._length <= i < self._length:
+            raise IndexError(i)
+        return Variant(self, i % self._length)
+
+    def column(self, key):
+        """Every row's value for key (None where a row does not have it)"""
+        values = self._data.get(key)
+        if values is None:
+            return [None] * self._length
+        return [None if value is _MISSING else value for value in values]
+
+    def value(self, i, key, default=None):
+        values = self._data.get(key)
+        if values is None:
+            return default
+        value = values[i]
+        return default if value is _MISSING else value
+
+    def row(self, i):
+        """Row i as the dict it was loaded from"""
+        return {key: self._data[key][i] for key in self._layouts[self._layout_of[i]]}
+
+    def to_rows(self):
+        return [self.row(i) for i in range(self._length)]
+
+    def find(self, code):
+        """The variant with this product code, or None"""
+        if self._index is None:
+            codes = self._data.get(self.code_key, ())
+            self._index = {}
+            for i, value in enumerate(codes):
+                if type(value) is str:
+                    self._index.setdefault(value, i)
+        i = self._index.get(code)
+        return None if i is None else Variant(self, i)
+
+
+class Variant:
+    """One row of a VariantTable; reads through to the table's columns"""
+
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    @property
+    def code(self):
+        return self.table.value(self.index, self.table.code_key)
+
+    def __getitem__(self, key):
+        value = self.table.value(self.index, key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        return self.table.value(self.index, key, default)
+
+    def to_dict(self):
+        return self.table.row(self.index)
+
+    def __repr__(self):
+        return f"Variant({self.code!r})"
+
+
+class Family:
+    """
+    A product family: its code and name as loaded, the rest of its source
+    fields, and its variant table (empty for shapes without one)
+    """
+
+    __slots__ = ('code', 'name', 'key', 'fields', 'variants')
+
+    def __init__(self, code, name, fields, variants, key=None):
+        self.code = code
+        self.name = name
+        self.key = key            # key of the family in a keyed catalogue
+        self.fields = fields      # the source dict; its rows list is replaced by variants
+        self.variants = variants
+
+    def to_json(self):
+        """The family's source dict as plain dicts and lists, variant rows included"""
+        return _plain(self.fields)
+
+    def __repr__(self):
+        return f"Family({self.code!r}, {len(self.variants)} variants)"
+
+
+_EMPTY = VariantTable([])
+
+
+def _family(fields, code, name_key, rows_key=None, row_code=None, key=None):
+    variants = _EMPTY
+    if rows_key and isinstance(fields.get(rows_key), list):
+        variants = VariantTable(fields[rows_key], row_code)
+        fields[rows_key] = variants
+    return Family(code, fields.get(name_key) or '', fields, variants, key)
+
+
+def _anchor_families(data, stem):
+    return [_family(f, f.get('productCode'), 'name', 'variants', 'productCode') for f in data['products']]
+
+
+def _profile_families(data, stem):
+    return [_family(p, p.get('properties', {}).get('identification', p.get('id')), 'title')
+            for p in data['category']['products']]
+
+
+def _product_families(data, stem):
+    return [_family(p, p.get('id'), 'title') for category in data['categories'] for p in category['products']]
+
+
+def _clamp_families(data, stem):
+    # greengrip-ggip-catalog: the top level is the GGIP family, other families are keyed
+    # greengrip-ggsh-catalog: every family is keyed
+    families = []
+    if 'products' in data:
+        families.append(_family(data, stem.split('-')[1].upper(), 'productName', 'products', 'productCode'))
+    for key, value in data.items():
+        if isinstance(value, dict) and 'products' in value:
+            families.append(_family(value, key.upper(), 'productName', 'products', 'productCode', key))
+    return families
+
+
+def _fastener_families(data, stem):
+    return [_family(f, f.get('productCode'), 'productName', 'products', 'productCode', key)
+            for key, f in data.items()]
+
+
+def _accessory_families(data, stem):
+    code = data.get('code_prefix') or stem.split('-')[0].upper()
+    return [_family(data, code, 'title', 'table', 'Product Code')]
+
+
+# Catalogue shape -> family reader, by file stem where the name says it
+SHAPES = {
+    'anchors': _anchor_families,
+    'profiles': _profile_families,
+    'products': _product_families,
+    'clamp-families': _clamp_families,
+    'fasteners': _fastener_families,
+    'accessory': _accessory_families,
+}
+STEM_SHAPES = {
+    'anchor-catalog': 'anchors',
+    'strut-channel-catalog': 'profiles',
+    'c-channel-catalog': 'profiles',
+    'products': 'products',
+    'greengrip-ggip-catalog': 'clamp-families',
+    'greengrip-ggsh-catalog': 'clamp-families',
+    'fasteners-catalog': 'fasteners',
+}
+
+
+def shape_of(stem, data):
+    """Shape name of a data file, or None for generated files (images.json, anchor-index.json)"""
+    if stem in STEM_SHAPES:
+        return STEM_SHAPES[stem]
+    if stem.endswith('-catalog') and isinstance(data, dict) and 'table' in data:
+        return 'accessory'
+    return None
+
+
+def _plain(value):
+    if isinstance(value, VariantTable):
+        return value.to_rows()
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+class Catalogue:
+    """One data/*.json file: its families, with lookups by family or variant code"""
+
+    __slots__ = ('name', 'shape', 'data', 'families', '_codes')
+
+    def __init__(self, name, shape, data, families):
+        self.name = name          # file stem, e.g. 'anchor-catalog'
+        self.shape = shape
+        self.data = data          # the loaded tree, variant rows replaced by VariantTables
+        self.families = families
+        self._codes = None
+
+    def __iter__(self):
+        return iter(self.families)
+
+    def __len__(self):
+        return len(self.families)
+
+    def variants(self):
+        for family in self.families:
+            yield from family.variants
+
+    def find(self, code):
+        """The Family or Variant with this code, or None"""
+        if self._codes is None:
+            self._codes = {}
+            for family in self.families:
+                if family.code:
+                    self._codes.setdefault(family.code, family)
+        found = self._codes.get(code)
+        if found is not None:
+            return found
+        for family in self.families:
+            variant = family.variants.find(code)
+            if variant is not None:
+                return variant
+        return None
+
+    def to_json(self):
+        """The file's data as plain dicts and lists, exactly as loaded (plus any edits)"""
+        return _plain(self.data)
+
+    def dumps(self):
+        return dumps_pretty(self.to_json())
+
+    def dump(self, path=None, root=ROOT):
+        """Write the pretty source and the min/ copy beside it (compact_json.write_catalog)"""
+        path = Path(path) if path else Path(root) / DATA_DIR / f"{self.name}.json"
+        return write_catalog(path, self.to_json(), root=root)
+
+    def __repr__(self):
+        return f"Catalogue({self.name!r}, {self.shape}, {len(self.families)} families)"
+
+
+def from_json(name, data):
+    shape = shape_of(name, data)
+    if shape is None:
+        raise ValueError(f"{name}: not a catalogue")
+    return Catalogue(name, shape, data, SHAPES[shape](data, name))
+
+
+def load(path):
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        return from_json(path.stem, json.load(f))
+
+
+class CatalogueSet:
+    """Every catalogue, loaded once, with code lookups across all of them"""
+
+    def __init__(self, catalogues):
+        self.catalogues = {catalogue.name: catalogue for catalogue in catalogues}
+
+    def __getitem__(self, name):
+        return self.catalogues[name]
+
+    def __iter__(self):
+        return iter(self.catalogues.values())
+
+    def __len__(self):
+        return len(self.catalogues)
+
+    def find(self, code):
+        """(catalogue, Family or Variant) for the first catalogue holding code, or (None, None)"""
+        for catalogue in self.catalogues.values():
+            found = catalogue.find(code)
+            if found is not None:
+                return catalogue, found
+        return None, None
+
+
+def load_all(root=ROOT):
+    """Every catalogue in data/*.json (generated files are skipped)"""
+    catalogues = []
+    for path in sorted((Path(root) / DATA_DIR).glob('*.json')):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if shape_of(path.stem, data) is not None:
+            catalogues.append(from_json(path.stem, data))
+    return CatalogueSet(catalogues)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load every catalogue through the typed model")
+    parser.add_argument('codes', nargs='*', help="product codes to look up")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    catalogues = load_all()
+    elapsed = time.perf_counter() - started
+
+    for code in args.codes:
+        catalogue, found = catalogues.find(code)
+        if found is None:
+            print(f"❌ {code}: not found")
+        elif isinstance(found, Variant):
+            print(f"OK {code}: {catalogue.name} variant {found.to_dict()}")
+        else:
+            print(f"OK {code}: {catalogue.name} family {found.name!r}, {len(found.variants)} variants")
+
+    print(f"{'='*60}")
+    for catalogue in catalogues:
+        print(f"  {catalogue.name:28} {catalogue.shape:15} {len(catalogue):4} families "
+              f"{sum(len(f.variants) for f in catalogue):5} variants")
+    print(f"{len(catalogues)} catalogues loaded in {elapsed * 1000:.0f} ms")
+    print(f"{'='*60}")
+
+
+if __name__ == '__main__':
+    main()
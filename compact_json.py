@@ -0,0 +1,168 @@
+"""
+Compact columnar JSON for the site
+Variant tables repeat the same keys on every row ("drillHoleDepth",
+"Drill Ø (mm)", ...). encode() turns any list of same-shaped objects into
+    {"$cols": ["productCode", ["clampingRange", "mm"], ...], "$rows": [[...], ...]}
+where a column is a key, or a key path for nested objects. Output is
+minified. decode() reverses it exactly; the browser side is
+ProductRenderer.decodeColumnar in js/product-renderer.js.
+
+data/*.json stays pretty-printed as the source form for editing; the site
+copy lives in data/min/ under the same file name (in general, min/ next to
+wherever the source is written).
+
+Usage:
+    python compact_json.py                       # re-emit data/min/ for every data/*.json
+    python compact_json.py data/products.json    # just these files
+    python compact_json.py --pretty data/min/anchor-catalog.json   # expand back to data/
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+SOURCE_DIR = 'data'
+SITE_DIR = 'data/min'
+
+COLS = '$cols'
+ROWS = '$rows'
+
+
+def _flatten(obj, prefix=()):
+    """Yield (path, value) for the leaves of nested, non-empty dicts"""
+    for key, value in obj.items():
+        path = prefix + (key,)
+        if isinstance(value, dict) and value:
+            yield from _flatten(value, path)
+        else:
+            yield path, value
+
+
+def _column(path):
+    return path[0] if len(path) == 1 else list(path)
+
+
+def encode(data):
+    """Recursively convert lists of same-shaped objects into column form"""
+    if isinstance(data, dict):
+        return {key: encode(value) for key, value in data.items()}
+
+    if isinstance(data, list):
+        if len(data) >= 2 and all(isinstance(item, dict) and item for item in data):
+            flat_rows = [list(_flatten(item)) for item in data]
+            paths = [path for path, _ in flat_rows[0]]
+            # Only lossless when every row has exactly the same keys in the same order
+            if all([path for path, _ in row] == paths for row in flat_rows[1:]):
+                return {
+                    COLS: [_column(path) for path in paths],
+                    ROWS: [[encode(value) for _, value in row] for row in flat_rows],
+                }
+        return [encode(item) for item in data]
+
+    return data
+
+
+def _set_path(obj, path, value):
+    for key in path[:-1]:
+        obj = obj.setdefault(key, {})
+    obj[path[-1]] = value
+
+
+def decode(data):
+    """Inverse of encode()"""
+    if isinstance(data, dict):
+        if set(data) == {COLS, ROWS}:
+            paths = [column if isinstance(column, list) else [column] for column in data[COLS]]
+            rows = []
+            for values in data[ROWS]:
+                row = {}
+                for path, value in zip(paths, values):
+                    _set_path(row, path, decode(value))
+                rows.append(row)
+            return rows
+        return {key: decode(value) for key, value in data.items()}
+
+    if isinstance(data, list):
+        return [decode(item) for item in data]
+
+    return data
+
+
+def dumps_compact(data):
+    return json.dumps(encode(data), ensure_ascii=False, separators=(',', ':'))
+
+
+def dumps_pretty(data):
+    """The source form the repo has always used"""
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def site_path(source_path, root=ROOT):
+    """
+    data/anchor-catalog.json -> data/min/anchor-catalog.json: the min/ folder
+    beside the source, so a catalogue written elsewhere (/tmp/x/anchors.json)
+    never puts its copy in the repo. Relative paths are taken from root.
+    """
+    source_path = Path(root) / source_path
+    return source_path.parent / Path(SITE_DIR).name / source_path.name
+
+
+def _write_atomic(path, text):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def write_catalog(source_path, data, pretty=True, root=ROOT):
+    """
+    Write a catalogue in both forms: the pretty source (unless pretty=False)
+    and the compact site copy in min/ beside it. Returns the site copy path.
+    """
+    source_path = Path(root) / source_path
+    if pretty:
+        _write_atomic(source_path, dumps_pretty(data))
+    compact_path = site_path(source_path, root)
+    _write_atomic(compact_path, dumps_compact(data))
+    return compact_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Emit compact site copies of data/*.json (or expand them back)")
+    parser.add_argument('files', nargs='*', type=Path, help="files to convert (default: every data/*.json)")
+    parser.add_argument('--pretty', action='store_true',
+                        help="expand compact files back into the pretty source form in data/")
+    args = parser.parse_args(argv)
+
+    if args.pretty:
+        for path in args.files or sorted((ROOT / SITE_DIR).glob('*.json')):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = decode(json.load(f))
+            target = ROOT / SOURCE_DIR / path.name
+            _write_atomic(target, dumps_pretty(data))
+            print(f"OK {path} -> {target.relative_to(ROOT)}")
+        return
+
+    total_before = total_after = 0
+    for path in args.files or sorted((ROOT / SOURCE_DIR).glob('*.json')):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        compact_path = write_catalog(path, data, pretty=False)
+        before, after = path.stat().st_size, compact_path.stat().st_size
+        total_before += before
+        total_after += after
+        print(f"OK {path.name}: {before / 1024:.1f} KB -> {after / 1024:.1f} KB")
+
+    if total_before:
+        print(f"{'='*60}")
+        print(f"Total: {total_before / 1024:.0f} KB -> {total_after / 1024:.0f} KB "
+              f"({100 - total_after / total_before * 100:.0f}% smaller)")
+        print(f"{'='*60}")
+
+
+if __name__ == '__main__':
+    main()
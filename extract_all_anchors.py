@@ -6,13 +6,43 @@ Each page has 1 product with same layout:
 - Specification table
 - Product definition text
 - Installation parameters table with varying rows
+
+pdf_layouts.ANCHOR_PAGE places those blocks. The page is parsed once into a
+pdf_page_model.PageModel; each block is read from its own region of it and
+the parameters table from explicit column and row lines. A page that does not
+match the template is read whole, as before.
+
+Each page's time in page_model (the first look at the page, so it carries the
+PDF parse), extract_text, extract_tables, extract_specifications,
+extract_product_definition and the regex pass of extract_table_data, and how
+many variants came from the tables versus the text (and how many were dropped
+by variant_problems()), go to a JSON run report
+(--report); --profile also writes a cProfile dump of the run.
+
+Usage:
+    python extract_all_anchors.py
+    python extract_all_anchors.py --report .cache/reports/anchors.json
+    python extract_all_anchors.py --profile .cache/reports/anchors.prof --no-cache
 """
 
-import json
+import argparse
+import cProfile
 import re
 import pdfplumber
 from pathlib import Path
 
+from compact_json import write_catalog
+from pdf_engine import extract_pages
+from pdf_layouts import ANCHOR_PAGE, extract_layout
+from pdf_page_cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, PageCache
+from pdf_run_report import DEFAULT_REPORT_DIR, RunReport, count, stage
+
+DEFAULT_PDF = Path("Product-Catalogues-PDF/Anchors rev1.pdf")
+DEFAULT_OUTPUT = Path("data/anchor-catalog.json")
+DEFAULT_REPORT = DEFAULT_REPORT_DIR / "anchors.json"
+# Bump when the text/table extraction settings change so cached pages are re-parsed
+EXTRACTOR_VERSION = "anchors-3"
+
 def clean_text(text):
     """Clean and normalize text"""
     if not text:
@@ -29,39 +59,29 @@ def extract_product_code_from_title(text):
         return product_name, product_code
     return None, None
 
+# Specification labels and their keys, in catalogue order
+SPEC_FIELDS = {
+    'Material': 'material',
+    'Surface': 'surface',
+    'Corrosion': 'corrosion',
+    'Drilling Method': 'drillingMethod',
+    'Base Material': 'baseMaterial',
+    'Type of Fastening': 'typeOfFastening',
+    'Reusability': 'reusability',
+}
+# Longest label first so "Base Material" is not read as "Material"
+SPEC_PATTERN = re.compile(
+    r'(' + '|'.join(label.replace(' ', r'\s+') for label in sorted(SPEC_FIELDS, key=len, reverse=True)) + r')[:\s]+([^\n]+)',
+    re.IGNORECASE)
+SPEC_KEYS = {label.lower(): key for label, key in SPEC_FIELDS.items()}
+
 def extract_specifications(text):
-    """Extract specification fields from text"""
-    specs = {}
-    
-    # Material
-    if match := re.search(r'Material[:\s]+([^\n]+)', text, re.IGNORECASE):
-        specs['material'] = clean_text(match.group(1))
-    
-    # Surface
-    if match := re.search(r'Surface[:\s]+([^\n]+)', text, re.IGNORECASE):
-        specs['surface'] = clean_text(match.group(1))
-    
-    # Corrosion
-    if match := re.search(r'Corrosion[:\s]+([^\n]+)', text, re.IGNORECASE):
-        specs['corrosion'] = clean_text(match.group(1))
-    
-    # Drilling Method
-    if match := re.search(r'Drilling\s+Method[:\s]+([^\n]+)', text, re.IGNORECASE):
-        specs['drillingMethod'] = clean_text(match.group(1))
-    
-    # Base Material
-    if match := re.search(r'Base\s+Material[:\s]+([^\n]+)', text, re.IGNORECASE):
-        specs['baseMaterial'] = clean_text(match.group(1))
-    
-    # Type of Fastening
-    if match := re.search(r'Type\s+of\s+Fastening[:\s]+([^\n]+)', text, re.IGNORECASE):
-        specs['typeOfFastening'] = clean_text(match.group(1))
-    
-    # Reusability
-    if match := re.search(r'Reusability[:\s]+([^\n]+)', text, re.IGNORECASE):
-        specs['reusability'] = clean_text(match.group(1))
-    
-    return specs
+    """Extract specification fields from text in one pass over its label/value lines"""
+    found = {}
+    for match in SPEC_PATTERN.finditer(text):
+        key = SPEC_KEYS[' '.join(match.group(1).lower().split())]
+        found.setdefault(key, clean_text(match.group(2)))
+    return {key: found[key] for key in SPEC_FIELDS.values() if key in found}
 
 def extract_product_definition(text):
     """Extract product definition paragraph"""
@@ -142,6 +162,16 @@ def extract_table_data(tables, text):
     
     # APPROACH 2: Parse from raw text to catch missing rows
     # Look for product code patterns in text (e.g., GBGTA0660, GBLSA08C)
+    with stage('table_regex'):
+        from_text = _text_variants(text, {v['productCode'] for v in variants})
+    count('variants_from_tables', len(variants))
+    count('variants_from_text', len(from_text))
+    
+    return variants + from_text
+
+def _text_variants(text, known_codes):
+    """Variants parsed from the raw text lines whose codes are not in known_codes"""
+    variants = []
     lines = text.split('\n')
     for line in lines:
         # Match pattern: GBXXXX#### followed by size and numbers (allow - for missing values)
@@ -150,8 +180,9 @@ def extract_table_data(tables, text):
             product_code = match.group(1).replace(' ', '')
             
             # Check if already exists
-            if any(v['productCode'] == product_code for v in variants):
+            if product_code in known_codes:
                 continue
+            known_codes.add(product_code)
             
             variant = {
                 'productCode': product_code,
@@ -168,30 +199,65 @@ def extract_table_data(tables, text):
             variants.append(variant)
     
     return variants
-    
-    return variants
-    
-    return variants
+
+# A published variant row needs a size like "M8 x 120" and these columns; "-"
+# cells elsewhere (fixture thickness, loads) are genuine gaps in the catalogue
+VARIANT_SIZE_RE = re.compile(r'M\d+\s*[xX×]\s*\d+')
+REQUIRED_VARIANT_FIELDS = ('packSize', 'drillDiameter', 'drillHoleDepth', 'installationTorque')
+
+def variant_problems(variant):
+    """Why a parsed row is not a usable variant (overlapping PDF text, missing cells), or []"""
+    problems = []
+    if not VARIANT_SIZE_RE.fullmatch(variant.get('size') or ''):
+        problems.append(f"size {variant.get('size')!r}")
+    problems.extend(f"no {field}" for field in REQUIRED_VARIANT_FIELDS if variant.get(field) is None)
+    return problems
+
+def drop_invalid_variants(variants):
+    """The rows that pass variant_problems(); the others are reported and counted"""
+    valid = []
+    for variant in variants:
+        problems = variant_problems(variant)
+        if problems:
+            print(f"WARNING: Dropped variant {variant['productCode']}: {', '.join(problems)}")
+            count('variants_rejected')
+        else:
+            valid.append(variant)
+    return valid
 
 def extract_product_from_page(pdf, page_num):
     """Extract product data from a single page"""
+    return extract_product(pdf.pages[page_num - 1], page_num)
+
+def extract_product(page, page_num):
+    """Extract product data from an already opened page"""
     print(f"\n{'='*60}")
     print(f"Processing page {page_num}")
     print(f"{'='*60}")
     
     try:
-        page = pdf.pages[page_num - 1]
-        text = page.extract_text()
+        layout = extract_layout(page, ANCHOR_PAGE)
     except Exception as e:
-        print(f"ERROR: Could not extract text from page {page_num}: {e}")
-        return None
-    
-    if not text:
-        print(f"WARNING: No text extracted from page {page_num}")
-        return None
+        print(f"WARNING: Layout extraction error: {e}")
+        layout = None
+    
+    if layout is None:
+        print("  Page does not match the anchors layout - reading the whole page")
+        try:
+            with stage('extract_text'):
+                text = page.extract_text()
+        except Exception as e:
+            print(f"ERROR: Could not extract text from page {page_num}: {e}")
+            return None
+        if not text:
+            print(f"WARNING: No text extracted from page {page_num}")
+            return None
+        title_text = specs_text = text
+    else:
+        title_text, specs_text = layout['title'] or '', layout['specs'] or ''
     
     # Extract product name and code
-    product_name, product_code = extract_product_code_from_title(text)
+    product_name, product_code = extract_product_code_from_title(title_text)
     
     if not product_code:
         print(f"  Could not find product code on page {page_num}")
@@ -201,20 +267,32 @@ def extract_product_from_page(pdf, page_num):
     print(f"OK Code: {product_code}")
     
     # Extract specifications
-    specs = extract_specifications(text)
+    with stage('extract_specifications'):
+        specs = extract_specifications(specs_text)
     print(f"OK Specifications: {len(specs)} fields")
     
     # Extract product definition
-    description = extract_product_definition(text)
+    with stage('extract_product_definition'):
+        if layout is None:
+            description = extract_product_definition(text)
+        else:
+            # The region holds just the paragraph
+            description = clean_text(layout['definition'] or '')
     print(f"OK Description: {len(description)} chars")
     
     # Extract tables with error handling
     try:
-        tables = page.extract_tables()
-        variants = extract_table_data(tables, text)
+        if layout is None:
+            with stage('extract_tables'):
+                tables = page.extract_tables()
+            variants = extract_table_data(tables, text)
+        else:
+            # One table on template lines; the text pass only sees the table's own text
+            variants = extract_table_data([layout['rows']], layout['parameters'] or '')
     except Exception as e:
         print(f"WARNING: Table extraction error: {e}")
         variants = []
+    variants = drop_invalid_variants(variants)
     
     print(f"OK Variants: {len(variants)} found")
     
@@ -235,9 +313,33 @@ def extract_product_from_page(pdf, page_num):
     
     return product
 
-def main():
-    pdf_path = Path(r"C:\Users\ghani\Desktop\Projects\Greenmann\Product-Catalogues-PDF\Anchors rev1.pdf")
-    output_path = Path(r"C:\Users\ghani\Desktop\Projects\Greenmann\data\anchor-catalog.json")
+def extract_page_safely(page, page_num):
+    """Page function for the engine - one bad page must not abort the run"""
+    try:
+        return extract_product(page, page_num)
+    except Exception as e:
+        print(f"ERROR on page {page_num}: {e}")
+        return None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract all anchor products from the anchors catalogue PDF")
+    parser.add_argument('--pdf', type=Path, default=DEFAULT_PDF, help="catalogue PDF to read")
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT, help="anchor catalog JSON to write")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: one per core, 1 = no pool)")
+    parser.add_argument('--no-cache', action='store_true', help="re-parse every page, ignoring the page cache")
+    parser.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE_DIR, help="page cache directory")
+    parser.add_argument('--cache-max-mb', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help="evict least recently used pages beyond this size")
+    parser.add_argument('--report', type=Path, default=DEFAULT_REPORT,
+                        help="JSON run report of per-page stage times and counters")
+    parser.add_argument('--profile', type=Path, default=None,
+                        help="also write a cProfile dump of the extraction here (runs in one process)")
+    args = parser.parse_args(argv)
+    
+    pdf_path = args.pdf
+    output_path = args.output
+    cache = None if args.no_cache else PageCache(args.cache_dir, args.cache_max_mb * 1024 * 1024, EXTRACTOR_VERSION)
     
     if not pdf_path.exists():
         print(f"ERROR: PDF not found: {pdf_path}")
@@ -245,25 +347,37 @@ def main():
     
     print(f"Opening PDF: {pdf_path}")
     
-    all_products = []
-    
     with pdfplumber.open(pdf_path) as pdf:
         total_pages = len(pdf.pages)
-        print(f"Total pages: {total_pages}")
-        
-        # Process all 45 pages (1 product per page)
-        for page_num in range(1, min(46, total_pages + 1)):
-            try:
-                product = extract_product_from_page(pdf, page_num)
-                
-                if product:
-                    all_products.append(product)
-                    print(f"SUCCESS: Added {product['productCode']}")
-                else:
-                    print(f"WARNING: Skipped page {page_num}")
-            except Exception as e:
-                print(f"ERROR on page {page_num}: {e}")
-                continue
+    print(f"Total pages: {total_pages}")
+    
+    # Process all 45 pages (1 product per page)
+    page_numbers = list(range(1, min(46, total_pages + 1)))
+    report = RunReport('extract_all_anchors', pdf_path)
+    workers = args.workers
+    profiler = None
+    if args.profile:
+        # cProfile only sees this process, so keep every page in it
+        if workers not in (None, 1):
+            print(f"⚠️  --profile runs in one process; ignoring --workers {workers}")
+        workers = 1
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        products = extract_pages(pdf_path, page_numbers, extract_page_safely,
+                                 workers=workers, cache=cache, report=report)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+    report.finish()
+    
+    all_products = []
+    for page_num, product in zip(page_numbers, products):
+        if product:
+            all_products.append(product)
+            print(f"SUCCESS: Added {product['productCode']}")
+        else:
+            print(f"WARNING: Skipped page {page_num}")
     
     # Save to JSON
     output_data = {
@@ -272,17 +386,28 @@ def main():
     
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    # Pretty source plus the compact copy the site loads (data/min/)
+    compact_path = write_catalog(output_path, output_data)
     
     print(f"\n{'='*60}")
     print(f"SUCCESS! Saved {len(all_products)} products to: {output_path}")
+    print(f"Compact site copy: {compact_path}")
     print(f"{'='*60}")
     
     # Summary
     print("\nProduct Summary:")
     for product in all_products:
         print(f"  - {product['productCode']}: {len(product['variants'])} variants")
+    
+    if cache is not None:
+        cache.report()
+    
+    report.summary()
+    print(f"Run report: {report.write(args.report)}")
+    if profiler is not None:
+        args.profile.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(args.profile)
+        print(f"Profile: {args.profile} (python -m pstats {args.profile})")
 
 if __name__ == '__main__':
     main()
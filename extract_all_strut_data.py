@@ -1,108 +1,138 @@
 """
 Extract technical data from ALL Strut Channel PDF pages and update JSON catalog
 This processes pages 3, 5, 7, 9, 11, 13, 15, 17, 19, 21, 23, 25, 27, 29
+
+Usage:
+    python extract_all_strut_data.py [--pages 3 5 7] [--workers 4] [--dry-run] [--no-cache]
+    python extract_all_strut_data.py --report .cache/reports/strut.json
 """
 
+import argparse
 import json
 import re
 import pdfplumber
 from pathlib import Path
 
+from compact_json import write_catalog
+from pdf_engine import extract_pages
+from pdf_page_cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, PageCache
+from pdf_run_report import DEFAULT_REPORT_DIR, RunReport, count, stage
+
+DEFAULT_PDF = Path("Product-Catalogues-PDF/Greenman Strut Channel GM41 Series.pdf")
+DEFAULT_CATALOG = Path("data/strut-channel-catalog.json")
+# Pages to process: 3, 5, 7, 9, 11, 13, 15, 17, 19, 21, 23, 25, 27, 29
+DEFAULT_PAGES = list(range(3, 30, 2))
+DEFAULT_REPORT = DEFAULT_REPORT_DIR / "strut.json"
+# Bump when the text/table extraction settings change so cached pages are re-parsed
+EXTRACTOR_VERSION = "strut-1"
+
 def extract_product_data_from_page(pdf_path, page_number):
     """
     Extract technical data from a single PDF page
-    Returns a dictionary with the product identification and properties
+    Opens the PDF just for this page - use process_all_pages for full runs
     """
     with pdfplumber.open(pdf_path) as pdf:
         if page_number > len(pdf.pages):
             print(f"❌ Page {page_number} does not exist in PDF")
             return None
         
-        page = pdf.pages[page_number - 1]  # 0-indexed
+        return extract_product_data(pdf.pages[page_number - 1], page_number)
+
+
+def extract_product_data(page, page_number):
+    """
+    Extract technical data from an already opened PDF page
+    Returns a dictionary with the product identification and properties
+    """
+    with stage('extract_text'):
         text = page.extract_text()
-        
-        if not text:
-            print(f"❌ Could not extract text from page {page_number}")
-            return None
-        
-        # Extract product identification from title (e.g., "Strut Profile GM412115")
-        title_match = re.search(r'Strut Profile (GM[A-Z]?\d+)', text, re.IGNORECASE)
-        if not title_match:
-            print(f"❌ Could not find product identification on page {page_number}")
-            return None
-        
-        identification = title_match.group(1).upper()
-        
-        # Try to extract table data first
+    
+    if not text:
+        print(f"❌ Could not extract text from page {page_number}")
+        return None
+    
+    # Extract product identification from title (e.g., "Strut Profile GM412115")
+    title_match = re.search(r'Strut Profile (GM[A-Z]?\d+)', text, re.IGNORECASE)
+    if not title_match:
+        print(f"❌ Could not find product identification on page {page_number}")
+        return None
+    
+    identification = title_match.group(1).upper()
+    
+    # Try to extract table data first
+    with stage('extract_tables'):
         tables = page.extract_tables()
+    
+    properties = None
+    for table in tables:
+        if not table:
+            continue
         
-        properties = None
-        for table in tables:
-            if not table:
-                continue
-            
-            # Look for the row with the identification
-            for row in table:
-                if row and identification in str(row[0] or ''):
-                    # Parse the values (handling different table formats)
-                    try:
-                        # Parse each field carefully - "00" for length means 3.6m standard
-                        properties = {
-                            "identification": identification,
-                            "weight_kg_m": float(row[1]) if row[1] and row[1] not in ['—', '', None] else None,
-                            "length_mtr": 3.6 if row[2] in ['00', '0', ''] else (float(row[2]) if row[2] and row[2] != '—' else None),
-                            "area_mm2": int(row[3]) if row[3] and row[3] not in ['—', '', None] else None,
-                            "cd_mm": float(row[4]) if row[4] and row[4] not in ['—', '', None] else None,
-                            "iz_mm4": int(row[5]) if row[5] and row[5] not in ['—', '', None] else None,
-                            "iy_mm4": int(row[6]) if row[6] and row[6] not in ['—', '', None] else None,
-                            "wy_mm3": int(row[7]) if row[7] and row[7] not in ['—', '', None] else None,
-                            "wz_mm3": int(row[8]) if row[8] and row[8] not in ['—', '', None] else None,
-                        }
-                        
-                        # Extract size from Type line
-                        size_match = re.search(r'Type GM41 (\d+)\s+(\d+\.?\d*)', text)
-                        if size_match:
-                            properties["size"] = f"41x{size_match.group(1)}x{size_match.group(2)}"
-                        else:
-                            # Try to find size pattern like "41x21x1.5"
-                            size_match2 = re.search(r'(\d+)x(\d+)x(\d+\.?\d*)', text)
-                            if size_match2:
-                                properties["size"] = size_match2.group(0)
-                        
-                        return properties
-                        
-                    except (ValueError, IndexError) as e:
-                        continue
-        
-        # If table extraction failed, try regex pattern matching
-        pattern = rf'{identification}\s+(\d+\.?\d*)\s+(\d+\.?\d*)\s+(\d+)\s+(\d+\.?\d*)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)'
+        # Look for the row with the identification
+        for row in table:
+            if row and identification in str(row[0] or ''):
+                # Parse the values (handling different table formats)
+                try:
+                    # Parse each field carefully - "00" for length means 3.6m standard
+                    properties = {
+                        "identification": identification,
+                        "weight_kg_m": float(row[1]) if row[1] and row[1] not in ['—', '', None] else None,
+                        "length_mtr": 3.6 if row[2] in ['00', '0', ''] else (float(row[2]) if row[2] and row[2] != '—' else None),
+                        "area_mm2": int(row[3]) if row[3] and row[3] not in ['—', '', None] else None,
+                        "cd_mm": float(row[4]) if row[4] and row[4] not in ['—', '', None] else None,
+                        "iz_mm4": int(row[5]) if row[5] and row[5] not in ['—', '', None] else None,
+                        "iy_mm4": int(row[6]) if row[6] and row[6] not in ['—', '', None] else None,
+                        "wy_mm3": int(row[7]) if row[7] and row[7] not in ['—', '', None] else None,
+                        "wz_mm3": int(row[8]) if row[8] and row[8] not in ['—', '', None] else None,
+                    }
+                    
+                    # Extract size from Type line
+                    size_match = re.search(r'Type GM41 (\d+)\s+(\d+\.?\d*)', text)
+                    if size_match:
+                        properties["size"] = f"41x{size_match.group(1)}x{size_match.group(2)}"
+                    else:
+                        # Try to find size pattern like "41x21x1.5"
+                        size_match2 = re.search(r'(\d+)x(\d+)x(\d+\.?\d*)', text)
+                        if size_match2:
+                            properties["size"] = size_match2.group(0)
+                    
+                    count('properties_from_table')
+                    return properties
+                    
+                except (ValueError, IndexError) as e:
+                    continue
+    
+    # If table extraction failed, try regex pattern matching
+    pattern = rf'{identification}\s+(\d+\.?\d*)\s+(\d+\.?\d*)\s+(\d+)\s+(\d+\.?\d*)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)'
+    with stage('table_regex'):
         match = re.search(pattern, text)
+    
+    if match:
+        # "00" in length field means standard 3.6m
+        length_val = match.group(2)
+        length_parsed = 3.6 if length_val in ['00', '0'] else float(length_val)
         
-        if match:
-            # "00" in length field means standard 3.6m
-            length_val = match.group(2)
-            length_parsed = 3.6 if length_val in ['00', '0'] else float(length_val)
-            
-            properties = {
-                "identification": identification,
-                "weight_kg_m": float(match.group(1)),
-                "length_mtr": length_parsed,
-                "area_mm2": int(match.group(3)),
-                "cd_mm": float(match.group(4)),
-                "iz_mm4": int(match.group(5)),
-                "iy_mm4": int(match.group(6)),
-                "wy_mm3": int(match.group(7)),
-                "wz_mm3": int(match.group(8)),
-            }
-            
-            # Extract size
-            size_match = re.search(r'Type GM41 (\d+)\s+(\d+\.?\d*)', text)
-            if size_match:
-                properties["size"] = f"41x{size_match.group(1)}x{size_match.group(2)}"
-            
-            return properties
+        properties = {
+            "identification": identification,
+            "weight_kg_m": float(match.group(1)),
+            "length_mtr": length_parsed,
+            "area_mm2": int(match.group(3)),
+            "cd_mm": float(match.group(4)),
+            "iz_mm4": int(match.group(5)),
+            "iy_mm4": int(match.group(6)),
+            "wy_mm3": int(match.group(7)),
+            "wz_mm3": int(match.group(8)),
+        }
         
-        return None
+        # Extract size
+        size_match = re.search(r'Type GM41 (\d+)\s+(\d+\.?\d*)', text)
+        if size_match:
+            properties["size"] = f"41x{size_match.group(1)}x{size_match.group(2)}"
+        
+        count('properties_from_text')
+        return properties
+    
+    return None
 
 
 def update_catalog_json(catalog_path, identification, properties):
@@ -125,12 +155,17 @@ def update_catalog_json(catalog_path, identification, properties):
     return False
 
 
-def process_all_pages():
+def process_all_pages(pdf_path=DEFAULT_PDF, catalog_path=DEFAULT_CATALOG,
+                      pages_to_process=DEFAULT_PAGES, workers=None, dry_run=False, cache=None,
+                      report_path=None):
     """
-    Process all odd pages from 3 to 29 (3, 5, 7, 9, ..., 29)
+    Process the given pages (default: odd pages 3 to 29) across a process pool
+    Each worker opens the PDF once; results are merged in page order.
+    Pass a PageCache to skip re-parsing pages that have not changed, and a
+    report_path to write the per-page stage times and counters.
     """
-    pdf_path = Path("Product-Catalogues-PDF/Greenman Strut Channel GM41 Series.pdf")
-    catalog_path = Path("data/strut-channel-catalog.json")
+    pdf_path = Path(pdf_path)
+    catalog_path = Path(catalog_path)
     
     if not pdf_path.exists():
         print(f"❌ PDF file not found: {pdf_path}")
@@ -141,12 +176,9 @@ def process_all_pages():
         return
     
     print("=" * 70)
-    print("Processing all Strut Channel product pages (3, 5, 7, 9, ..., 29)")
+    print(f"Processing {len(pages_to_process)} Strut Channel product pages")
     print("=" * 70)
     
-    # Pages to process: 3, 5, 7, 9, 11, 13, 15, 17, 19, 21, 23, 25, 27, 29
-    pages_to_process = list(range(3, 30, 2))
-    
     results = {
         'success': [],
         'failed': []
@@ -156,10 +188,13 @@ def process_all_pages():
     with open(catalog_path, 'r', encoding='utf-8') as f:
         catalog = json.load(f)
     
-    for page_num in pages_to_process:
-        print(f"\n📄 Processing page {page_num}...")
-        
-        properties = extract_product_data_from_page(pdf_path, page_num)
+    report = RunReport('extract_all_strut_data', pdf_path)
+    extracted = extract_pages(pdf_path, pages_to_process, extract_product_data,
+                              workers=workers, cache=cache, report=report)
+    report.finish()
+    
+    for page_num, properties in zip(pages_to_process, extracted):
+        print(f"\n📄 Page {page_num}...")
         
         if properties:
             identification = properties['identification']
@@ -184,9 +219,11 @@ def process_all_pages():
             results['failed'].append(f"Page {page_num}")
     
     # Write updated catalog back to file
-    print("\n💾 Saving updated catalog...")
-    with open(catalog_path, 'w', encoding='utf-8') as f:
-        json.dump(catalog, f, indent=2)
+    if dry_run:
+        print("\n🔎 Dry run - catalog not written")
+    else:
+        print("\n💾 Saving updated catalog...")
+        write_catalog(catalog_path, catalog)
     
     # Print summary
     print("\n" + "=" * 70)
@@ -200,12 +237,36 @@ def process_all_pages():
         print(f"\n❌ Failed: {len(results['failed'])} items")
         print(f"   {', '.join(results['failed'])}")
     
+    if cache is not None:
+        cache.report()
+    
+    if report_path:
+        report.summary()
+        print(f"Run report: {report.write(report_path)}")
+    
     print("\n✨ Done!")
 
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Extract strut profile properties from the GM41 catalogue PDF")
+    parser.add_argument('--pdf', type=Path, default=DEFAULT_PDF, help="catalogue PDF to read")
+    parser.add_argument('--catalog', type=Path, default=DEFAULT_CATALOG, help="catalog JSON to update")
+    parser.add_argument('--pages', type=int, nargs='+', default=DEFAULT_PAGES,
+                        help="1-based page numbers to process (default: 3 5 7 ... 29)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: one per core, 1 = no pool)")
+    parser.add_argument('--dry-run', action='store_true', help="extract and report without writing the catalog")
+    parser.add_argument('--no-cache', action='store_true', help="re-parse every page, ignoring the page cache")
+    parser.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE_DIR, help="page cache directory")
+    parser.add_argument('--cache-max-mb', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help="evict least recently used pages beyond this size")
+    parser.add_argument('--report', type=Path, default=DEFAULT_REPORT,
+                        help="JSON run report of per-page stage times and counters")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    response = input("This will process pages 3-29 and update the catalog JSON. Continue? (y/n): ")
-    if response.lower() == 'y':
-        process_all_pages()
-    else:
-        print("Cancelled.")
+    args = parse_args()
+    cache = None if args.no_cache else PageCache(args.cache_dir, args.cache_max_mb * 1024 * 1024, EXTRACTOR_VERSION)
+    process_all_pages(args.pdf, args.catalog, args.pages, workers=args.workers, dry_run=args.dry_run, cache=cache,
+                      report_path=args.report)
@@ -0,0 +1,81 @@
+// Anchor selection index - filters GreenBolt anchors by load and fixture thickness
+// Reads data/anchor-index.json written by `python anchor_index.py build`.
+// Rows are pre-sorted by size, so every result list is in size order.
+class AnchorIndex {
+    // Query keyword -> column it sets a minimum on (same as LIMITS in anchor_index.py)
+    static LIMITS = {
+        tensile: 'tensileLoadKN',
+        shear: 'shearLoadKN',
+        fixture: 'maxFixtureThickness'
+    };
+
+    constructor(indexUrl = 'data/anchor-index.json') {
+        this.indexUrl = indexUrl;
+        this.index = null;
+        this.columns = null;
+    }
+
+    async load() {
+        if (!this.index) {
+            const response = await fetch(this.indexUrl);
+            if (!response.ok) throw new Error(`${this.indexUrl}: HTTP ${response.status}`);
+            this.index = await response.json();
+
+            // One typed array per column; null (not published) becomes NaN and fails every limit
+            this.columns = {};
+            for (const [column, values] of Object.entries(this.index.columns)) {
+                this.columns[column] = Float64Array.from(values, value => (value === null ? NaN : value));
+            }
+        }
+        return this.index;
+    }
+
+    get size() {
+        return this.index ? this.index.codes.length : 0;
+    }
+
+    // Row positions matching { tensile, shear, fixture } minimums (missing = no limit).
+    // A limit that is not a finite number throws, as read_limit in anchor_index.py rejects it.
+    matchRows(limits = {}) {
+        const checks = Object.entries(AnchorIndex.LIMITS)
+            .filter(([key]) => limits[key] !== undefined && limits[key] !== null && String(limits[key]).trim() !== '')
+            .map(([key, column]) => {
+                const minimum = Number(limits[key]);
+                if (!Number.isFinite(minimum)) throw new RangeError(`invalid input: ${key} (${limits[key]})`);
+                return [this.columns[column], minimum];
+            });
+
+        const rows = [];
+        for (let i = 0; i < this.size; i++) {
+            // NaN >= x is false, so unpublished values never match
+            if (checks.every(([values, minimum]) => values[i] >= minimum)) rows.push(i);
+        }
+        return rows;
+    }
+
+    record(i) {
+        const [family, name] = this.index.families[this.index.family[i]];
+        const record = { productCode: this.index.codes[i], family, name, size: this.index.sizes[i] };
+        for (const column of Object.keys(this.index.columns)) {
+            record[column] = this.index.columns[column][i];
+        }
+        return record;
+    }
+
+    // All anchors with tensile >= tensile kN, shear >= shear kN, max fixture >= fixture mm
+    async query(limits = {}) {
+        await this.load();
+        return this.matchRows(limits).map(i => this.record(i));
+    }
+
+    // A whole fixing schedule: [{ tensile, shear, fixture }, ...] -> one result list per entry
+    async queryBatch(schedule) {
+        await this.load();
+        return schedule.map(limits => this.matchRows(limits).map(i => this.record(i)));
+    }
+}
+
+// Export for use in HTML pages
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = AnchorIndex;
+}
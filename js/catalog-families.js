@@ -0,0 +1,89 @@
+// Per-family catalogue loader
+// Reads the manifest written by build_clamp_families.py and fetches one
+// product family at a time instead of the whole catalogue.
+// Requires js/product-renderer.js for ProductRenderer.decodeColumnar
+class CatalogFamilies {
+    constructor(baseUrl = 'data/ggip/') {
+        this.baseUrl = baseUrl;
+        this.manifest = null;
+        this.cache = new Map();
+    }
+
+    async loadManifest() {
+        if (!this.manifest) {
+            const response = await fetch(this.baseUrl + 'manifest.json');
+            if (!response.ok) throw new Error(`manifest.json: HTTP ${response.status}`);
+            this.manifest = ProductRenderer.decodeColumnar(await response.json());
+        }
+        return this.manifest;
+    }
+
+    // Family key from the URL (?product=ggcp), falling back to the default family
+    async resolveKey(key) {
+        const manifest = await this.loadManifest();
+        return key && manifest.families[key] ? key : manifest.default;
+    }
+
+    // URL of a family's file, for loaders that fetch it themselves (js/catalog-worker.js)
+    async familyUrl(key) {
+        const familyKey = await this.resolveKey(key);
+        return this.baseUrl + this.manifest.families[familyKey].file;
+    }
+
+    async getFamily(key) {
+        const familyKey = await this.resolveKey(key);
+        if (!this.cache.has(familyKey)) {
+            const file = this.manifest.families[familyKey].file;
+            const request = fetch(this.baseUrl + file).then(response => {
+                if (!response.ok) throw new Error(`${file}: HTTP ${response.status}`);
+                return response.json();
+            }).then(data => ProductRenderer.decodeColumnar(data));
+            request.catch(() => this.cache.delete(familyKey));
+            this.cache.set(familyKey, request);
+        }
+        return this.cache.get(familyKey);
+    }
+
+    // Warm the HTTP cache for a family without blocking anything
+    prefetch(key) {
+        if (!this.manifest || !this.manifest.families[key]) return;
+        const href = this.baseUrl + this.manifest.families[key].file;
+        if (document.querySelector(`link[rel="prefetch"][href="${href}"]`)) return;
+
+        const link = document.createElement('link');
+        link.rel = 'prefetch';
+        link.as = 'fetch';
+        link.href = href;
+        document.head.appendChild(link);
+    }
+
+    // Prefetch the family behind each matching link once it nears the viewport
+    async observeLinks(selector = 'a[href*="greengrip-ggip-catalog.html"]', rootMargin = '300px') {
+        const links = document.querySelectorAll(selector);
+        if (links.length === 0) return;
+
+        const manifest = await this.loadManifest();
+        const familyOf = link => new URL(link.href, window.location.href).searchParams.get('product') || manifest.default;
+
+        if (!('IntersectionObserver' in window)) {
+            links.forEach(link => this.prefetch(familyOf(link)));
+            return;
+        }
+
+        const observer = new IntersectionObserver(entries => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting) {
+                    this.prefetch(familyOf(entry.target));
+                    observer.unobserve(entry.target);
+                }
+            });
+        }, { rootMargin });
+
+        links.forEach(link => observer.observe(link));
+    }
+}
+
+// Export for use in HTML pages
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = CatalogFamilies;
+}
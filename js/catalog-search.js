@@ -0,0 +1,147 @@
+// Catalogue search - answers product code / name / size queries locally
+// The index is generated by build_search_index.py into data/search/index.json
+class CatalogSearch {
+    constructor(indexUrl = 'data/search/index.json') {
+        this.indexUrl = indexUrl;
+        this.index = null;
+        this.loading = null;
+    }
+
+    // Same rules as tokenize() in build_search_index.py
+    static tokenize(text, withParts = true) {
+        const tokens = [];
+        for (const token of String(text).toLowerCase().match(/[a-z0-9]+(?:\.[0-9]+)?/g) || []) {
+            tokens.push(token);
+            const parts = token.match(/[a-z]+|[0-9]+(?:\.[0-9]+)?/g);
+            if (withParts && parts.length > 1) {
+                tokens.push(...parts.filter(part => part.length > 1 || /^[0-9]$/.test(part)));
+            }
+        }
+        return tokens;
+    }
+
+    async load() {
+        if (this.index) return this.index;
+        if (!this.loading) {
+            this.loading = fetch(this.indexUrl).then(response => {
+                if (!response.ok) throw new Error(`${this.indexUrl}: HTTP ${response.status}`);
+                return response.json();
+            }).then(index => {
+                // Undo the delta encoding once so each query is just lookups
+                index.postings = index.postings.map(deltas => {
+                    let id = 0;
+                    return deltas.map(delta => (id += delta));
+                });
+                index.ranged = index.docs
+                    .map((doc, id) => (doc[4] === null ? -1 : id))
+                    .filter(id => id >= 0);
+                this.index = index;
+                return index;
+            });
+            this.loading.catch(() => { this.loading = null; });
+        }
+        return this.loading;
+    }
+
+    // First position in the sorted vocabulary that is >= prefix
+    lowerBound(prefix) {
+        const terms = this.index.terms;
+        let low = 0, high = terms.length;
+        while (low < high) {
+            const mid = (low + high) >> 1;
+            if (terms[mid] < prefix) low = mid + 1; else high = mid;
+        }
+        return low;
+    }
+
+    // Doc ids with any term starting with the token; a bare number also
+    // matches clamps whose range covers it
+    matchToken(token) {
+        const { terms, postings, docs, ranged } = this.index;
+        const ids = new Set();
+        for (let i = this.lowerBound(token); i < terms.length && terms[i].startsWith(token); i++) {
+            postings[i].forEach(id => ids.add(id));
+        }
+        if (/^[0-9]+(\.[0-9]+)?$/.test(token)) {
+            const value = parseFloat(token);
+            ranged.forEach(id => {
+                if (docs[id][4] <= value && value <= docs[id][5]) ids.add(id);
+            });
+        }
+        return ids;
+    }
+
+    // Returns [{ code, name, size, url }], best matches first
+    search(query, limit = 20) {
+        if (!this.index) return [];
+        const tokens = [...new Set(CatalogSearch.tokenize(query, false))];
+        if (tokens.length === 0) return [];
+
+        // Every query token must match; start from the rarest
+        const matches = tokens.map(token => this.matchToken(token)).sort((a, b) => a.size - b.size);
+        let ids = [...matches[0]];
+        for (const other of matches.slice(1)) {
+            ids = ids.filter(id => other.has(id));
+        }
+
+        const compact = query.toLowerCase().replace(/[^a-z0-9.]/g, '');
+        const score = id => {
+            const code = this.index.docs[id][0].toLowerCase();
+            if (code === compact) return 0;
+            if (code.startsWith(compact)) return 1;
+            return 2;
+        };
+
+        return ids
+            .map(id => [score(id), this.index.docs[id][0].length, id])
+            .sort((a, b) => a[0] - b[0] || a[1] - b[1] || a[2] - b[2])
+            .slice(0, limit)
+            .map(([, , id]) => {
+                const [code, nameId, size, pageId] = this.index.docs[id];
+                return { code, name: this.index.names[nameId], size, url: this.index.pages[pageId] };
+            });
+    }
+
+    // Wire a text input to a results container
+    attach(input, results) {
+        const escape = text => String(text).replace(/[&<>"]/g, c => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;' }[c]));
+
+        const render = () => {
+            const query = input.value.trim();
+            const hits = query ? this.search(query) : [];
+            if (!query) {
+                results.hidden = true;
+                results.innerHTML = '';
+                return;
+            }
+            results.innerHTML = hits.length
+                ? hits.map(hit => `
+                    <a href="${escape(hit.url)}" class="nav__search-result">
+                        <strong>${escape(hit.code)}</strong>
+                        <span>${escape(hit.name)}${hit.size ? ` &middot; ${escape(hit.size)}` : ''}</span>
+                    </a>`).join('')
+                : '<div class="nav__search-empty">No matching products</div>';
+            results.hidden = false;
+        };
+
+        this.load().then(render).catch(error => console.error('Error loading search index:', error));
+        input.addEventListener('input', render);
+        input.addEventListener('keydown', event => {
+            if (event.key === 'Enter') {
+                const first = results.querySelector('a');
+                if (first) window.location.href = first.href;
+            } else if (event.key === 'Escape') {
+                results.hidden = true;
+            }
+        });
+        document.addEventListener('click', event => {
+            if (!results.contains(event.target) && event.target !== input) results.hidden = true;
+        });
+        input.addEventListener('focus', () => { if (input.value.trim()) render(); });
+    }
+}
+
+// Export for use in HTML pages
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = CatalogSearch;
+}
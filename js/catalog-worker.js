@@ -0,0 +1,173 @@
+// Catalogue loading off the main thread
+// The same file is the worker and its page-side client. In a page it defines
+// CatalogWorker; loaded with new Worker() it fetches a catalogue, decodes the
+// compact columns, picks the requested part and builds the HTML, posting it
+// back in batches. Each batch is a separate message (a separate task on the
+// page), so scrolling and the navbar menus keep responding while a large
+// catalogue loads; the page only inserts ready-made fragments.
+//
+// Requests (page -> worker):
+//   { id, type: 'load',     url, select }                  -> data
+//   { id, type: 'rows',     url, select, builder, batch }  -> data, then <tr> batches
+//   { id, type: 'category', url, category, batch }         -> product fragment batches
+// Replies (worker -> page): { id, type: 'data' | 'html' | 'done' | 'error', ... }
+//
+//   CatalogWorker.shared().rows('data/ggip/ggcp.json', {
+//       builder: 'ggip',
+//       onData: data => renderHeader(data),
+//       onHtml: html => TableWindow.insert(tbody, html, labels)
+//   });
+
+if (typeof WorkerGlobalScope !== 'undefined' && self instanceof WorkerGlobalScope) {
+    // ---- worker side ----
+    importScripts('product-renderer.js', 'responsive-images.js');
+
+    // Row builders by name: script to import and the (products) => rowCells factory it defines
+    const ROW_BUILDERS = {
+        ggip: ['ggip-table-rows.js', () => ggipRowCells]
+    };
+
+    const send = (id, type, fields = {}) => self.postMessage({ id, type, ...fields });
+
+    // Fetch and decode a catalogue; select picks a top-level part (a GGIP family) when present
+    const fetchCatalog = async (url, select) => {
+        const response = await fetch(url);
+        if (!response.ok) throw new Error(`${url}: HTTP ${response.status}`);
+        const data = ProductRenderer.decodeColumnar(await response.json());
+        return select && data[select] ? data[select] : data;
+    };
+
+    // Post fragments in groups of batch, joined into one string each
+    const sendBatches = (id, fragments, batch) => {
+        for (let start = 0; start < fragments.length; start += batch) {
+            send(id, 'html', { html: fragments.slice(start, start + batch).join(''), start });
+        }
+    };
+
+    const HANDLERS = {
+        async load({ id, url, select }) {
+            send(id, 'data', { data: await fetchCatalog(url, select) });
+        },
+
+        async rows({ id, url, select, builder, field = 'products', batch = 100 }) {
+            const data = await fetchCatalog(url, select);
+            send(id, 'data', { data });
+
+            const items = data[field] || [];
+            if (items.length === 0) return;
+            const [script, factory] = ROW_BUILDERS[builder];
+            importScripts(script);
+            const rowCells = factory()(items);
+            sendBatches(id, items.map((item, i) => `<tr>${rowCells(item, i)}</tr>`), batch);
+        },
+
+        async category({ id, url, category, base, batch = 4 }) {
+            ResponsiveImages.manifestUrl = new URL(ResponsiveImages.manifestUrl, base).href;
+            const renderer = new ProductRenderer(url);
+            if (!await renderer.loadData()) throw new Error(`${url}: could not load`);
+
+            const found = renderer.getCategoryById(category);
+            if (!found) throw new Error(`Category not found: ${category}`);
+            sendBatches(id, found.products.map((product, index) =>
+                renderer.renderProduct(product, found.badge, category, index % 2 !== 0, false, found.catalogPdf)
+            ), batch);
+        }
+    };
+
+    self.onmessage = async (event) => {
+        const message = event.data;
+        try {
+            await HANDLERS[message.type](message);
+            send(message.id, 'done');
+        } catch (error) {
+            send(message.id, 'error', { message: error.message });
+        }
+    };
+} else {
+    // ---- page side ----
+    class CatalogWorker {
+        constructor(scriptUrl = 'js/catalog-worker.js') {
+            this.scriptUrl = scriptUrl;
+            this.worker = null;
+            this.requests = new Map();
+            this.nextId = 1;
+        }
+
+        static supported() {
+            return typeof Worker !== 'undefined';
+        }
+
+        // One worker per page, started on first use
+        static shared() {
+            if (!CatalogWorker.instance) CatalogWorker.instance = new CatalogWorker();
+            return CatalogWorker.instance;
+        }
+
+        start() {
+            if (this.worker) return this.worker;
+            this.worker = new Worker(this.scriptUrl);
+            this.worker.onmessage = (event) => this.dispatch(event.data);
+            this.worker.onerror = (event) => {
+                // The script failed to load or threw outside a request: fail everything pending
+                event.preventDefault();
+                const error = new Error(event.message || 'catalog worker failed');
+                this.requests.forEach(request => request.reject(error));
+                this.requests.clear();
+                this.worker.terminate();
+                this.worker = null;
+            };
+            return this.worker;
+        }
+
+        dispatch({ id, type, data, html, start, message }) {
+            const request = this.requests.get(id);
+            if (!request) return;
+            if (type === 'data') {
+                request.data = data;
+                if (request.onData) request.onData(data);
+            } else if (type === 'html') {
+                if (request.onHtml) request.onHtml(html, start);
+            } else {
+                this.requests.delete(id);
+                if (type === 'done') request.resolve(request.data);
+                else request.reject(new Error(message));
+            }
+        }
+
+        // Send a request; URLs are made absolute, the worker's base is js/
+        request(message, handlers = {}) {
+            return new Promise((resolve, reject) => {
+                const id = this.nextId++;
+                this.requests.set(id, { ...handlers, resolve, reject, data: null });
+                this.start().postMessage({
+                    ...message,
+                    id,
+                    url: new URL(message.url, window.location.href).href,
+                    base: window.location.href
+                });
+            });
+        }
+
+        // Fetched and decoded catalogue (or its select part)
+        load(url, select = null) {
+            return this.request({ type: 'load', url, select });
+        }
+
+        // Catalogue data to onData, then its table rows as <tr> markup to onHtml in batches
+        rows(url, { select = null, builder, field, batch, onData, onHtml } = {}) {
+            return this.request({ type: 'rows', url, select, builder, field, batch }, { onData, onHtml });
+        }
+
+        // ProductRenderer.renderProduct() markup for a category's products, in batches
+        category(url, category, { batch, onHtml } = {}) {
+            return this.request({ type: 'category', url, category, batch }, { onHtml });
+        }
+    }
+
+    // Export for use in HTML pages
+    if (typeof module !== 'undefined' && module.exports) {
+        module.exports = CatalogWorker;
+    } else {
+        window.CatalogWorker = CatalogWorker;
+    }
+}
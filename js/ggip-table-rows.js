@@ -0,0 +1,291 @@
+// GreenGrip GGIP product table rows
+// The cells of one product table row for every GGIP family layout (GGID,
+// GGWM, GGDL, GGDM, GGCGL/GGCGS, GGRI/GGPUI, GGUB, GGSMU, GGSM, GGRR and the
+// clamping range families). Shared by js/greengrip-ggip-renderer.js and
+// js/catalog-worker.js, so it must not touch the DOM.
+
+// (product) => '<td>...</td>...' for a family's products
+function ggipRowCells(products) {
+    // Check product type (the first product decides the table layout)
+    const hasForTube = products[0].hasOwnProperty('forTube');
+    const hasSize = products[0].hasOwnProperty('size');
+    const hasClampingRange = products[0].hasOwnProperty('clampingRange');
+    const hasMaxRecLoad = products[0].hasOwnProperty('maxRecLoad');
+    const hasMaxRec = products[0].hasOwnProperty('maxRec');
+    const hasS = products[0].hasOwnProperty('S') || products[0].hasOwnProperty('MStud');
+    const hasGeneralized = products[0].hasOwnProperty('generalized');
+    const hasThread = products[0].hasOwnProperty('thread');
+    const hasHeight = products[0].hasOwnProperty('height');
+    const hasPipeOuterDia = products[0].hasOwnProperty('pipeOuterDia');
+    const hasLocking = products[0].hasOwnProperty('locking');
+    const hasConnecting = products[0].hasOwnProperty('connecting');
+    const hasType = products[0].hasOwnProperty('type');
+    const hasMaterial = products[0].hasOwnProperty('material');
+    const hasLength = products[0].hasOwnProperty('length');
+
+    return (product) => {
+        // Handle GGID type products (has type + material object + length, no size/clampingRange/forTube)
+        if (hasType && hasMaterial && hasLength && typeof product.material === 'object' && !hasSize && !hasClampingRange && !hasForTube) {
+            let html = `
+                <td>${product.productCode || ''}</td>
+                <td>${product.type || ''}</td>
+                <td>${product.material?.PxS || ''}</td>
+                <td>${product.length?.Lmm || ''}</td>
+                <td>${product.packSize || ''}</td>
+                <td>${product.maxRec?.loadN || ''}</td>
+            `;
+            
+            return html;
+        }
+        
+        // Handle GGWM type products (has type + material object, no size/clampingRange/forTube)
+        if (hasType && hasMaterial && typeof product.material === 'object' && !hasSize && !hasClampingRange && !hasForTube) {
+            let html = `
+                <td>${product.productCode || ''}</td>
+                <td>${product.type || ''}</td>
+                <td>${product.material?.PxS || ''}</td>
+                <td>${product.packSize || ''}</td>
+                <td>${product.maxRec?.loadN || ''}</td>
+            `;
+            
+            return html;
+        }
+        
+        // Handle GGDL type products (has size + connecting object + dimensions with L field)
+        if (hasSize && hasConnecting && !hasClampingRange && !hasForTube && !hasGeneralized && !hasHeight) {
+            const dims = product.dimensions || {};
+            const dimFields = Object.keys(dims);
+            
+            if (dimFields.includes('L')) {
+                let html = `
+                    <td>${product.productCode || ''}</td>
+                    <td>${product.size?.mm || ''}</td>
+                    <td>${product.connecting?.thread || ''}</td>
+                    <td>${dims.PxS || ''}</td>
+                    <td>${dims.W || ''}</td>
+                    <td>${dims.H || ''}</td>
+                    <td>${dims.C || ''}</td>
+                    <td>${dims.L || ''}</td>
+                    <td>${dims.S || ''}</td>
+                    <td>${product.packSize || ''}</td>
+                    <td>${product.maxRec?.loadN || ''}</td>
+                `;
+                
+                return html;
+            }
+        }
+        
+        // Handle GGDM type products (has size + dimensions with Ø, no connecting object)
+        if (hasSize && !hasConnecting && !hasClampingRange && !hasForTube && !hasGeneralized && !hasHeight) {
+            const dims = product.dimensions || {};
+            const dimFields = Object.keys(dims);
+            
+            if (dimFields.includes('Ø') && dimFields.includes('PxS')) {
+                let html = `
+                    <td>${product.productCode || ''}</td>
+                    <td>${product.size?.mm || ''}</td>
+                    <td>${dims.PxS || ''}</td>
+                    <td>${dims.W || ''}</td>
+                    <td>${dims.H || ''}</td>
+                    <td>${dims.C || ''}</td>
+                    <td>${dims.Ø || ''}</td>
+                    <td>${product.packSize || ''}</td>
+                    <td>${product.maxRec?.loadN || ''}</td>
+                `;
+                
+                return html;
+            }
+        }
+        
+        // Handle GGCGL/GGCGS type products (has pipeOuterDia + thread object + locking)
+        if (hasPipeOuterDia && hasThread && hasLocking && typeof product.thread === 'object') {
+            const dims = product.dimensions || {};
+            
+            // Support both D1/D2 (GGCGL) and P1/P2 (GGCGS) naming
+            const thread1 = product.thread?.P1 || product.thread?.D1 || '';
+            const thread2 = product.thread?.P2 || product.thread?.D2 || '';
+            
+            let html = `
+                <td>${product.productCode || ''}</td>
+                <td>${product.pipeOuterDia?.DN || ''}</td>
+                <td>${product.pipeOuterDia?.Dmm || ''}</td>
+                <td>${product.pipeOuterDia?.inch || ''}</td>
+                <td>${thread1}</td>
+                <td>${thread2}</td>
+                <td>${dims.W || ''}</td>
+                <td>${dims.H || ''}</td>
+                <td>${dims.P || ''}</td>
+                <td>${dims.S || ''}</td>
+                <td>${product.locking?.screw || ''}</td>
+                <td>${product.maxRec?.loadN || ''}</td>
+                <td>${product.packSize || ''}</td>
+            `;
+            
+            return html;
+        }
+        // Handle GGRI/GGPUI type products (has pipeOuterDia but no thread object)
+        else if (hasPipeOuterDia) {
+            // Determine dimension fields (P/T for GGRI, T/L for GGPUI)
+            const dim1 = product.dimensions?.P || product.dimensions?.T || '';
+            const dim2 = product.dimensions?.T && product.dimensions?.P ? product.dimensions.T : product.dimensions?.L || '';
+            
+            let html = `
+                <td>${product.productCode || ''}</td>
+                <td>${product.pipeOuterDia?.DN || ''}</td>
+                <td>${product.pipeOuterDia?.Dmm || ''}</td>
+                <td>${product.pipeOuterDia?.inch || ''}</td>
+                <td>${dim1}</td>
+                <td>${dim2}</td>
+                <td>${product.packSize || ''}</td>
+                <td>${product.maxRec?.loadN || ''}</td>
+            `;
+            
+            return html;
+        }
+        // Handle GGUB type products (has size with 3 fields + thread + height)
+        else if (hasSize && hasThread && hasHeight && !hasClampingRange && !hasForTube) {
+            let html = `
+                <td>${product.productCode || ''}</td>
+                <td>${product.size?.mm || ''}</td>
+                <td>${product.size?.inch || ''}</td>
+                <td>${product.size?.DN || ''}</td>
+                <td>${product.thread?.G || ''}</td>
+                <td>${product.height?.H || ''}</td>
+                <td>${product.packSize || ''}</td>
+            `;
+            
+            return html;
+        }
+        // Handle GGSMU type products (has generalized field)
+        else if (hasGeneralized && hasSize && !hasClampingRange && !hasForTube) {
+            let html = `
+                <td>${product.productCode || ''}</td>
+                <td>${product.generalized || ''}</td>
+                <td>${product.size || ''}</td>
+                <td>${product.material || ''}</td>
+                <td>${product.packSize || ''}</td>
+                <td>${product.maxRec || ''}</td>
+            `;
+            
+            return html;
+        }
+        // Handle "Size" type products (like GGSM)
+        else if (hasSize && !hasClampingRange && !hasForTube && !hasGeneralized) {
+            const dims = product.dimensions || {};
+            
+            let html = `
+                <td>${product.productCode || ''}</td>
+                <td>${product.size?.mm || ''}</td>
+                <td>${dims.PxS || ''}</td>
+                <td>${dims.B || ''}</td>
+                <td>${dims.B1 || ''}</td>
+                <td>${dims.Ø || dims.G || ''}</td>
+                <td>${dims.H || ''}</td>
+                <td>${product.packSize || ''}</td>
+            `;
+            
+            return html;
+        }
+        // Handle "For Tube" type products (like GGRR)
+        else if (hasForTube) {
+            // Get dimension values
+            const dims = product.dimensions || {};
+            
+            let html = `
+                <td>${product.productCode || ''}</td>
+                <td>${product.DN || ''}</td>
+                <td>${product.forTube?.mm || ''}</td>
+                <td>${product.forTube?.inch || ''}</td>
+                <td>${dims.PxS || ''}</td>
+                <td>${dims.W || ''}</td>
+                <td>${dims.H || ''}</td>
+            `;
+            
+            // Add C and T columns only if they exist
+            if (dims.hasOwnProperty('C') || dims.hasOwnProperty('D')) {
+                html += `<td>${dims.C || dims.D || ''}</td>`;
+            }
+            if (dims.hasOwnProperty('T')) {
+                html += `<td>${dims.T || ''}</td>`;
+            }
+            
+            html += `
+                <td>${product.S || product.MStud || ''}</td>
+                <td>${product.packSize || ''}</td>
+            `;
+            
+            // Only add Max.Rec.Load if it exists
+            if (hasMaxRecLoad) {
+                html += `<td>${product.maxRecLoad || ''}</td>`;
+            }
+            
+            return html;
+        } 
+        // Handle regular clamping range products
+        else {
+            // Get clamping range values dynamically
+            let clampingCol1 = '';
+            let clampingCol2 = '';
+            
+            if (product.clampingRange) {
+                const fields = Object.keys(product.clampingRange);
+                
+                // First column: DN, D(mm), or mm
+                if (product.clampingRange.DN) {
+                    clampingCol1 = product.clampingRange.DN;
+                } else if (product.clampingRange['D(mm)']) {
+                    clampingCol1 = product.clampingRange['D(mm)'];
+                } else if (product.clampingRange.mm) {
+                    clampingCol1 = product.clampingRange.mm;
+                }
+                
+                // Second column: Ømm/Ø[mm] or inch
+                if (product.clampingRange['Ømm'] || product.clampingRange['Ø[mm]']) {
+                    clampingCol2 = product.clampingRange['Ømm'] || product.clampingRange['Ø[mm]'];
+                } else if (product.clampingRange.inch) {
+                    clampingCol2 = product.clampingRange.inch;
+                }
+            }
+            
+            // Get connecting thread or flange head
+            let connectingValue = '';
+            if (product.flageHead || product.flangeHead) {
+                // Extract just the value after "G (inch): "
+                const flangeText = product.flageHead || product.flangeHead;
+                connectingValue = flangeText.replace(/^G\s*\(inch\):\s*/i, '');
+            } else {
+                connectingValue = product.connectingSlotØ || product.connectingThread || '';
+            }
+            
+            // Get dimension values dynamically
+            const dims = product.dimensions || {};
+            const dimValues = [
+                dims.PxS || '',
+                dims.W || '',
+                dims.H || '',
+                dims.C || dims.D || '',  // Use D if C doesn't exist
+                dims.T || ''
+            ];
+            
+            return `
+                <td>${product.productCode || ''}</td>
+                <td>${clampingCol1}</td>
+                <td>${clampingCol2}</td>
+                <td>${connectingValue}</td>
+                <td>${dimValues[0]}</td>
+                <td>${dimValues[1]}</td>
+                <td>${dimValues[2]}</td>
+                <td>${dimValues[3]}</td>
+                <td>${dimValues[4]}</td>
+                <td>${product.S || product.MStud || ''}</td>
+                <td>${product.packSize || ''}</td>
+                <td>${product.maxRecLoad || ''}</td>
+            `;
+        }
+    };
+}
+
+// Export for use in HTML pages
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = ggipRowCells;
+}
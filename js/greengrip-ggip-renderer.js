@@ -1,13 +1,31 @@
 // Load and render GreenGrip GGIP catalog data
 
+const catalogFamilies = typeof CatalogFamilies !== 'undefined' ? new CatalogFamilies() : null;
+const catalogWorker = typeof CatalogWorker !== 'undefined' && CatalogWorker.supported() ? CatalogWorker.shared() : null;
+
 async function loadCatalogData() {
+    // Get product type from URL query parameter
+    const urlParams = new URLSearchParams(window.location.search);
+    const productType = urlParams.get('product');
+
     try {
-        const response = await fetch('data/greengrip-ggip-catalog.json');
-        const allData = await response.json();
-        
-        // Get product type from URL query parameter
-        const urlParams = new URLSearchParams(window.location.search);
-        const productType = urlParams.get('product');
+        // Fetch only the requested family (a few KB) via the split manifest
+        if (catalogFamilies) {
+            try {
+                if (catalogWorker) {
+                    await renderCatalogInWorker(await catalogFamilies.familyUrl(productType));
+                } else {
+                    renderCatalog(await catalogFamilies.getFamily(productType));
+                }
+                catalogFamilies.observeLinks();
+                return;
+            } catch (error) {
+                console.warn('Family files unavailable, loading full catalog:', error);
+            }
+        }
+
+        const response = await fetch('data/min/greengrip-ggip-catalog.json');
+        const allData = ProductRenderer.decodeColumnar(await response.json());
         
         // Select the appropriate product data based on query parameter
         let data;
@@ -24,7 +42,22 @@ async function loadCatalogData() {
     }
 }
 
-function renderCatalog(data) {
+// Fetch, decode and build the product rows in js/catalog-worker.js; the page
+// fills in the header and specification, then inserts the rows batch by batch
+function renderCatalogInWorker(url) {
+    const tbody = document.getElementById('productTableBody');
+    let labels = [];
+    return catalogWorker.rows(url, {
+        builder: 'ggip',
+        onData: data => {
+            renderCatalog(data, false);
+            labels = TableWindow.reset(tbody);
+        },
+        onHtml: html => TableWindow.insert(tbody, html, labels)
+    });
+}
+
+function renderCatalog(data, withTable = true) {
     // Update product name
     if (data.productName) {
         document.getElementById('productName').textContent = data.productName;
@@ -293,7 +326,7 @@ function renderCatalog(data) {
     }
 
     // Render product table
-    if (data.products && data.products.length > 0) {
+    if (withTable && data.products && data.products.length > 0) {
         renderProductTable(data.products);
     }
 }
@@ -1196,299 +1229,13 @@ function updateClampingRangeHeaders(firstProduct) {
 
 function renderProductTable(products) {
     const tbody = document.getElementById('productTableBody');
-    tbody.innerHTML = '';
-
-    if (!products || products.length === 0) return;
+    if (!products || products.length === 0) {
+        tbody.innerHTML = '';
+        return;
+    }
     
-    // Check product type
-    const hasForTube = products[0].hasOwnProperty('forTube');
-    const hasSize = products[0].hasOwnProperty('size');
-    const hasClampingRange = products[0].hasOwnProperty('clampingRange');
-    const hasMaxRecLoad = products[0].hasOwnProperty('maxRecLoad');
-    const hasMaxRec = products[0].hasOwnProperty('maxRec');
-    const hasS = products[0].hasOwnProperty('S') || products[0].hasOwnProperty('MStud');
-    const hasGeneralized = products[0].hasOwnProperty('generalized');
-    const hasThread = products[0].hasOwnProperty('thread');
-    const hasHeight = products[0].hasOwnProperty('height');
-    const hasPipeOuterDia = products[0].hasOwnProperty('pipeOuterDia');
-    const hasLocking = products[0].hasOwnProperty('locking');
-    const hasConnecting = products[0].hasOwnProperty('connecting');
-    const hasType = products[0].hasOwnProperty('type');
-    const hasMaterial = products[0].hasOwnProperty('material');
-    const hasLength = products[0].hasOwnProperty('length');
-
-    products.forEach(product => {
-        const row = document.createElement('tr');
-        
-        // Handle GGID type products (has type + material object + length, no size/clampingRange/forTube)
-        if (hasType && hasMaterial && hasLength && typeof product.material === 'object' && !hasSize && !hasClampingRange && !hasForTube) {
-            let html = `
-                <td>${product.productCode || ''}</td>
-                <td>${product.type || ''}</td>
-                <td>${product.material?.PxS || ''}</td>
-                <td>${product.length?.Lmm || ''}</td>
-                <td>${product.packSize || ''}</td>
-                <td>${product.maxRec?.loadN || ''}</td>
-            `;
-            
-            row.innerHTML = html;
-            tbody.appendChild(row);
-            return;
-        }
-        
-        // Handle GGWM type products (has type + material object, no size/clampingRange/forTube)
-        if (hasType && hasMaterial && typeof product.material === 'object' && !hasSize && !hasClampingRange && !hasForTube) {
-            let html = `
-                <td>${product.productCode || ''}</td>
-                <td>${product.type || ''}</td>
-                <td>${product.material?.PxS || ''}</td>
-                <td>${product.packSize || ''}</td>
-                <td>${product.maxRec?.loadN || ''}</td>
-            `;
-            
-            row.innerHTML = html;
-            tbody.appendChild(row);
-            return;
-        }
-        
-        // Handle GGDL type products (has size + connecting object + dimensions with L field)
-        if (hasSize && hasConnecting && !hasClampingRange && !hasForTube && !hasGeneralized && !hasHeight) {
-            const dims = product.dimensions || {};
-            const dimFields = Object.keys(dims);
-            
-            if (dimFields.includes('L')) {
-                let html = `
-                    <td>${product.productCode || ''}</td>
-                    <td>${product.size?.mm || ''}</td>
-                    <td>${product.connecting?.thread || ''}</td>
-                    <td>${dims.PxS || ''}</td>
-                    <td>${dims.W || ''}</td>
-                    <td>${dims.H || ''}</td>
-                    <td>${dims.C || ''}</td>
-                    <td>${dims.L || ''}</td>
-                    <td>${dims.S || ''}</td>
-                    <td>${product.packSize || ''}</td>
-                    <td>${product.maxRec?.loadN || ''}</td>
-                `;
-                
-                row.innerHTML = html;
-                tbody.appendChild(row);
-                return;
-            }
-        }
-        
-        // Handle GGDM type products (has size + dimensions with Ø, no connecting object)
-        if (hasSize && !hasConnecting && !hasClampingRange && !hasForTube && !hasGeneralized && !hasHeight) {
-            const dims = product.dimensions || {};
-            const dimFields = Object.keys(dims);
-            
-            if (dimFields.includes('Ø') && dimFields.includes('PxS')) {
-                let html = `
-                    <td>${product.productCode || ''}</td>
-                    <td>${product.size?.mm || ''}</td>
-                    <td>${dims.PxS || ''}</td>
-                    <td>${dims.W || ''}</td>
-                    <td>${dims.H || ''}</td>
-                    <td>${dims.C || ''}</td>
-                    <td>${dims.Ø || ''}</td>
-                    <td>${product.packSize || ''}</td>
-                    <td>${product.maxRec?.loadN || ''}</td>
-                `;
-                
-                row.innerHTML = html;
-                tbody.appendChild(row);
-                return;
-            }
-        }
-        
-        // Handle GGCGL/GGCGS type products (has pipeOuterDia + thread object + locking)
-        if (hasPipeOuterDia && hasThread && hasLocking && typeof product.thread === 'object') {
-            const dims = product.dimensions || {};
-            
-            // Support both D1/D2 (GGCGL) and P1/P2 (GGCGS) naming
-            const thread1 = product.thread?.P1 || product.thread?.D1 || '';
-            const thread2 = product.thread?.P2 || product.thread?.D2 || '';
-            
-            let html = `
-                <td>${product.productCode || ''}</td>
-                <td>${product.pipeOuterDia?.DN || ''}</td>
-                <td>${product.pipeOuterDia?.Dmm || ''}</td>
-                <td>${product.pipeOuterDia?.inch || ''}</td>
-                <td>${thread1}</td>
-                <td>${thread2}</td>
-                <td>${dims.W || ''}</td>
-                <td>${dims.H || ''}</td>
-                <td>${dims.P || ''}</td>
-                <td>${dims.S || ''}</td>
-                <td>${product.locking?.screw || ''}</td>
-                <td>${product.maxRec?.loadN || ''}</td>
-                <td>${product.packSize || ''}</td>
-            `;
-            
-            row.innerHTML = html;
-        }
-        // Handle GGRI/GGPUI type products (has pipeOuterDia but no thread object)
-        else if (hasPipeOuterDia) {
-            // Determine dimension fields (P/T for GGRI, T/L for GGPUI)
-            const dim1 = product.dimensions?.P || product.dimensions?.T || '';
-            const dim2 = product.dimensions?.T && product.dimensions?.P ? product.dimensions.T : product.dimensions?.L || '';
-            
-            let html = `
-                <td>${product.productCode || ''}</td>
-                <td>${product.pipeOuterDia?.DN || ''}</td>
-                <td>${product.pipeOuterDia?.Dmm || ''}</td>
-                <td>${product.pipeOuterDia?.inch || ''}</td>
-                <td>${dim1}</td>
-                <td>${dim2}</td>
-                <td>${product.packSize || ''}</td>
-                <td>${product.maxRec?.loadN || ''}</td>
-            `;
-            
-            row.innerHTML = html;
-        }
-        // Handle GGUB type products (has size with 3 fields + thread + height)
-        else if (hasSize && hasThread && hasHeight && !hasClampingRange && !hasForTube) {
-            let html = `
-                <td>${product.productCode || ''}</td>
-                <td>${product.size?.mm || ''}</td>
-                <td>${product.size?.inch || ''}</td>
-                <td>${product.size?.DN || ''}</td>
-                <td>${product.thread?.G || ''}</td>
-                <td>${product.height?.H || ''}</td>
-                <td>${product.packSize || ''}</td>
-            `;
-            
-            row.innerHTML = html;
-        }
-        // Handle GGSMU type products (has generalized field)
-        else if (hasGeneralized && hasSize && !hasClampingRange && !hasForTube) {
-            let html = `
-                <td>${product.productCode || ''}</td>
-                <td>${product.generalized || ''}</td>
-                <td>${product.size || ''}</td>
-                <td>${product.material || ''}</td>
-                <td>${product.packSize || ''}</td>
-                <td>${product.maxRec || ''}</td>
-            `;
-            
-            row.innerHTML = html;
-        }
-        // Handle "Size" type products (like GGSM)
-        else if (hasSize && !hasClampingRange && !hasForTube && !hasGeneralized) {
-            const dims = product.dimensions || {};
-            
-            let html = `
-                <td>${product.productCode || ''}</td>
-                <td>${product.size?.mm || ''}</td>
-                <td>${dims.PxS || ''}</td>
-                <td>${dims.B || ''}</td>
-                <td>${dims.B1 || ''}</td>
-                <td>${dims.Ø || dims.G || ''}</td>
-                <td>${dims.H || ''}</td>
-                <td>${product.packSize || ''}</td>
-            `;
-            
-            row.innerHTML = html;
-        }
-        // Handle "For Tube" type products (like GGRR)
-        else if (hasForTube) {
-            // Get dimension values
-            const dims = product.dimensions || {};
-            
-            let html = `
-                <td>${product.productCode || ''}</td>
-                <td>${product.DN || ''}</td>
-                <td>${product.forTube?.mm || ''}</td>
-                <td>${product.forTube?.inch || ''}</td>
-                <td>${dims.PxS || ''}</td>
-                <td>${dims.W || ''}</td>
-                <td>${dims.H || ''}</td>
-            `;
-            
-            // Add C and T columns only if they exist
-            if (dims.hasOwnProperty('C') || dims.hasOwnProperty('D')) {
-                html += `<td>${dims.C || dims.D || ''}</td>`;
-            }
-            if (dims.hasOwnProperty('T')) {
-                html += `<td>${dims.T || ''}</td>`;
-            }
-            
-            html += `
-                <td>${product.S || product.MStud || ''}</td>
-                <td>${product.packSize || ''}</td>
-            `;
-            
-            // Only add Max.Rec.Load if it exists
-            if (hasMaxRecLoad) {
-                html += `<td>${product.maxRecLoad || ''}</td>`;
-            }
-            
-            row.innerHTML = html;
-        } 
-        // Handle regular clamping range products
-        else {
-            // Get clamping range values dynamically
-            let clampingCol1 = '';
-            let clampingCol2 = '';
-            
-            if (product.clampingRange) {
-                const fields = Object.keys(product.clampingRange);
-                
-                // First column: DN, D(mm), or mm
-                if (product.clampingRange.DN) {
-                    clampingCol1 = product.clampingRange.DN;
-                } else if (product.clampingRange['D(mm)']) {
-                    clampingCol1 = product.clampingRange['D(mm)'];
-                } else if (product.clampingRange.mm) {
-                    clampingCol1 = product.clampingRange.mm;
-                }
-                
-                // Second column: Ømm/Ø[mm] or inch
-                if (product.clampingRange['Ømm'] || product.clampingRange['Ø[mm]']) {
-                    clampingCol2 = product.clampingRange['Ømm'] || product.clampingRange['Ø[mm]'];
-                } else if (product.clampingRange.inch) {
-                    clampingCol2 = product.clampingRange.inch;
-                }
-            }
-            
-            // Get connecting thread or flange head
-            let connectingValue = '';
-            if (product.flageHead || product.flangeHead) {
-                // Extract just the value after "G (inch): "
-                const flangeText = product.flageHead || product.flangeHead;
-                connectingValue = flangeText.replace(/^G\s*\(inch\):\s*/i, '');
-            } else {
-                connectingValue = product.connectingSlotØ || product.connectingThread || '';
-            }
-            
-            // Get dimension values dynamically
-            const dims = product.dimensions || {};
-            const dimValues = [
-                dims.PxS || '',
-                dims.W || '',
-                dims.H || '',
-                dims.C || dims.D || '',  // Use D if C doesn't exist
-                dims.T || ''
-            ];
-            
-            row.innerHTML = `
-                <td>${product.productCode || ''}</td>
-                <td>${clampingCol1}</td>
-                <td>${clampingCol2}</td>
-                <td>${connectingValue}</td>
-                <td>${dimValues[0]}</td>
-                <td>${dimValues[1]}</td>
-                <td>${dimValues[2]}</td>
-                <td>${dimValues[3]}</td>
-                <td>${dimValues[4]}</td>
-                <td>${product.S || product.MStud || ''}</td>
-                <td>${product.packSize || ''}</td>
-                <td>${product.maxRecLoad || ''}</td>
-            `;
-        }
-        
-        tbody.appendChild(row);
-    });
+    // Rows are added a screenful at a time
+    TableWindow.render(tbody, products, ggipRowCells(products));
 }
 
 // Load data when page loads
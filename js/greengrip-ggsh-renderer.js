@@ -231,17 +231,15 @@ function renderLoadingDataTable(loadingData) {
 
 function renderProductTable(products, isGGQC = false) {
     const tbody = document.getElementById('productTableBody');
-    tbody.innerHTML = '';
 
     // Check if this is GGRR (different structure)
     const isGGRR = products[0]?.dimensions?.PxS && products[0]?.S;
 
-    products.forEach(product => {
-        const row = document.createElement('tr');
-        
+    // Cells for one product row; TableWindow adds the rows a screenful at a time
+    const rowCells = (product) => {
         if (isGGQC) {
             // GGQC table structure
-            row.innerHTML = `
+            return `
                 <td>${product.productCode || ''}</td>
                 <td>${product.clampingRange?.DN || ''}</td>
                 <td>${product.clampingRange?.mm || ''}</td>
@@ -257,7 +255,7 @@ function renderProductTable(products, isGGQC = false) {
             `;
         } else if (isGGRR) {
             // GGRR table structure
-            row.innerHTML = `
+            return `
                 <td>${product.productCode || ''}</td>
                 <td>${product.clampingRange?.DN || ''}</td>
                 <td>${product.clampingRange?.mm || ''}</td>
@@ -270,7 +268,7 @@ function renderProductTable(products, isGGQC = false) {
             `;
         } else {
             // GGSH/GGSN/GGCH table structure
-            row.innerHTML = `
+            return `
                 <td>${product.productCode || ''}</td>
                 <td>${product.clampingRange?.DN || ''}</td>
                 <td>${product.clampingRange?.mm || ''}</td>
@@ -283,9 +281,9 @@ function renderProductTable(products, isGGQC = false) {
                 <td>${product.packSize || ''}</td>
             `;
         }
-        
-        tbody.appendChild(row);
-    });
+    };
+
+    TableWindow.render(tbody, products, rowCells);
 }
 
 // Load data when page loads
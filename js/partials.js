@@ -0,0 +1,37 @@
+// Navbar/footer partials - local dev fallback
+// build_partials.py inlines navbar.html and footer.html into every page, so
+// the header renders with the HTML and this only marks the page loaded.
+// A placeholder the build hasn't filled yet (e.g. a new page in local dev)
+// is fetched and injected the way pages used to do it at runtime.
+(function () {
+    const PARTIALS = [
+        ['navbar', 'navbar.html'],
+        ['footer', 'footer.html']
+    ];
+
+    // Scripts set through innerHTML never run; re-create them so navbar.js
+    // and the footer's back-to-top handler behave as they do when inlined
+    const runScripts = (container) => {
+        container.querySelectorAll('script').forEach(old => {
+            const script = document.createElement('script');
+            for (const { name, value } of old.attributes) script.setAttribute(name, value);
+            script.textContent = old.textContent;
+            old.replaceWith(script);
+        });
+    };
+
+    const pending = PARTIALS.map(([name, url]) => {
+        const placeholder = document.getElementById(`${name}-placeholder`) || document.getElementById(`${name}-container`);
+        if (!placeholder || placeholder.childElementCount) return null;
+
+        return fetch(url)
+            .then(response => response.text())
+            .then(html => {
+                placeholder.innerHTML = html;
+                runScripts(placeholder);
+            })
+            .catch(error => console.error(`Error loading ${url}:`, error));
+    });
+
+    Promise.all(pending).then(() => document.body.classList.add('loaded'));
+})();
@@ -0,0 +1,72 @@
+// Product index loader - resolves a product id to its small JSON shard
+// Shards and the index are generated by build_product_index.py into data/products/
+// Requires js/product-renderer.js for ProductRenderer.decodeColumnar
+class ProductIndex {
+    constructor(baseUrl = 'data/products/') {
+        this.baseUrl = baseUrl;
+        this.index = null;
+        this.cache = new Map();
+    }
+
+    // Same naming rule as shard_name() in build_product_index.py
+    static shardName(productId) {
+        return productId.toLowerCase().replace(/[^a-z0-9_-]+/g, '-') + '.json';
+    }
+
+    async fetchJson(file) {
+        if (!this.cache.has(file)) {
+            const request = fetch(this.baseUrl + file).then(response => {
+                if (!response.ok) throw new Error(`${file}: HTTP ${response.status}`);
+                return response.json();
+            }).then(data => ProductRenderer.decodeColumnar(data));
+            // Drop failed requests so a later call can retry
+            request.catch(() => this.cache.delete(file));
+            this.cache.set(file, request);
+        }
+        return this.cache.get(file);
+    }
+
+    async loadIndex() {
+        if (!this.index) {
+            this.index = await this.fetchJson('index.json');
+        }
+        return this.index;
+    }
+
+    // Get { product, category } for a product id in a single shard fetch
+    async getProduct(productId) {
+        if (!productId) return null;
+        try {
+            return await this.fetchJson(ProductIndex.shardName(productId));
+        } catch (error) {
+            console.error('Product not found:', productId, error);
+            return null;
+        }
+    }
+
+    async has(productId) {
+        const index = await this.loadIndex();
+        return Object.prototype.hasOwnProperty.call(index.products, productId);
+    }
+
+    // Get the category id a product belongs to
+    async getCategoryId(productId) {
+        const index = await this.loadIndex();
+        const position = index.products[productId];
+        return position === undefined ? null : index.categories[position];
+    }
+
+    // Get the grid listing ({ category: { ..., products: [{ id, title, images }] } })
+    // for a category id, or for the category of a product id
+    async getListing(id) {
+        const index = await this.loadIndex();
+        const categoryId = index.listings[id] ? id : await this.getCategoryId(id);
+        const file = categoryId && index.listings[categoryId];
+        return file ? this.fetchJson(file) : null;
+    }
+}
+
+// Export for use in HTML pages
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = ProductIndex;
+}
@@ -3,12 +3,32 @@ class ProductRenderer {
     constructor(dataUrl) {
         this.dataUrl = dataUrl;
         this.data = null;
+        this.productsById = new Map();
+        this.pendingTables = [];  // technical table rows left for TableWindow
+        this.tablesReady = Promise.resolve();
+    }
+
+    // Workers are available when js/catalog-worker.js is loaded (never inside the worker itself)
+    static useWorker() {
+        return typeof CatalogWorker !== 'undefined' && CatalogWorker.supported();
     }
 
     async loadData() {
         try {
-            const response = await fetch(this.dataUrl);
-            this.data = await response.json();
+            if (ProductRenderer.useWorker()) {
+                try {
+                    // Fetch and decode in js/catalog-worker.js
+                    this.data = await CatalogWorker.shared().load(this.dataUrl);
+                } catch (error) {
+                    console.warn('Catalog worker unavailable, loading on the main thread:', error);
+                }
+            }
+            if (!this.data) {
+                const response = await fetch(this.dataUrl);
+                this.data = ProductRenderer.decodeColumnar(await response.json());
+            }
+            this.indexProducts();
+            if (typeof ResponsiveImages !== 'undefined') await ResponsiveImages.load();
             return this.data;
         } catch (error) {
             console.error('Error loading product data:', error);
@@ -16,6 +36,47 @@ class ProductRenderer {
         }
     }
 
+    // <picture> with AVIF/WebP derivatives when js/responsive-images.js is loaded
+    static image(src, alt, sizes, attrs = '') {
+        if (typeof ResponsiveImages !== 'undefined') {
+            return ResponsiveImages.picture(src, alt, { sizes, attrs });
+        }
+        return `<img src="${src || ''}" alt="${alt}"${attrs ? ` ${attrs}` : ''}>`;
+    }
+
+    // Expand compact column tables ({ $cols, $rows }) written by compact_json.py
+    // back into arrays of row objects; anything else passes through unchanged
+    static decodeColumnar(data) {
+        if (Array.isArray(data)) {
+            return data.map(item => ProductRenderer.decodeColumnar(item));
+        }
+        if (!data || typeof data !== 'object') {
+            return data;
+        }
+
+        const keys = Object.keys(data);
+        if (keys.length === 2 && '$cols' in data && '$rows' in data) {
+            const paths = data.$cols.map(column => Array.isArray(column) ? column : [column]);
+            return data.$rows.map(values => {
+                const row = {};
+                paths.forEach((path, i) => {
+                    let target = row;
+                    for (let j = 0; j < path.length - 1; j++) {
+                        target = target[path[j]] = target[path[j]] || {};
+                    }
+                    target[path[path.length - 1]] = ProductRenderer.decodeColumnar(values[i]);
+                });
+                return row;
+            });
+        }
+
+        const decoded = {};
+        keys.forEach(key => {
+            decoded[key] = ProductRenderer.decodeColumnar(data[key]);
+        });
+        return decoded;
+    }
+
     // Render a single product detail item (Catalog Style)
     renderProduct(product, categoryBadge, categoryId = null, flip = false, isPreview = false, categoryPdf = null) {
         const flipClass = flip ? 'flip' : '';
@@ -35,6 +96,21 @@ class ProductRenderer {
             }
             
             const headers = Object.keys(product.technicalTable[0]);
+            const rowCells = (row) => headers.map(header => `<td>${row[header] || '-'}</td>`).join('');
+
+            // With js/table-window.js the body is filled after insertion, a screenful first;
+            // otherwise (e.g. in js/catalog-worker.js) every row is inline, data-labels included
+            let body;
+            let labelled = '';
+            if (typeof TableWindow !== 'undefined') {
+                body = `<tbody data-table-window="${this.pendingTables.length}"></tbody>`;
+                this.pendingTables.push({ rows: product.technicalTable, rowCells });
+            } else {
+                body = `<tbody>${product.technicalTable.map(row => `<tr>${
+                    headers.map(header => `<td data-label="${header}">${row[header] || '-'}</td>`).join('')
+                }</tr>`).join('')}</tbody>`;
+                labelled = ' data-labelled="true"';
+            }
             
             const viewAllLink = isPreview && categoryId 
                 ? `product-detail.html?id=gmc-c-profile` 
@@ -43,19 +119,13 @@ class ProductRenderer {
             
             return `
                 <div class="technical-table-container">
-                    <table class="technical-table">
+                    <table class="technical-table"${labelled}>
                         <thead>
                             <tr>
                                 ${headers.map(header => `<th>${header}</th>`).join('')}
                             </tr>
                         </thead>
-                        <tbody>
-                            ${product.technicalTable.map(row => `
-                                <tr>
-                                    ${headers.map(header => `<td>${row[header] || '-'}</td>`).join('')}
-                                </tr>
-                            `).join('')}
-                        </tbody>
+                        ${body}
                     </table>
                     <div class="product-actions" style="margin-top: 20px; padding: 0 15px 15px;">
                         <a href="${viewAllLink}" class="product-btn primary">
@@ -78,7 +148,7 @@ class ProductRenderer {
                     ${product.subtitle ? `<h3 class="product-subtitle">${product.subtitle}</h3>` : ''}
                     <div class="product-content-row">
                         <div class="product-inline-image">
-                            <img src="${product.images[0]}" alt="${product.title}">
+                            ${ProductRenderer.image(product.images[0], product.title, '(max-width: 768px) 100vw, 400px')}
                         </div>
                         <p class="product-description">${product.description}</p>
                     </div>
@@ -106,6 +176,7 @@ class ProductRenderer {
         });
 
         container.innerHTML = html;
+        this.fillTables(container);
         this.initScrollAnimations();
     }
 
@@ -129,9 +200,46 @@ class ProductRenderer {
         });
 
         container.innerHTML = html;
+        this.fillTables(container);
         this.initScrollAnimations();
     }
 
+    // Hand the technical table rows held back by renderProduct() to TableWindow;
+    // resolves once every table is complete
+    fillTables(container) {
+        const pending = this.pendingTables;
+        this.pendingTables = [];
+        this.tablesReady = Promise.all(Array.from(container.querySelectorAll('tbody[data-table-window]')).map(tbody => {
+            const table = pending[tbody.dataset.tableWindow];
+            tbody.removeAttribute('data-table-window');
+            return table ? TableWindow.render(tbody, table.rows, table.rowCells) : true;
+        }));
+        return this.tablesReady;
+    }
+
+    // renderCategoryPage() with the data loading and HTML building done in
+    // js/catalog-worker.js; products are inserted as their batches arrive
+    async streamCategoryPage(categoryId, containerId) {
+        const container = document.getElementById(containerId);
+        if (!container) return;
+
+        if (ProductRenderer.useWorker()) {
+            try {
+                container.innerHTML = '';
+                await CatalogWorker.shared().category(this.dataUrl, categoryId, {
+                    onHtml: html => container.insertAdjacentHTML('beforeend', html)
+                });
+                this.initScrollAnimations();
+                return;
+            } catch (error) {
+                console.warn('Catalog worker unavailable, rendering on the main thread:', error);
+            }
+        }
+
+        if (!this.data) await this.loadData();
+        this.renderCategoryPage(categoryId, containerId);
+    }
+
     // Render category cards for home page
     renderCategoryCards(containerId) {
         if (!this.data) return;
@@ -142,7 +250,7 @@ class ProductRenderer {
         const html = this.data.categories.map(category => `
             <div class="category-card">
                 <div class="category-card-image">
-                    <img src="${category.products[0]?.images[0] || ''}" alt="${category.name}">
+                    ${ProductRenderer.image(category.products[0]?.images[0], category.name, '(max-width: 768px) 100vw, 400px')}
                 </div>
                 <div class="category-card-content">
                     <h3 class="category-card-title">${category.name}</h3>
@@ -187,17 +295,24 @@ class ProductRenderer {
         return this.data.categories.find(cat => cat.id === categoryId);
     }
 
+    // Build the id -> { product, category } map used by getProductById
+    indexProducts() {
+        this.productsById = new Map();
+        if (!this.data || !this.data.categories) return;
+
+        this.data.categories.forEach(category => {
+            category.products.forEach(product => {
+                if (!this.productsById.has(product.id)) {
+                    this.productsById.set(product.id, { product, category });
+                }
+            });
+        });
+    }
+
     // Get product by ID
     getProductById(productId) {
         if (!this.data) return null;
-        
-        for (const category of this.data.categories) {
-            const product = category.products.find(p => p.id === productId);
-            if (product) {
-                return { product, category };
-            }
-        }
-        return null;
+        return this.productsById.get(productId) || null;
     }
 }
 
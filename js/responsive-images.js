@@ -0,0 +1,104 @@
+// Responsive images - serves AVIF/WebP derivatives instead of full-size PNGs
+// data/images.json is written by build_images.py and maps each original
+// image path to its resized copies in assets/derived/, its intrinsic size and
+// a placeholder (average colour + tiny blurred WebP).
+const ResponsiveImages = {
+    manifestUrl: 'data/images.json',
+    manifest: null,
+    loading: null,
+
+    // Safe to call from every renderer; the manifest is fetched once
+    load() {
+        if (!this.loading) {
+            this.loading = fetch(this.manifestUrl)
+                .then(response => {
+                    if (!response.ok) throw new Error(`${this.manifestUrl}: HTTP ${response.status}`);
+                    return response.json();
+                })
+                .then(manifest => { this.manifest = manifest; return manifest; })
+                .catch(error => {
+                    // Without a manifest every image simply falls back to its original
+                    console.error('Error loading image manifest:', error);
+                    return null;
+                });
+        }
+        return this.loading;
+    },
+
+    entry(src) {
+        if (!this.manifest || !src) return null;
+        return this.manifest.images[src] || this.manifest.images[decodeURI(src)] || null;
+    },
+
+    srcset(src, format) {
+        const entry = this.entry(src);
+        if (!entry) return '';
+        const [digest, , , widths] = entry;
+        return widths.map(width => `${this.manifest.dir}${digest}-${width}.${format} ${width}w`).join(', ');
+    },
+
+    // Inline background painted until the image loads (cleared by onload so
+    // transparent product shots don't keep the blur behind them)
+    placeholder(entry) {
+        const [, , , , color, lqip] = entry;
+        if (!color) return '';
+        return `background:${color}` + (lqip ? ` url(data:image/webp;base64,${lqip}) center/contain no-repeat` : '');
+    },
+
+    escape(text) {
+        return String(text).replace(/[&<>"]/g, c => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;' }[c]));
+    },
+
+    // <picture> markup for an image path; sizes describes the rendered width
+    // (e.g. '300px' for a grid card). Known images get width/height (so the
+    // box is reserved before loading) and the placeholder; unknown images get
+    // a plain <img>.
+    picture(src, alt = '', { sizes = '100vw', attrs = '' } = {}) {
+        const entry = this.entry(src);
+        if (!entry) {
+            return `<img src="${this.escape(src || '')}" alt="${this.escape(alt)}" loading="lazy" decoding="async"` +
+                (attrs ? ` ${attrs}` : '') + '>';
+        }
+
+        const [, width, height] = entry;
+        const background = this.placeholder(entry);
+        if (background) {
+            // Merge into a caller's style attribute rather than adding a second one
+            attrs = /\bstyle="/.test(attrs)
+                ? attrs.replace(/\bstyle="/, `style="${background};`)
+                : `${attrs} style="${background}"`.trim();
+            attrs += ` onload="this.style.background=''"`;
+        }
+        const img = `<img src="${this.escape(src || '')}" alt="${this.escape(alt)}" width="${width}" height="${height}" ` +
+            `loading="lazy" decoding="async" ${attrs}>`;
+
+        const sources = this.manifest.formats
+            .map(format => `<source type="image/${format}" srcset="${this.srcset(src, format)}" sizes="${sizes}">`)
+            .join('');
+        return `<picture>${sources}${img}</picture>`;
+    },
+
+    // Point an existing <img> at the derivatives (WebP srcset; AVIF needs <picture>)
+    apply(img, src, sizes = '100vw') {
+        const entry = this.entry(src);
+        if (entry) {
+            img.width = entry[1];
+            img.height = entry[2];
+            img.sizes = sizes;
+            img.srcset = this.srcset(src, 'webp');
+            const background = this.placeholder(entry);
+            if (background) {
+                img.style.background = background.slice('background:'.length);
+                img.addEventListener('load', () => { img.style.background = ''; }, { once: true });
+            }
+        } else {
+            img.removeAttribute('srcset');
+        }
+        img.src = src;
+    }
+};
+
+// Export for use in HTML pages
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = ResponsiveImages;
+}
@@ -1,62 +1,34 @@
 // Table utility functions for responsive tables and dynamic card numbers
 
-// Make tables mobile responsive by adding data-label attributes
-function setupResponsiveTables() {
-    // Handle technical-table class tables
-    const technicalTables = document.querySelectorAll('.technical-table');
-    technicalTables.forEach(table => {
-        const headers = Array.from(table.querySelectorAll('thead th')).map(th => th.textContent.trim());
-        const rows = table.querySelectorAll('tbody tr');
-        
-        rows.forEach(row => {
-            const cells = row.querySelectorAll('td');
-            cells.forEach((cell, index) => {
-                if (headers[index]) {
-                    cell.setAttribute('data-label', headers[index]);
-                }
-            });
-        });
-    });
-    
-    // Handle accessories-table class tables
-    const accessoriesTables = document.querySelectorAll('.accessories-table');
-    accessoriesTables.forEach(table => {
-        const headers = Array.from(table.querySelectorAll('thead th')).map(th => th.textContent.trim());
-        const rows = table.querySelectorAll('tbody tr');
-        
-        rows.forEach(row => {
-            const cells = row.querySelectorAll('td');
-            cells.forEach((cell, index) => {
-                if (headers[index]) {
-                    cell.setAttribute('data-label', headers[index]);
-                }
-            });
+// Add data-label attributes to a table's cells. Tables rendered by
+// TableWindow (js/table-window.js) label their rows as they are created
+// and are marked data-labelled, so they are skipped here.
+function addDataLabels(table) {
+    if (table.dataset.labelled) return false;
+
+    const headers = Array.from(table.querySelectorAll('thead th')).map(th => th.textContent.trim());
+    if (headers.length === 0) return false;
+
+    table.querySelectorAll('tbody tr').forEach(row => {
+        row.querySelectorAll('td').forEach((cell, index) => {
+            if (headers[index]) {
+                cell.setAttribute('data-label', headers[index]);
+            }
         });
     });
-    
-    // Handle any other tables that might be added later
-    const allTables = document.querySelectorAll('table');
-    allTables.forEach(table => {
-        // Skip if already processed
-        if (table.classList.contains('technical-table') || table.classList.contains('accessories-table')) {
-            return;
-        }
-        
-        const headers = Array.from(table.querySelectorAll('thead th')).map(th => th.textContent.trim());
-        if (headers.length > 0) {
-            const rows = table.querySelectorAll('tbody tr');
-            rows.forEach(row => {
-                const cells = row.querySelectorAll('td');
-                cells.forEach((cell, index) => {
-                    if (headers[index]) {
-                        cell.setAttribute('data-label', headers[index]);
-                    }
-                });
-            });
-        }
+    return true;
+}
+
+// Make tables mobile responsive by adding data-label attributes
+function setupResponsiveTables() {
+    // technical-table and accessories-table tables, and any other table added later
+    const tables = document.querySelectorAll('table');
+    let labelled = 0;
+    tables.forEach(table => {
+        if (addDataLabels(table)) labelled++;
     });
-    
-    console.log(`✅ Responsive data-labels added to ${technicalTables.length + accessoriesTables.length} tables`);
+
+    console.log(`✅ Responsive data-labels added to ${labelled} tables`);
 }
 
 // Setup dynamic card number indicator on scroll
@@ -68,7 +40,8 @@ function setupDynamicCardNumbers() {
             const table = container.querySelector('.technical-table');
             if (!table) return;
             
-            const rows = Array.from(table.querySelectorAll('tbody tr'));
+            // Live collection: rows TableWindow appends later are picked up too
+            const rows = table.tBodies[0] ? table.tBodies[0].rows : [];
             if (rows.length === 0) return;
             
             // Create header indicator element
@@ -160,5 +133,5 @@ function setupDynamicCardNumbers() {
 
 // Export for use in HTML pages
 if (typeof module !== 'undefined' && module.exports) {
-    module.exports = { setupResponsiveTables, setupDynamicCardNumbers };
+    module.exports = { addDataLabels, setupResponsiveTables, setupDynamicCardNumbers };
 }
@@ -0,0 +1,123 @@
+// Chunked table body rendering
+// Long clamp and anchor tables used to be built as one string of every row,
+// then setupResponsiveTables() re-queried every cell to add its data-label;
+// on a low-end phone that blocks the main thread for hundreds of ms.
+// TableWindow.render() writes the first screenful of rows (with their
+// data-labels) straight away and appends the rest in chunks while the
+// browser is idle. Rows arrive in order, so handlers delegated to the
+// table (not bound per row) see every row.
+//
+//   TableWindow.render(tbody, products, product => `<td>${product.code}</td>...`)
+//     .then(() => console.log('all rows in'));
+const TableWindow = {
+    INITIAL_ROWS: 40,   // about two screens of table on a phone
+    CHUNK_ROWS: 100,
+    IDLE_MARGIN_MS: 2,  // leave this much of each idle period to the browser
+
+    // tbody -> token of the render in progress, so a re-render cancels the old stream
+    active: new WeakMap(),
+
+    // Column labels for data-label: the lowest header cell over each column,
+    // so two-row headers (Clamping Range -> DN, D[mm], [inch]) label the leaves
+    labels(tbody) {
+        const head = tbody.closest('table')?.tHead;
+        if (!head) return [];
+        const grid = [];
+        Array.from(head.rows).forEach((row, r) => {
+            grid[r] = grid[r] || [];
+            let col = 0;
+            for (const th of row.cells) {
+                while (grid[r][col] !== undefined) col++;
+                for (let dr = 0; dr < th.rowSpan; dr++) {
+                    grid[r + dr] = grid[r + dr] || [];
+                    for (let dc = 0; dc < th.colSpan; dc++) grid[r + dr][col + dc] = th.textContent.trim();
+                }
+                col += th.colSpan;
+            }
+        });
+        return grid.length ? grid[grid.length - 1] : [];
+    },
+
+    // Append rows [start, end) and label their cells
+    append(tbody, items, rowCells, labels, start, end) {
+        let html = '';
+        for (let i = start; i < end; i++) {
+            html += `<tr>${rowCells(items[i], i)}</tr>`;
+        }
+        TableWindow.insert(tbody, html, labels);
+    },
+
+    // Append ready-made <tr> markup (e.g. a batch from js/catalog-worker.js);
+    // only the new rows are labelled
+    insert(tbody, html, labels) {
+        const first = tbody.rows.length;
+        tbody.insertAdjacentHTML('beforeend', html);
+        for (let r = first; r < tbody.rows.length; r++) {
+            const cells = tbody.rows[r].cells;
+            for (let c = 0; c < cells.length; c++) {
+                if (labels[c]) cells[c].setAttribute('data-label', labels[c]);
+            }
+        }
+    },
+
+    idle(callback) {
+        if (typeof requestIdleCallback === 'function') {
+            requestIdleCallback(callback, { timeout: 200 });
+        } else {
+            setTimeout(() => callback({ timeRemaining: () => 8, didTimeout: false }), 16);
+        }
+    },
+
+    // Empty tbody (stopping any stream into it) for rows added by insert();
+    // returns the column labels
+    reset(tbody) {
+        TableWindow.active.delete(tbody);
+        tbody.innerHTML = '';
+        const table = tbody.closest('table');
+        if (table) table.dataset.labelled = 'true';  // setupResponsiveTables() can skip it
+        return TableWindow.labels(tbody);
+    },
+
+    // Replace tbody's rows with one row per item; resolves once every row is in
+    render(tbody, items, rowCells, options = {}) {
+        const headerLabels = TableWindow.reset(tbody);
+        const token = {};
+        TableWindow.active.set(tbody, token);
+
+        const labels = options.labels || headerLabels;
+        const initial = options.initialRows || TableWindow.INITIAL_ROWS;
+        const chunk = options.chunkRows || TableWindow.CHUNK_ROWS;
+
+        let next = Math.min(initial, items.length);
+        TableWindow.append(tbody, items, rowCells, labels, 0, next);
+
+        return new Promise(resolve => {
+            const stream = (deadline) => {
+                if (TableWindow.active.get(tbody) !== token) return resolve(false);
+                do {
+                    const end = Math.min(next + chunk, items.length);
+                    TableWindow.append(tbody, items, rowCells, labels, next, end);
+                    next = end;
+                } while (next < items.length && !deadline.didTimeout && deadline.timeRemaining() > TableWindow.IDLE_MARGIN_MS);
+
+                if (next < items.length) {
+                    TableWindow.idle(stream);
+                } else {
+                    TableWindow.active.delete(tbody);
+                    resolve(true);
+                }
+            };
+            if (next < items.length) {
+                TableWindow.idle(stream);
+            } else {
+                TableWindow.active.delete(tbody);
+                resolve(true);
+            }
+        });
+    }
+};
+
+// Export for use in HTML pages
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = TableWindow;
+}
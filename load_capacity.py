@@ -0,0 +1,290 @@
+"""
+Load capacity engine for strut and C-channel profiles
+The published load tables are simply supported single-span beams, limited
+by bending stress or by an L/200 deflection, whichever governs:
+  bending      P = sigma * W / (m * L)        M_max = m * P * L
+  deflection   P = E * I / (200 * d * L^2)    delta = d * P * L^3 / (E * I)
+with the section modulus W and inertia I from each product's properties.
+capacities() evaluates every profile x span x case as one NumPy broadcast,
+so any span grid (not just the 100 mm table rows) costs the same.
+
+Usage:
+    python load_capacity.py                          # check against the published tables
+    python load_capacity.py GM412115 --spans 1250 1750
+    python load_capacity.py GMC283015 --spans 100:3000:50
+build_catalog.py's load-tables stage uses recompute_tables() to regenerate the
+tables of every profile whose properties pass the check.
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+import catalog_model
+
+ROOT = Path(__file__).resolve().parent
+
+# S235 yield strength over a material safety factor of 1.5, in N/mm^2
+ALLOWABLE_STRESS = 235 / 1.5
+DEFLECTION_LIMIT = 200  # span / 200
+
+# (case key, moment coefficient m, mid-span deflection coefficient d); P is the
+# load per point, or the total load for the uniformly distributed case
+CASES = [
+    ('case1', 1 / 4, 1 / 48),        # single point load at center
+    ('case2', 1 / 3, 23 / 648),      # 2 point loads at L/3
+    ('case3', 1 / 2, 19 / 384),      # 3 point loads at L/4
+    ('case4', 3 / 5, 63 / 1000),     # 4 point loads at L/5
+    ('case5', 1 / 8, 5 / 384),       # uniformly distributed load
+]
+MOMENT_COEFFS = np.array([m for _, m, _ in CASES])
+DEFLECTION_COEFFS = np.array([d for _, _, d in CASES])
+
+# Catalogue -> where its table lives and which axis the published tables load
+PROFILE_CATALOGS = {
+    'data/strut-channel-catalog.json': {
+        'table': 'spans', 'column': '{}_N',
+        'modulus': 'wz_mm3', 'inertia': 'iy_mm4', 'elastic_modulus': 200000,
+        'spans': range(100, 2001, 100),
+    },
+    'data/c-channel-catalog.json': {
+        'table': 'data', 'column': '{}',
+        'modulus': 'wy_mm3', 'inertia': 'iz_mm4', 'elastic_modulus': 210000,
+        'spans': range(100, 3001, 100),
+    },
+}
+
+# A published value agrees if it is within this many N, or this fraction
+TOLERANCE_N = 1.5
+TOLERANCE_REL = 0.01
+
+# Section properties are trusted when they reproduce nearly all stress-governed
+# cells and most deflection-governed ones (the published case 4 deflection
+# values use a smaller coefficient than 4 loads at L/5 gives)
+TRUST_BENDING = 0.95
+TRUST_DEFLECTION = 0.75
+
+
+def capacities(modulus, inertia, spans, elastic_modulus, stress=ALLOWABLE_STRESS):
+    """
+    Allowable load for every profile x span x case
+    modulus, inertia: (profiles,) in mm^3 / mm^4; spans: (spans,) in mm.
+    Returns a dict of (profiles, spans, cases) arrays:
+      load             allowable load in N
+      deflection       mid-span deflection at that load in mm
+      deflection_governs  True where the L/200 limit, not stress, sets the load
+    """
+    W = np.asarray(modulus, dtype=float)[:, None, None]
+    I = np.asarray(inertia, dtype=float)[:, None, None]
+    L = np.asarray(spans, dtype=float)[None, :, None]
+
+    bending = stress * W / (MOMENT_COEFFS * L)
+    deflection_load = elastic_modulus * I / (DEFLECTION_LIMIT * DEFLECTION_COEFFS * L ** 2)
+    load = np.minimum(bending, deflection_load)
+    return {
+        'load': load,
+        'deflection': DEFLECTION_COEFFS * load * L ** 3 / (elastic_modulus * I),
+        'deflection_governs': deflection_load < bending,
+    }
+
+
+def parse_spans(values):
+    """
+    ['1250', '100:3000:50'] -> sorted array of spans in mm (stop inclusive)
+    Raises ValueError for anything but positive spans and steps.
+    """
+    spans = []
+    for value in values:
+        try:
+            parts = [float(part) for part in value.split(':')]
+        except ValueError:
+            raise ValueError(f"span {value!r} is not a number or start:stop:step range")
+        if len(parts) == 3:
+            start, stop, step = parts
+            if step <= 0:
+                raise ValueError(f"span range {value!r}: step must be positive")
+            parts = list(np.arange(start, stop + step / 2, step))
+        elif len(parts) != 1:
+            raise ValueError(f"span {value!r} is not a number or start:stop:step range")
+        if not parts:
+            raise ValueError(f"span range {value!r} is empty")
+        if min(parts) <= 0:
+            raise ValueError(f"span {value!r}: spans must be positive")
+        spans.extend(parts)
+    return np.unique(np.array(spans, dtype=float))
+
+
+def load_profiles(root=ROOT):
+    """Yield (catalog path, settings, products) for each profile catalogue, products as their source dicts"""
+    for rel_path, settings, catalogue in profile_catalogues(root):
+        yield rel_path, settings, [family.fields for family in catalogue]
+
+
+def profile_catalogues(root=ROOT):
+    """Yield (catalog path, settings, catalog_model.Catalogue) for each profile catalogue"""
+    for rel_path, settings in PROFILE_CATALOGS.items():
+        yield rel_path, settings, catalog_model.load(Path(root) / rel_path)
+
+
+def section_arrays(products, settings):
+    properties = [p.get('properties', {}) for p in products]
+    modulus = np.array([float(p.get(settings['modulus']) or 0) for p in properties])
+    inertia = np.array([float(p.get(settings['inertia']) or 0) for p in properties])
+    return modulus, inertia
+
+
+def published_table(product, settings):
+    """(spans, loads) from the product's published table, loads shaped (spans, cases)"""
+    rows = (product.get('loadCases') or {}).get(settings['table']) or []
+    spans = np.array([row['span_mm'] for row in rows], dtype=float)
+    loads = np.array([[row.get(settings['column'].format(key)) for key, _, _ in CASES] for row in rows],
+                     dtype=float)
+    return spans, loads.reshape(len(rows), len(CASES))
+
+
+def published_capacities(product, settings, spans):
+    """
+    Loads (spans, cases) read off the published table for profiles whose
+    properties cannot be trusted: each span takes the row of the next
+    published span up (a longer span never carries more), and spans past
+    the table, or cells it leaves empty, get 0
+    """
+    table_spans, loads = published_table(product, settings)
+    spans = np.asarray(spans, dtype=float)
+    result = np.zeros((len(spans), len(CASES)))
+    if len(table_spans) == 0:
+        return result
+    order = np.argsort(table_spans)
+    table_spans, loads = table_spans[order], np.nan_to_num(loads[order], nan=0.0)
+    row = np.searchsorted(table_spans, spans, side='left')
+    inside = row < len(table_spans)
+    result[inside] = loads[row[inside]]
+    return result
+
+
+def table_rows(loads, spans, settings):
+    """Rows in the shape the catalogue stores: [{'span_mm': 100, 'case1_N': ...}, ...]"""
+    rows = []
+    for span, values in zip(spans, np.rint(loads).astype(int)):
+        row = {'span_mm': int(span) if float(span).is_integer() else float(span)}
+        for (key, _, _), value in zip(CASES, values):
+            row[settings['column'].format(key)] = int(value)
+        rows.append(row)
+    return rows
+
+
+def check_catalog(products, settings):
+    """
+    Compare the engine with each product's published table
+    Returns one dict per product: agreement in the bending and deflection
+    regimes, and the worst relative deviation with its span and case.
+    """
+    modulus, inertia = section_arrays(products, settings)
+    report = []
+    for product, W, I in zip(products, modulus, inertia):
+        spans, published = published_table(product, settings)
+        entry = {'id': product['id'], 'rows': len(spans)}
+        if len(spans) == 0 or W <= 0 or I <= 0:
+            entry['status'] = 'no table' if len(spans) == 0 else 'missing properties'
+            report.append(entry)
+            continue
+
+        result = capacities([W], [I], spans, settings['elastic_modulus'])
+        computed = result['load'][0]
+        governs = result['deflection_governs'][0]
+        agree = np.abs(computed - published) <= np.maximum(TOLERANCE_N, TOLERANCE_REL * published)
+        deviation = np.abs(computed - published) / np.maximum(published, 1)
+        worst = np.unravel_index(np.argmax(deviation), deviation.shape)
+
+        # Share of published cells reproduced, per governing regime (None if the regime never governs)
+        bending_agree = float(agree[~governs].mean()) if (~governs).any() else None
+        deflection_agree = float(agree[governs].mean()) if governs.any() else None
+        trusted = (bending_agree is not None and bending_agree >= TRUST_BENDING
+                   and (deflection_agree is None or deflection_agree >= TRUST_DEFLECTION))
+        entry.update({
+            'bending': bending_agree,
+            'deflection': deflection_agree,
+            'worst': (float(deviation[worst]), int(spans[worst[0]]), CASES[worst[1]][0]),
+            'status': 'ok' if trusted else 'properties disagree with table',
+        })
+        report.append(entry)
+    return report
+
+
+def recompute_tables(products, settings, spans=None):
+    """
+    Replace the published table of each trusted product with computed rows
+    (one batched capacities() call). Returns (updated ids, skipped {id: reason}).
+    """
+    spans = np.asarray(settings['spans'] if spans is None else spans, dtype=float)
+    report = check_catalog(products, settings)
+    trusted = [product for product, entry in zip(products, report) if entry['status'] == 'ok']
+    skipped = {entry['id']: entry['status'] for entry in report if entry['status'] != 'ok'}
+    if not trusted:
+        return [], skipped
+
+    modulus, inertia = section_arrays(trusted, settings)
+    loads = capacities(modulus, inertia, spans, settings['elastic_modulus'])['load']
+    for product, product_loads in zip(trusted, loads):
+        product.setdefault('loadCases', {})[settings['table']] = table_rows(product_loads, spans, settings)
+    return [product['id'] for product in trusted], skipped
+
+
+def print_check(root=ROOT):
+    for rel_path, settings, products in load_profiles(root):
+        print(f"\n{rel_path}")
+        for entry in check_catalog(products, settings):
+            if 'worst' not in entry:
+                print(f"  ⚠️  {entry['id']}: {entry['status']}")
+                continue
+            deviation, span, case = entry['worst']
+            icon = "✓" if entry['status'] == 'ok' else "⚠️ "
+            share = lambda value: "   -" if value is None else f"{value:4.0%}"
+            print(f"  {icon} {entry['id']:30} bending {share(entry['bending'])}  deflection {share(entry['deflection'])}  "
+                  f"worst {deviation:5.1%} at {span} mm {case}"
+                  + ("" if entry['status'] == 'ok' else f"  ({entry['status']})"))
+
+
+def print_capacities(query, spans, root=ROOT):
+    query = query.lower()
+    found = False
+    for _, settings, catalogue in profile_catalogues(root):
+        # Family code is the identification (GM412115); both axes of a C-channel share it
+        matches = [family.fields for family in catalogue
+                   if query in (family.fields['id'].lower(), str(family.code).lower())]
+        if not matches:
+            continue
+        found = True
+        modulus, inertia = section_arrays(matches, settings)
+        result = capacities(modulus, inertia, spans, settings['elastic_modulus'])
+        for i, product in enumerate(matches):
+            print(f"\n{product['title']} ({product['id']}) - allowable load in N, deflection-governed marked *")
+            print(f"{'span mm':>8} " + " ".join(f"{key:>9}" for key, _, _ in CASES))
+            for j, span in enumerate(spans):
+                cells = [f"{result['load'][i, j, k]:8.0f}{'*' if result['deflection_governs'][i, j, k] else ' '}"
+                         for k in range(len(CASES))]
+                print(f"{span:8.0f} " + " ".join(cells))
+    if not found:
+        print(f"❌ No strut or C-channel profile matches {query!r}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute strut and C-channel load capacities")
+    parser.add_argument('profile', nargs='?', help="product id or identification (e.g. GM412115)")
+    parser.add_argument('--spans', nargs='+', default=['100:2000:100'],
+                        help="spans in mm, or start:stop:step ranges (default: 100:2000:100)")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        try:
+            spans = parse_spans(args.spans)
+        except ValueError as e:
+            parser.error(str(e))
+        print_capacities(args.profile, spans)
+    else:
+        print_check()
+
+
+if __name__ == '__main__':
+    main()
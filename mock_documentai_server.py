@@ -0,0 +1,115 @@
+"""
+Local stand-in for the Document AI :process endpoint
+Answers the requests process_pdf_documentai.py sends with a response of the
+same shape (document.text plus per-page textAnchor segments), reading the
+text straight out of the PDF with pdfplumber instead of running OCR. Lets
+the chunking, retries, caching and merging be exercised offline.
+
+--fail-every N answers every Nth request with a 503 and --delay holds each
+response, to exercise retries and concurrency.
+
+Usage:
+    python mock_documentai_server.py                      # http://127.0.0.1:8765
+    python mock_documentai_server.py --port 9000 --fail-every 3 --delay 0.5
+    python process_pdf_documentai.py catalogue.pdf --endpoint http://127.0.0.1:8765/v1/mock:process
+"""
+
+import argparse
+import base64
+import io
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pdfplumber
+
+DEFAULT_PORT = 8765
+
+
+def process_response(pdf_bytes):
+    """Document AI-shaped response for a PDF: its text, one text segment per page"""
+    text = ''
+    pages = []
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        for number, page in enumerate(pdf.pages, 1):
+            page_text = (page.extract_text() or '') + '\n'
+            start, text = len(text), text + page_text
+            # Like the real API: int64 as strings, zero startIndex left out
+            segment = {'endIndex': str(len(text))}
+            if start:
+                segment['startIndex'] = str(start)
+            pages.append({
+                'pageNumber': number,
+                'dimension': {'width': float(page.width), 'height': float(page.height), 'unit': 'points'},
+                'layout': {'textAnchor': {'textSegments': [segment]}},
+            })
+    return {'document': {'mimeType': 'application/pdf', 'text': text, 'pages': pages}}
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """POST .../<anything>:process with a rawDocument body"""
+
+    fail_every = 0
+    delay = 0.0
+    requests = 0
+    lock = threading.Lock()
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        with MockHandler.lock:
+            MockHandler.requests += 1
+            number = MockHandler.requests
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        if not self.path.endswith(':process'):
+            return self._reply(404, {'error': {'code': 404, 'message': f"Unknown path {self.path}"}})
+        if self.fail_every and number % self.fail_every == 0:
+            return self._reply(503, {'error': {'code': 503, 'message': 'mock: simulated outage'}})
+
+        try:
+            document = json.loads(body)['rawDocument']
+            response = process_response(base64.b64decode(document['content']))
+        except Exception as e:
+            return self._reply(400, {'error': {'code': 400, 'message': f"mock: bad request: {e}"}})
+
+        time.sleep(self.delay)
+        self._reply(200, response)
+
+    def log_message(self, format, *args):
+        print(f"mock documentai: {format % args}")
+
+
+def serve(port=DEFAULT_PORT, fail_every=0, delay=0.0, host='127.0.0.1'):
+    """Start the server on a background thread; returns it (call .shutdown() to stop)"""
+    handler = type('ConfiguredMockHandler', (MockHandler,), {'fail_every': fail_every, 'delay': delay})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for the Document AI :process endpoint")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="port to listen on")
+    parser.add_argument('--fail-every', type=int, default=0, help="answer every Nth request with a 503")
+    parser.add_argument('--delay', type=float, default=0.0, help="seconds to hold each response")
+    args = parser.parse_args(argv)
+
+    server = serve(args.port, args.fail_every, args.delay)
+    print(f"Mock Document AI on http://127.0.0.1:{args.port}/v1/mock:process (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -68,3 +68,23 @@ if (window.innerWidth >= 1118) {
       }
    });
 }
+
+/*=============== CATALOG SEARCH ===============*/
+// js/catalog-search.js and its index are only fetched once the box is used
+const searchInput = document.getElementById('nav-search-input'),
+      searchResults = document.getElementById('nav-search-results')
+
+if(searchInput && searchResults) {
+   searchInput.addEventListener('focus', () => {
+      const attach = () => new CatalogSearch().attach(searchInput, searchResults)
+
+      if(typeof CatalogSearch !== 'undefined') {
+         attach()
+         return
+      }
+      const script = document.createElement('script')
+      script.src = 'js/catalog-search.js'
+      script.onload = attach
+      document.body.appendChild(script)
+   }, { once: true })
+}
@@ -0,0 +1,114 @@
+"""
+Parallel PDF page extraction engine
+Each worker process opens the catalogue PDF once and keeps it open for every
+page it is handed, so no page pays for re-parsing the whole document.
+Results always come back in the order the pages were requested.
+Pass a PageCache to serve unchanged pages' text and tables from disk, and a
+RunReport (pdf_run_report.py) to collect each page's stage timings.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pdfplumber
+
+from pdf_page_cache import CachedPage
+from pdf_run_report import record_page
+
+# Per-process state, set up once by _init_worker
+_worker_pdf = None
+_worker_page_func = None
+_worker_cache = None
+
+
+def _init_worker(pdf_path, page_func, cache=None):
+    """Open the PDF once for this worker process"""
+    global _worker_pdf, _worker_page_func, _worker_cache
+    _worker_pdf = pdfplumber.open(pdf_path)
+    _worker_page_func = page_func
+    _worker_cache = cache
+
+
+def _run_page(page_number):
+    """
+    Run the page function on one page of the worker's open PDF
+    Returns (result, cache_hit, stats) - cache_hit is None when no cache is
+    in use, stats is the page's PageStats
+    """
+    if page_number < 1 or page_number > len(_worker_pdf.pages):
+        print(f"❌ Page {page_number} does not exist in PDF")
+        return None, None, None
+
+    page = _worker_pdf.pages[page_number - 1]  # 0-indexed
+    try:
+        with record_page(page_number) as stats:
+            if _worker_cache is None:
+                return _worker_page_func(page, page_number), None, stats
+
+            cached_page = CachedPage(page, _worker_cache)
+            result = _worker_page_func(cached_page, page_number)
+            stats.cache_hit = cached_page.save()
+        return result, stats.cache_hit, stats
+    finally:
+        # Drop pdfminer's cached layout for this page so long runs stay flat in memory
+        page.flush_cache()
+
+
+def default_workers(page_count):
+    """One worker per core, but never more workers than pages"""
+    return max(1, min(os.cpu_count() or 1, page_count))
+
+
+def extract_pages(pdf_path, page_numbers, page_func, workers=None, cache=None, report=None):
+    """
+    Run page_func(page, page_number) over page_numbers (1-based)
+    Returns a list of results in the same order as page_numbers.
+    page_func must be a module-level function so it can be sent to workers.
+    With workers=1 everything runs in this process on a single open PDF.
+    If a PageCache is given, hits/misses are recorded on it and it is
+    trimmed to its size cap once all pages are done. If a RunReport is
+    given, every page's stage timings and counters are added to it.
+    """
+    page_numbers = list(page_numbers)
+    if not page_numbers:
+        return []
+
+    if workers is None:
+        workers = default_workers(len(page_numbers))
+
+    if workers <= 1:
+        _init_worker(pdf_path, page_func, cache)
+        try:
+            outcomes = [_run_page(page_number) for page_number in page_numbers]
+        finally:
+            _close_worker()
+    else:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_worker,
+                                 initargs=(str(pdf_path), page_func, cache)) as executor:
+            # map() yields in submission order regardless of which worker finishes first
+            outcomes = list(executor.map(_run_page, page_numbers))
+
+    if cache is not None:
+        # Workers only see copies of the cache, so tally and evict here
+        for _, hit, _ in outcomes:
+            if hit is not None:
+                cache.record(hit)
+        cache.evict()
+
+    if report is not None:
+        # Stats were gathered in the workers and pickled back with each result
+        for _, _, stats in outcomes:
+            report.add(stats)
+
+    return [result for result, _, _ in outcomes]
+
+
+def _close_worker():
+    """Close the PDF opened by _init_worker in this process"""
+    global _worker_pdf, _worker_page_func, _worker_cache
+    if _worker_pdf is not None:
+        _worker_pdf.close()
+    _worker_pdf = None
+    _worker_page_func = None
+    _worker_cache = None
@@ -0,0 +1,153 @@
+"""
+Layout templates for fixed-layout catalogue pages
+Every page of a catalogue like the anchors PDF puts the same blocks in the
+same places: title band, specification list, definition paragraph and the
+installation parameters table. A template names those regions as bounding
+boxes, so extraction reads each block from its own region of the page's
+PageModel instead of searching the whole page, and rules the table with
+explicit column and row lines instead of leaving a table finder to guess
+them from the page's ruling.
+
+Region edges are page coordinates (points from the top-left corner). A tuple
+('anchor', offset) is measured from the top of the template's anchor text
+instead, for blocks that move up and down with the length of the text above
+them; None as the right edge means the page width.
+
+    layout = extract_layout(page, ANCHOR_PAGE)
+    layout['title']       # text of the title band
+    layout['rows']        # parameter table, one list of cell strings per row
+
+extract_layout() returns None when the page does not match the template (no
+anchor text), so callers can fall back to whole-page extraction.
+"""
+
+import hashlib
+import json
+
+from pdf_page_model import PageModel
+from pdf_run_report import stage
+
+ANCHOR_PAGE = {
+    'name': 'anchors',
+    # Heading over the parameters table; everything below the specs hangs off it
+    'anchor': {'text': 'Installation Parameters', 'search': (0, 300, None, 420)},
+    'regions': {
+        'title': (0, 60, None, 110),
+        'specs': (355, 110, None, ('anchor', -74)),
+        'definition': (0, ('anchor', -74), None, ('anchor', -25)),
+        # Table body: below the two header rows, above the page footer
+        'parameters': (0, ('anchor', 44), None, 811),
+    },
+    'table': {
+        'region': 'parameters',
+        # Left edge of each column as a fraction of the table width
+        'columns': [0.0, 0.1341, 0.225, 0.3031, 0.3702, 0.461, 0.5752, 0.7005, 0.8167, 0.9074],
+    },
+}
+
+# Shaded cell edges closer than this are one table line
+EDGE_TOLERANCE = 3
+
+
+def template_key(template):
+    """Short stable id of a template, so cached layouts change with it"""
+    encoded = json.dumps(template, sort_keys=True).encode()
+    return f"{template['name']}-{hashlib.sha256(encoded).hexdigest()[:12]}"
+
+
+def find_anchor(model, template):
+    """Top of the template's anchor text on the page, or None"""
+    anchor = template['anchor']
+    return model.within(resolve_bbox(model, anchor['search'], None)).search(anchor['text'])
+
+
+def resolve_bbox(model, bbox, anchor_top):
+    """A template bbox in page coordinates, clipped to the page"""
+    _, _, width, height = model.bbox
+
+    def edge(value, default):
+        if value is None:
+            return default
+        if isinstance(value, (list, tuple)):
+            return anchor_top + value[1]
+        return value
+
+    x0, top, x1, bottom = bbox
+    return (max(edge(x0, 0), 0), max(edge(top, 0), 0),
+            min(edge(x1, width), width), min(edge(bottom, height), height))
+
+
+def merge_edges(values):
+    """Sorted positions with near-duplicates (double-drawn cell borders) dropped"""
+    edges = []
+    for value in sorted(values):
+        if not edges or value - edges[-1] > EDGE_TOLERANCE:
+            edges.append(value)
+    return edges
+
+
+def column_edges(region, fractions):
+    """
+    Explicit column lines for the table in a region
+    The shaded cells' borders when they give exactly the template's columns;
+    otherwise the template's fractions spread over the table's width. A line
+    that cuts through a word (values printed wider than their cell) moves out
+    to the word's nearer side.
+    """
+    xs = merge_edges(x for rect in region.rects for x in (rect['x0'], rect['x1']))
+    if len(xs) != len(fractions) + 1:
+        left, right = (xs[0], xs[-1]) if len(xs) >= 2 else (region.bbox[0], region.bbox[2])
+        xs = [left + fraction * (right - left) for fraction in fractions] + [right]
+    for i, x in enumerate(xs[1:-1], 1):
+        for word in region.words:
+            if word['x0'] < x < word['x1']:
+                x = word['x0'] - 0.5 if x - word['x0'] < word['x1'] - x else word['x1'] + 0.5
+        xs[i] = x
+    return xs
+
+
+def row_edges(region):
+    """
+    Explicit row lines: one above each line of text, closed under the last.
+    Shaded bands are not used; not every table shades its rows, and rows
+    whose product code is missing still need a line of their own.
+    """
+    # Text straddling the region's top edge counts from the edge
+    ys = [max(line.top, region.bbox[1]) - 1 for line in region.lines]
+    if region.lines:
+        ys.append(region.lines[-1].bottom + 1)
+    return merge_edges(ys)
+
+
+def extract_table(region, fractions):
+    """Rows of the table in region, read on explicit column and row lines"""
+    return region.grid(column_edges(region, fractions), row_edges(region))
+
+
+def _extract_layout(page, template):
+    # Building the model is the first look at the page, so it carries the PDF parse
+    with stage('page_model'):
+        model = PageModel.from_page(page)
+    anchor_top = find_anchor(model, template)
+    if anchor_top is None:
+        return None
+
+    regions = {name: model.within(resolve_bbox(model, bbox, anchor_top))
+               for name, bbox in template['regions'].items()}
+    with stage('extract_text'):
+        layout = {name: region.text() for name, region in regions.items()}
+    table = template['table']
+    with stage('extract_tables'):
+        layout['rows'] = extract_table(regions[table['region']], table['columns'])
+    return layout
+
+
+def extract_layout(page, template):
+    """
+    Text of every template region plus the table rows, or None when the page
+    has no anchor. A CachedPage serves the result from the page cache.
+    """
+    cached = getattr(page, 'cached', None)
+    if cached is None:
+        return _extract_layout(page, template)
+    return cached(f"layout:{template_key(template)}", lambda real_page: _extract_layout(real_page, template))
@@ -0,0 +1,175 @@
+"""
+Content-addressed on-disk cache for per-page PDF extraction results
+Entries are keyed by a hash of the page's raw content streams plus an
+extractor version, so a catalogue revision only re-parses the pages that
+actually changed. Least recently used entries are evicted once the cache
+grows past its size cap.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pdfplumber
+from pdfminer.pdftypes import resolve1
+
+DEFAULT_CACHE_DIR = Path(".cache/pdf-pages")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Bump when the layout of cache entries changes
+CACHE_FORMAT = 1
+
+
+def page_content_hash(page):
+    """Hash the raw content streams, fonts and geometry of a pdfplumber page"""
+    page_obj = page.page_obj
+    digest = hashlib.sha256()
+    digest.update(repr((page_obj.mediabox, page_obj.cropbox, page_obj.rotate)).encode())
+
+    for stream in page_obj.contents:
+        stream = resolve1(stream)
+        digest.update(stream.get_data())
+
+    # Same drawing operators with a different font can still extract differently
+    fonts = resolve1((page_obj.resources or {}).get('Font')) or {}
+    for name in sorted(fonts, key=str):
+        font = resolve1(fonts[name])
+        base_font = font.get('BaseFont') if isinstance(font, dict) else None
+        digest.update(f"{name}={base_font};".encode())
+
+    return digest.hexdigest()
+
+
+class PageCache:
+    """Size-capped directory of JSON entries, one file per page key"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, extractor_version=''):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.extractor_version = extractor_version
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+    def key_for(self, page):
+        """Cache key for a page under this cache's extractor version"""
+        version = f"{CACHE_FORMAT}|pdfplumber-{pdfplumber.__version__}|{self.extractor_version}"
+        return hashlib.sha256(f"{page_content_hash(page)}|{version}".encode()).hexdigest()
+
+    def _path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def load(self, key):
+        """Return the stored entry for key (or an empty dict)"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Touch so eviction treats this entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def store(self, key, entry):
+        """Atomically write an entry so concurrent workers never see partial files"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    def record(self, hit):
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_bytes"""
+        if not self.cache_dir.exists():
+            return 0
+
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob('*/*.json'):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        self.evicted += removed
+        return removed
+
+    def report(self):
+        """Print hit/miss statistics for this run"""
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0.0
+        print(f"Page cache: {self.hits} hits, {self.misses} misses ({rate:.0f}% hit rate), "
+              f"{self.evicted} evicted - {self.cache_dir}")
+
+
+class CachedPage:
+    """
+    Wraps a pdfplumber page so extract_text()/extract_tables() (and anything
+    else read through cached()) are served from the cache when the page
+    content is unchanged. Everything else is passed through to the real page.
+    """
+
+    def __init__(self, page, cache):
+        self._page = page
+        self._cache = cache
+        self._key = None
+        self._entry = None
+        self.dirty = False
+
+    def __getattr__(self, name):
+        return getattr(self._page, name)
+
+    def cached(self, field, compute):
+        """
+        The stored value of field, or compute(page) on the real page (stored
+        for next time); the value must be JSON-serialisable
+        """
+        if self._entry is None:
+            self._key = self._cache.key_for(self._page)
+            self._entry = self._cache.load(self._key)
+
+        if field not in self._entry:
+            self._entry[field] = compute(self._page)
+            self.dirty = True
+        return self._entry[field]
+
+    def _cached(self, method, kwargs):
+        field = f"{method}:{json.dumps(kwargs, sort_keys=True)}"
+        return self.cached(field, lambda page: getattr(page, method)(**kwargs))
+
+    def extract_text(self, **kwargs):
+        return self._cached('extract_text', kwargs)
+
+    def extract_tables(self, table_settings=None):
+        return self._cached('extract_tables', {'table_settings': table_settings})
+
+    def save(self):
+        """
+        Persist newly computed fields
+        Returns True for a full cache hit, False for a miss, None if nothing was extracted
+        """
+        if self._entry is None:
+            return None
+        if self.dirty:
+            self._cache.store(self._key, self._entry)
+        return not self.dirty
@@ -0,0 +1,122 @@
+"""
+One parse of a PDF page, shared by every field extractor
+pdfplumber's extract_text(), search(), crop() and extract_tables() each walk
+the page's characters again. A PageModel groups them into positioned words
+once; text lines, regions, searches and table cells are all answered from
+those words.
+
+    model = PageModel.from_page(page)
+    model.search('Installation Parameters')   # top of the match, or None
+    specs = model.within((355, 110, 595, 300))
+    specs.text()                               # lines joined by newlines
+    specs.grid(columns, rows)                  # cell strings, row by row
+
+Coordinates are pdfplumber's: points from the top-left corner of the page.
+"""
+
+# Words whose tops differ by no more than this share a line
+LINE_TOLERANCE = 3
+
+
+def _centre(word):
+    return (word['x0'] + word['x1']) / 2, (word['top'] + word['bottom']) / 2
+
+
+class Line:
+    """Words on one baseline, left to right"""
+
+    def __init__(self, words):
+        self.words = sorted(words, key=lambda word: word['x0'])
+        self.top = min(word['top'] for word in words)
+        self.bottom = max(word['bottom'] for word in words)
+        self.text = ' '.join(word['text'] for word in self.words)
+
+    def find(self, needle):
+        """The word where needle starts in this line's text, or None"""
+        index = self.text.find(needle)
+        if index < 0:
+            return None
+        offset = 0
+        for word in self.words:
+            offset += len(word['text']) + 1
+            if offset > index:
+                return word
+        return None
+
+
+class PageModel:
+    """Positioned words and shaded rectangles of a page (or of a region of one)"""
+
+    def __init__(self, words, rects, bbox):
+        self.words = words
+        self.rects = rects
+        self.bbox = bbox
+        self._lines = None
+
+    @classmethod
+    def from_page(cls, page):
+        rects = [{key: rect[key] for key in ('x0', 'x1', 'top', 'bottom')} for rect in page.rects]
+        return cls(page.extract_words(), rects, tuple(page.bbox))
+
+    @property
+    def lines(self):
+        if self._lines is None:
+            self._lines = []
+            current = []
+            for word in sorted(self.words, key=lambda word: (word['top'], word['x0'])):
+                if current and word['top'] - current[0]['top'] > LINE_TOLERANCE:
+                    self._lines.append(Line(current))
+                    current = []
+                current.append(word)
+            if current:
+                self._lines.append(Line(current))
+        return self._lines
+
+    def within(self, bbox):
+        """
+        The part of the page inside bbox: words whose centre falls in it, and
+        the rectangles overlapping it, clipped to it
+        """
+        x0, top, x1, bottom = bbox
+        words = [word for word in self.words
+                 if x0 <= _centre(word)[0] < x1 and top <= _centre(word)[1] < bottom]
+        rects = [{'x0': max(rect['x0'], x0), 'x1': min(rect['x1'], x1),
+                  'top': max(rect['top'], top), 'bottom': min(rect['bottom'], bottom)}
+                 for rect in self.rects
+                 if rect['x0'] < x1 and rect['x1'] > x0 and rect['top'] < bottom and rect['bottom'] > top]
+        return PageModel(words, rects, bbox)
+
+    def text(self):
+        return '\n'.join(line.text for line in self.lines)
+
+    def search(self, needle):
+        """Top of the first occurrence of needle (within one line), or None"""
+        for line in self.lines:
+            word = line.find(needle)
+            if word is not None:
+                return word['top']
+        return None
+
+    def grid(self, columns, rows):
+        """
+        Cell strings of the table ruled by the column and row lines (both
+        sorted), one list per row. A word belongs to the cell holding its
+        centre; words outside the outer lines are dropped.
+        """
+        cells = [[[] for _ in columns[1:]] for _ in rows[1:]]
+        for line in self.lines:
+            for word in line.words:
+                x, y = _centre(word)
+                column = _slot(columns, x)
+                row = _slot(rows, y)
+                if column is not None and row is not None:
+                    cells[row][column].append(word['text'])
+        return [[' '.join(cell) for cell in row] for row in cells]
+
+
+def _slot(edges, value):
+    """Index of the interval of sorted edges holding value, or None"""
+    for index in range(len(edges) - 1):
+        if edges[index] <= value < edges[index + 1]:
+            return index
+    return None
@@ -0,0 +1,147 @@
+"""
+Per-page stage timings and counters for the PDF extraction scripts
+Extractors mark their stages and tallies with the module-level helpers:
+
+    with stage('extract_tables'):
+        tables = page.extract_tables()
+    count('variants_from_text', len(found))
+
+pdf_engine.extract_pages() opens a PageStats around every page (in whichever
+worker process runs it) and ships it back with the result. When no page is
+being recorded the helpers do nothing, so the extractors still run as plain
+functions.
+
+A RunReport collects the pages of one run and writes them as JSON:
+    {"script": ..., "seconds": ..., "totals": {"stages": {...}, "counters": {...}},
+     "pages": [{"page": 3, "seconds": 0.41, "cache_hit": false,
+                "stages": {"extract_text": 0.12, ...}, "counters": {...}}, ...]}
+"""
+
+import json
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_REPORT_DIR = Path(".cache/reports")
+
+# PageStats of the page this process is extracting, set by record_page()
+_current = None
+
+
+class PageStats:
+    """Stage seconds and counters for one page"""
+
+    def __init__(self, page_number):
+        self.page = page_number
+        self.seconds = 0.0
+        self.cache_hit = None
+        self.stages = Counter()
+        self.counters = Counter()
+
+    def to_json(self):
+        return {
+            'page': self.page,
+            'seconds': round(self.seconds, 4),
+            'cache_hit': self.cache_hit,
+            'stages': {name: round(seconds, 4) for name, seconds in self.stages.items()},
+            'counters': dict(self.counters),
+        }
+
+
+@contextmanager
+def record_page(page_number):
+    """Make a fresh PageStats current for the duration of one page"""
+    global _current
+    stats = PageStats(page_number)
+    previous, _current = _current, stats
+    started = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.seconds = time.perf_counter() - started
+        _current = previous
+
+
+@contextmanager
+def stage(name):
+    """Time a block against the current page (no-op outside record_page)"""
+    stats = _current
+    if stats is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.stages[name] += time.perf_counter() - started
+
+
+def count(name, n=1):
+    """Add n to a counter on the current page (no-op outside record_page)"""
+    if _current is not None:
+        _current.counters[name] += n
+
+
+class RunReport:
+    """Per-page stats for one extraction run, written as a JSON report"""
+
+    def __init__(self, script, pdf_path=None):
+        self.script = script
+        self.pdf_path = str(pdf_path) if pdf_path else None
+        self.pages = []
+        self.started = time.perf_counter()
+        self.seconds = None
+
+    def add(self, stats):
+        if stats is not None:
+            self.pages.append(stats)
+
+    def finish(self):
+        self.seconds = time.perf_counter() - self.started
+
+    def totals(self):
+        stages, counters = Counter(), Counter()
+        for stats in self.pages:
+            stages.update(stats.stages)
+            counters.update(stats.counters)
+        return stages, counters
+
+    def to_json(self):
+        stages, counters = self.totals()
+        return {
+            'script': self.script,
+            'pdf': self.pdf_path,
+            'seconds': round(self.seconds if self.seconds is not None else time.perf_counter() - self.started, 3),
+            'page_seconds': round(sum(stats.seconds for stats in self.pages), 3),
+            'totals': {
+                'stages': {name: round(seconds, 3) for name, seconds in stages.most_common()},
+                'counters': dict(counters.most_common()),
+            },
+            'pages': [stats.to_json() for stats in self.pages],
+        }
+
+    def write(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f, indent=2)
+        return path
+
+    def summary(self, slowest=5):
+        """Print where the time went: stage totals, counters and the slowest pages"""
+        stages, counters = self.totals()
+        page_seconds = sum(stats.seconds for stats in self.pages) or 1
+        print(f"\n{'='*60}")
+        print(f"Stage times over {len(self.pages)} pages ({page_seconds:.2f}s in page functions)")
+        for name, seconds in stages.most_common():
+            print(f"  {name:28} {seconds:8.3f}s  {seconds / page_seconds * 100:5.1f}%")
+        if counters:
+            print("Counters")
+            for name, value in counters.most_common():
+                print(f"  {name:28} {value:8}")
+        print("Slowest pages")
+        for stats in sorted(self.pages, key=lambda s: s.seconds, reverse=True)[:slowest]:
+            top = stats.stages.most_common(1)
+            print(f"  page {stats.page:<4} {stats.seconds:8.3f}s" + (f"  ({top[0][0]} {top[0][1]:.3f}s)" if top else ''))
+        print(f"{'='*60}")
@@ -0,0 +1,257 @@
+"""
+Pre-render the catalogue pages from their JSON
+The accessory catalogue pages (gbat-catalog.html and its siblings, plus
+gaco-template.html) and the fastener pages (gbhc-catalog.html, ...) used to
+fetch their JSON and build the spec list, variant grid and table with
+innerHTML after load. This renders that content straight into each page,
+using the page itself as the template: every region is located by its id
+and its contents replaced, so re-running after a JSON edit refreshes the
+page. Grid images get <picture> markup from data/images.json
+(build_images.py).
+
+Pages:
+    <name>.html with id="spec-list" <- data/<name>.json (gaco-template.html <- data/gaco-catalog.json)
+    FASTENER_PAGES                  <- data/fasteners-catalog.json[key]
+
+anchor-template.html, strut-template.html and c-channel-template.html pick
+their product from the query string, so they stay client-rendered.
+
+Usage:
+    python prerender_catalogs.py
+    python prerender_catalogs.py --check        # exit 1 if any page is stale
+    python prerender_catalogs.py gbat-catalog.html
+"""
+
+import argparse
+import html
+import json
+import re
+import sys
+from pathlib import Path
+
+from build_images import load_manifest, picture
+
+ROOT = Path(__file__).resolve().parent
+FASTENERS_CATALOG = 'data/fasteners-catalog.json'
+PLACEHOLDER_IMAGE = 'assets/img/placeholder.png'
+GRID_IMAGE_SIZES = '160px'
+
+# Pages whose JSON is not data/<page name>.json
+DATA_FILES = {
+    'gaco-template.html': 'data/gaco-catalog.json',
+}
+
+# Fastener page -> (key in fasteners-catalog.json, product fields in table column order)
+FASTENER_PAGES = {
+    'gbhc-catalog.html': ('gbhc', ['productCode', 'size', 'maxRecLoads']),
+    'gmshn-catalog.html': ('gmshn', ['productCode', 'size', 'maxRecLoads']),
+    'gmsls-catalog.html': ('gmsls', ['productCode', 'size', 'maxRecLoads']),
+    'gmsps-catalog.html': ('gmsps', ['productCode', 'size', 'nutThickness']),
+    'gmsqf-catalog.html': ('gmsqf', ['productCode', 'size', 'nutThickness']),
+    'gmtmc-catalog.html': ('gmtmc', ['productCode', 'size', 'outerDia', 'couplerLength',
+                                     'threadedLength', 'recLoads']),
+}
+
+TAG_RE = re.compile(r'<(/?)([a-zA-Z0-9]+)\b[^>]*>')
+
+
+def text(value):
+    """Escaped cell/list text; numbers print as JavaScript would (4.0 -> 4)"""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return html.escape(str(value), quote=False).replace('\n', '<br>')
+
+
+def cell(value):
+    """Table cell, '-' for empty values like the old renderTable()"""
+    return text(value) if value not in (None, '') else '-'
+
+
+def inner_span(page, open_pattern, pos=0):
+    """(start, end) of the contents of the first element after pos whose opening tag matches open_pattern"""
+    opening = re.compile(open_pattern).search(page, pos)
+    if not opening:
+        return None
+    tag = TAG_RE.match(page, opening.start()).group(2).lower()
+    depth = 1
+    for m in TAG_RE.finditer(page, opening.end()):
+        if m.group(2).lower() != tag:
+            continue
+        depth += -1 if m.group(1) else 1
+        if depth == 0:
+            return opening.end(), m.start()
+    raise ValueError(f"unclosed <{tag}> for {open_pattern}")
+
+
+def set_inner(page, open_pattern, content, pos=0):
+    """
+    Replace the contents of an element; content is a string (inline) or a
+    list of lines, written one per line and indented under the element
+    """
+    span = inner_span(page, open_pattern, pos)
+    if span is None:
+        return page, False
+    start, end = span
+    if isinstance(content, list):
+        indent = re.match(r'[ \t]*', page[page.rfind('\n', 0, start) + 1:]).group(0)
+        content = ''.join(f"\n{indent}  {line}" for line in content) + f"\n{indent}" if content else ''
+    return page[:start] + content + page[end:], True
+
+
+def spec_items(spec):
+    """Specification list entries; the dict form is {'Material': ..., 'Surface': str | [..]}"""
+    if isinstance(spec, list):
+        return spec
+    if isinstance(spec, dict):
+        items = [f"Material: {spec['Material']}"] if spec.get('Material') else []
+        surface = spec.get('Surface')
+        if isinstance(surface, list):
+            items += surface
+        elif surface:
+            items.append(f"Surface: {surface}")
+        return items
+    return []
+
+
+def set_title(page, title):
+    """Page <title> keeps its suffix (' – GREEN MAN', ' – Product Catalog')"""
+    def replace(m):
+        suffix = m.group(2)[m.group(2).find(' – '):] if ' – ' in m.group(2) else ''
+        return f"{m.group(1)}{html.escape(title, quote=False)}{suffix}{m.group(3)}"
+    return re.sub(r'(<title>)(.*?)(</title>)', replace, page, count=1, flags=re.DOTALL)
+
+
+def render_accessory(page, data, images):
+    """gbat-catalog.html style: title, spec list, definition, components, variant grid, table"""
+    missing = []
+
+    def fill(pattern, content):
+        nonlocal page
+        # Everything rendered lives in <main>, after the inlined navbar
+        page, found = set_inner(page, pattern, content, max(page.find('<main'), 0))
+        if not found:
+            missing.append(pattern)
+
+    if data.get('title'):
+        page = set_title(page, data['title'])
+        fill(r'<div class="title">', text(data['title']))
+
+    fill(r'<ul id="spec-list"[^>]*>', [f"<li>{text(s)}</li>" for s in spec_items(data.get('specification'))])
+    if data.get('definition'):
+        fill(r'<p id="definition"[^>]*>', text(data['definition']))
+    if isinstance(data.get('components'), list) and 'id="components-list"' in page:
+        fill(r'<ul id="components-list"[^>]*>', [f"<li>{text(c)}</li>" for c in data['components']])
+
+    fill(r'<div id="grid"[^>]*>', [
+        '<div class="item">'
+        '<span class="tick">✓</span>'
+        + picture(images, item.get('image') or PLACEHOLDER_IMAGE, item.get('code', ''), GRID_IMAGE_SIZES)
+        + f'<div class="code">{text(item.get("code", ""))}</div>'
+        '</div>'
+        for item in data.get('items', [])
+    ])
+
+    rows = data.get('table') or []
+    if 'id="table-header"' in page:
+        # Header row comes from the JSON keys (gahi-catalog.html)
+        headers = list(rows[0]) if rows else []
+        fill(r'<tr id="table-header"[^>]*>', [f"<th>{text(h)}</th>" for h in headers])
+        fill(r'<tbody id="table-body"[^>]*>', [
+            '<tr>' + ''.join(f"<td>{text(row.get(h, ''))}</td>" for h in headers) + '</tr>' for row in rows
+        ])
+    else:
+        # Columns are the page's own <th> labels, which are the JSON keys
+        table = inner_span(page, r'<table[^>]*>', max(page.find('<main'), 0))
+        headers = re.findall(r'<th(?:\s[^>]*)?>(.*?)</th>', page[table[0]:table[1]], re.DOTALL) if table else []
+        headers = [html.unescape(h.strip()) for h in headers]
+        fill(r'<tbody[^>]*>', [
+            '<tr>' + ''.join(f"<td>{cell(row.get(h))}</td>" for h in headers) + '</tr>' for row in rows
+        ])
+    return page, missing
+
+
+def render_fastener(page, product, fields):
+    """gbhc-catalog.html style: definition, finish list, product table"""
+    missing = []
+    for pattern, content in [
+        (r'<p id="productDefinition"[^>]*>', text(product.get('description', ''))),
+        (r'<ul[^>]*id="finishList"[^>]*>', [
+            f"<li>{text(finish)}</li>" for finish in product.get('specifications', {}).get('finish', [])
+        ]),
+        (r'<tbody id="productTableBody"[^>]*>', [
+            '<tr>' + ''.join(f"<td>{cell(p.get(field))}</td>" for field in fields) + '</tr>'
+            for p in product.get('products', [])
+        ]),
+    ]:
+        page, found = set_inner(page, pattern, content)
+        if not found:
+            missing.append(pattern)
+    return page, missing
+
+
+def catalog_pages(root):
+    """page name -> (kind, data file, fastener key/fields)"""
+    pages = {}
+    for path in sorted(root.glob('*.html')):
+        data_file = DATA_FILES.get(path.name, f"data/{path.stem}.json")
+        if (root / data_file).exists() and 'id="spec-list"' in path.read_text(encoding='utf-8'):
+            pages[path.name] = ('accessory', data_file, None)
+    for name, spec in FASTENER_PAGES.items():
+        pages[name] = ('fastener', FASTENERS_CATALOG, spec)
+    return pages
+
+
+def build(names=None, check=False, root=ROOT):
+    root = Path(root)
+    pages = catalog_pages(root)
+    unknown = set(names or []) - set(pages)
+    if unknown:
+        raise SystemExit(f"Not a catalogue page: {', '.join(sorted(unknown))}")
+
+    images = load_manifest(root)
+    documents = {}
+    changed = []
+    for name in names or sorted(pages):
+        kind, data_file, spec = pages[name]
+        if data_file not in documents:
+            with open(root / data_file, 'r', encoding='utf-8') as f:
+                documents[data_file] = json.load(f)
+
+        path = root / name
+        page = path.read_text(encoding='utf-8')
+        if kind == 'accessory':
+            updated, missing = render_accessory(page, documents[data_file], images)
+        else:
+            key, fields = spec
+            updated, missing = render_fastener(page, documents[data_file][key], fields)
+
+        for pattern in missing:
+            print(f"⚠️  {name}: no element matching {pattern}")
+        if re.search(rf"fetch\(['\"]{re.escape(data_file)}['\"]\)", updated):
+            print(f"⚠️  {name}: still renders {data_file} at runtime")
+        if updated != page:
+            changed.append(name)
+            if not check:
+                path.write_text(updated, encoding='utf-8')
+
+    verb = 'stale' if check else 'updated'
+    print(f"{'='*60}")
+    print(f"{len(changed)} of {len(names or pages)} catalogue page(s) {verb}"
+          + (f": {', '.join(changed)}" if changed and check else ''))
+    print(f"{'='*60}")
+    return changed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render catalogue pages from their JSON")
+    parser.add_argument('pages', nargs='*', help="pages to render (default: all catalogue pages)")
+    parser.add_argument('--check', action='store_true', help="only report pages that are out of date")
+    args = parser.parse_args(argv)
+
+    changed = build(args.pages, check=args.check)
+    if args.check and changed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,365 @@
+"""
+Document AI OCR for catalogue PDFs, in resumable concurrent page chunks
+process_pdf_documentai.sh sends a whole PDF in one request and the batch
+script round-trips it through Cloud Storage; either way one failure means
+starting again. This runner splits the PDF into chunks of pages, sends up to
+--concurrency chunks at a time with retries and backoff, and merges the page
+texts into the shapes the repo already keeps:
+
+    ocr_tables_raw.json   [{"page": 1, "text": "..."}, ...]            every page
+    all_pages_ocr.json    [{"page": 1, "product_code": "GACO", ...}]   pages with a (CODE) title
+
+Each page's OCR text is stored under .cache/documentai by the hash of the
+page's content as soon as its chunk comes back. That store is the checkpoint:
+an interrupted run resumes with the chunks that never finished, and a revised
+catalogue only sends the pages that changed.
+
+mock_documentai_server.py answers the same requests locally, so the whole
+pipeline runs offline:
+
+Usage:
+    python process_pdf_documentai.py uploads/catalogs/strut.pdf
+    python process_pdf_documentai.py catalogue.pdf --chunk-pages 10 --concurrency 8
+    python process_pdf_documentai.py catalogue.pdf --processor-id 1a2b3c --project my-project
+    python mock_documentai_server.py --port 8765 &
+    python process_pdf_documentai.py catalogue.pdf --endpoint http://127.0.0.1:8765/v1/mock:process
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import pdfplumber
+import pypdfium2
+
+from pdf_page_cache import page_content_hash
+
+DEFAULT_CACHE_DIR = Path(".cache/documentai")
+DEFAULT_OUTPUT_DIR = Path(".")
+TEXT_OUTPUT = "ocr_tables_raw.json"
+PRODUCT_OUTPUT = "all_pages_ocr.json"
+
+# Imageless OCR accepts up to 30 pages per request
+DEFAULT_CHUNK_PAGES = 15
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RETRIES = 5
+BACKOFF_SECONDS = 1.0
+REQUEST_TIMEOUT = 300
+
+PROCESSOR_NAME = "CatalogParser"
+PROCESSOR_TYPE = "OCR_PROCESSOR"
+API_ROOT = "https://{region}-documentai.googleapis.com/v1"
+
+# Same OCR options as process_pdf_documentai.sh; part of the cache key
+PROCESS_OPTIONS = {
+    "processOptions": {
+        "ocrConfig": {
+            "enableImageQualityScores": False,
+            "enableSymbol": True,
+            "computeStyleInfo": False,
+            "disableCharacterBoxesDetection": True,
+        }
+    },
+    "imagelessMode": True,
+    "skipHumanReview": True,
+}
+
+# Title like "@ Angle Connector's (GACO )"
+PRODUCT_CODE = re.compile(r'\(\s*([A-Z]{2,6})\s*\)')
+
+# HTTP statuses worth retrying; anything else is a bad request
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+class RequestFailed(Exception):
+    """A chunk request that failed for good (bad request, or out of retries)"""
+
+
+def _options_key():
+    return hashlib.sha256(json.dumps(PROCESS_OPTIONS, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def _write_json(path, data, **kwargs):
+    """Atomic write, so an interrupted run never leaves half a file"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, **kwargs)
+    os.replace(tmp_path, path)
+
+
+class OcrCache:
+    """Per-page OCR text keyed by page content hash and the OCR options"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.options_key = _options_key()
+        self.hits = 0
+
+    def _page_path(self, page_hash):
+        return self.cache_dir / page_hash[:2] / f"{page_hash}-{self.options_key}.json"
+
+    def load_page(self, page_hash):
+        try:
+            with open(self._page_path(page_hash), 'r', encoding='utf-8') as f:
+                return json.load(f)['text']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def store_page(self, page_hash, text):
+        _write_json(self._page_path(page_hash), {'text': text}, ensure_ascii=False)
+
+
+def page_hashes(pdf_path):
+    """Content hash of every page, in page order"""
+    with pdfplumber.open(pdf_path) as pdf:
+        return [page_content_hash(page) for page in pdf.pages]
+
+
+def make_chunks(page_count, chunk_pages, pending):
+    """1-based (first, last) page ranges covering the pending pages, at most chunk_pages long"""
+    chunks = []
+    for number in range(1, page_count + 1):
+        if number not in pending:
+            continue
+        if chunks and chunks[-1][1] == number - 1 and number - chunks[-1][0] < chunk_pages:
+            chunks[-1] = (chunks[-1][0], number)
+        else:
+            chunks.append((number, number))
+    return chunks
+
+
+def chunk_pdf(document, first, last):
+    """Bytes of a new PDF holding pages first..last of an open pypdfium2 document"""
+    chunk = pypdfium2.PdfDocument.new()
+    chunk.import_pages(document, list(range(first - 1, last)))
+    buffer = io.BytesIO()
+    chunk.save(buffer)
+    chunk.close()
+    return buffer.getvalue()
+
+
+def page_texts(response):
+    """OCR text of each page of a Document AI process response, in page order"""
+    document = response.get('document', {})
+    text = document.get('text', '')
+    texts = []
+    for page in document.get('pages', []):
+        # int64 fields arrive as strings, and a zero startIndex is omitted
+        segments = page.get('layout', {}).get('textAnchor', {}).get('textSegments', [])
+        texts.append(''.join(text[int(segment.get('startIndex', 0)):int(segment['endIndex'])]
+                             for segment in segments))
+    return texts
+
+
+class DocumentAiClient:
+    """POSTs raw PDF bytes to a :process endpoint, retrying transient failures"""
+
+    def __init__(self, endpoint, token=None, retries=DEFAULT_RETRIES, backoff=BACKOFF_SECONDS):
+        self.endpoint = endpoint
+        self.token = token
+        self.retries = retries
+        self.backoff = backoff
+
+    def _post(self, body):
+        headers = {'Content-Type': 'application/json'}
+        if self.token:
+            headers['Authorization'] = f"Bearer {self.token}"
+        request = urllib.request.Request(self.endpoint, data=body, headers=headers, method='POST')
+        with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+            return json.load(response)
+
+    def process(self, pdf_bytes, label=''):
+        body = json.dumps({
+            'rawDocument': {'content': base64.b64encode(pdf_bytes).decode('ascii'), 'mimeType': 'application/pdf'},
+            **PROCESS_OPTIONS,
+        }).encode()
+
+        for attempt in range(self.retries + 1):
+            try:
+                return self._post(body)
+            except urllib.error.HTTPError as e:
+                if e.code not in RETRY_STATUSES:
+                    detail = e.read().decode('utf-8', 'replace')[:500]
+                    raise RequestFailed(f"HTTP {e.code}: {detail}") from e
+                error, retry_after = f"HTTP {e.code}", e.headers.get('Retry-After')
+            except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+                error, retry_after = str(getattr(e, 'reason', e)), None
+
+            if attempt == self.retries:
+                raise RequestFailed(f"{error} after {self.retries + 1} attempts")
+            # Exponential backoff with jitter, unless the server says how long to wait
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else \
+                self.backoff * 2 ** attempt + random.uniform(0, self.backoff)
+            print(f"⚠️  {label}: {error}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
+def run(pdf_path, client, cache, chunk_pages=DEFAULT_CHUNK_PAGES, concurrency=DEFAULT_CONCURRENCY):
+    """
+    OCR every page of pdf_path, sending only pages missing from the cache
+    Returns the page texts (None for pages whose chunk failed) and the number
+    of failed chunks.
+    """
+    hashes = page_hashes(pdf_path)
+    texts = [cache.load_page(page_hash) for page_hash in hashes]
+    cache.hits = sum(text is not None for text in texts)
+    pending = {number for number, text in enumerate(texts, 1) if text is None}
+
+    chunks = make_chunks(len(hashes), chunk_pages, pending)
+    print(f"Pages: {len(hashes)} ({cache.hits} cached), chunks to send: {len(chunks)}")
+    if not chunks:
+        return texts, 0
+
+    document = pypdfium2.PdfDocument(str(pdf_path))
+    failed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            futures = {}
+            for first, last in chunks:
+                label = f"pages {first}-{last}"
+                # pypdfium2 is not thread-safe, so chunks are cut here and only sent in the pool
+                futures[pool.submit(client.process, chunk_pdf(document, first, last), label)] = (first, last, label)
+
+            for future in as_completed(futures):
+                first, last, label = futures[future]
+                try:
+                    chunk_texts = page_texts(future.result())
+                except RequestFailed as e:
+                    print(f"❌ {label}: {e}")
+                    failed += 1
+                    continue
+                if len(chunk_texts) != last - first + 1:
+                    print(f"❌ {label}: response has {len(chunk_texts)} pages")
+                    failed += 1
+                    continue
+
+                for number, text in enumerate(chunk_texts, first):
+                    texts[number - 1] = text
+                    cache.store_page(hashes[number - 1], text)
+                print(f"OK {label}")
+    finally:
+        document.close()
+    return texts, failed
+
+
+def write_outputs(texts, output_dir=DEFAULT_OUTPUT_DIR):
+    """ocr_tables_raw.json (every page) and all_pages_ocr.json (pages with a product code)"""
+    pages = [{'page': number, 'text': text} for number, text in enumerate(texts, 1)]
+    products = []
+    for page in pages:
+        if match := PRODUCT_CODE.search(page['text']):
+            products.append({'page': page['page'], 'product_code': match.group(1), 'text': page['text']})
+
+    output_dir = Path(output_dir)
+    _write_json(output_dir / TEXT_OUTPUT, pages, indent=2)
+    _write_json(output_dir / PRODUCT_OUTPUT, products, indent=2)
+    return output_dir / TEXT_OUTPUT, output_dir / PRODUCT_OUTPUT
+
+
+def _gcloud(*args):
+    try:
+        result = subprocess.run(['gcloud', *args], capture_output=True, text=True, check=False)
+    except OSError:
+        return ''
+    return result.stdout.strip() if result.returncode == 0 else ''
+
+
+def access_token():
+    return _gcloud('auth', 'application-default', 'print-access-token') or _gcloud('auth', 'print-access-token')
+
+
+def _api(method, url, token, body=None):
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(url, data=data, method=method, headers={
+        'Authorization': f"Bearer {token}", 'Content-Type': 'application/json'})
+    with urllib.request.urlopen(request, timeout=60) as response:
+        return json.load(response)
+
+
+def find_processor(project, region, token):
+    """Id of the CatalogParser OCR processor, creating it if the project has none"""
+    url = f"{API_ROOT.format(region=region)}/projects/{project}/locations/{region}/processors"
+    for processor in _api('GET', url, token).get('processors', []):
+        if processor.get('displayName') == PROCESSOR_NAME:
+            return processor['name'].rsplit('/', 1)[-1]
+    print(f"Processor '{PROCESSOR_NAME}' not found. Creating...")
+    created = _api('POST', url, token, {'displayName': PROCESSOR_NAME, 'type': PROCESSOR_TYPE})
+    return created['name'].rsplit('/', 1)[-1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="OCR a catalogue PDF with Document AI in resumable concurrent chunks")
+    parser.add_argument('pdf', type=Path, help="catalogue PDF to OCR")
+    parser.add_argument('--output-dir', type=Path, default=DEFAULT_OUTPUT_DIR,
+                        help=f"where to write {TEXT_OUTPUT} and {PRODUCT_OUTPUT}")
+    parser.add_argument('--endpoint', default=None,
+                        help="full :process URL (e.g. the mock server); default: the project's CatalogParser")
+    parser.add_argument('--project', default=None, help="GCP project (default: gcloud config)")
+    parser.add_argument('--region', default=None, help="Document AI region (default: gcloud config, else us)")
+    parser.add_argument('--processor-id', default=None, help="processor id (default: find or create CatalogParser)")
+    parser.add_argument('--chunk-pages', type=int, default=DEFAULT_CHUNK_PAGES, help="pages per request (max 30)")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help="requests in flight at once")
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES, help="retries per chunk on transient errors")
+    parser.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE_DIR, help="OCR page cache directory")
+    args = parser.parse_args(argv)
+
+    if not args.pdf.exists():
+        print(f"ERROR: PDF not found: {args.pdf}")
+        return 1
+    if not 1 <= args.chunk_pages <= 30:
+        print("ERROR: --chunk-pages must be between 1 and 30")
+        return 1
+
+    print("=" * 60)
+    print("Document AI OCR")
+    print("=" * 60)
+    print(f"PDF: {args.pdf}")
+
+    token = None
+    endpoint = args.endpoint
+    if endpoint is None:
+        project = args.project or _gcloud('config', 'get-value', 'project')
+        region = args.region or _gcloud('config', 'get-value', 'compute/region') or 'us'
+        token = access_token()
+        if not project or not token:
+            print("ERROR: No GCP project or credentials. Run: gcloud config set project YOUR_PROJECT_ID")
+            return 1
+        processor_id = args.processor_id or find_processor(project, region, token)
+        endpoint = (f"{API_ROOT.format(region=region)}/projects/{project}/locations/{region}"
+                    f"/processors/{processor_id}:process")
+    print(f"Endpoint: {endpoint}")
+
+    client = DocumentAiClient(endpoint, token, retries=args.retries)
+    cache = OcrCache(args.cache_dir)
+    started = time.perf_counter()
+    texts, failed = run(args.pdf, client, cache, args.chunk_pages, args.concurrency)
+
+    done = sum(text is not None for text in texts)
+    print(f"\n{'='*60}")
+    print(f"{done}/{len(texts)} pages in {time.perf_counter() - started:.1f}s ({cache.hits} from cache)")
+    if failed:
+        # Leave the previous outputs alone rather than write a partial set
+        print(f"❌ {failed} chunk(s) failed - run again to resume; outputs not written")
+    else:
+        text_path, product_path = write_outputs(texts, args.output_dir)
+        print(f"Saved: {text_path}, {product_path}")
+    print("=" * 60)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
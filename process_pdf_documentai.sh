@@ -2,6 +2,7 @@
 
 # Document AI PDF Processing Script
 # Usage: ./process_pdf_documentai.sh <path_to_pdf>
+# For chunked, concurrent and resumable runs use process_pdf_documentai.py
 
 set -e  # Exit on error
 
@@ -2,6 +2,7 @@
 
 # Document AI PDF Processing Script (Batch Mode for Large PDFs)
 # Usage: ./process_pdf_documentai_batch.sh <path_to_pdf>
+# For chunked, concurrent and resumable runs use process_pdf_documentai.py
 
 set -e  # Exit on error
 
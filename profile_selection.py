@@ -0,0 +1,243 @@
+"""
+Batch profile selection for support schedules
+For each support (span, load case, design load) pick the lightest strut or
+C-channel profile that carries the load, ranked by weight_kg_m.
+
+CapacityIndex precomputes load_capacity.capacities() for every trusted
+profile on a span grid (profiles whose section properties disagree with
+their published table take that table instead, each grid span read at the
+next published span up; the 'basis' column says which), orders the
+profiles by weight and keeps a running
+maximum of capacity along that order. The running maximum never decreases,
+so the first profile whose running capacity reaches the load is the
+lightest adequate one, and every support is resolved by one vectorized
+binary search. Spans are rounded up to the next grid point, which can only
+under-state capacity.
+
+Input CSV columns: span_mm, case (1-5 or case1-case5), load_N, plus any
+others (e.g. support id), which are copied through. A row whose span, case
+or load cannot be used gets the status 'invalid input: <field>' rather than
+'no adequate profile'.
+
+Usage:
+    python profile_selection.py supports.csv -o selected.csv
+    python profile_selection.py supports.csv --family strut
+"""
+
+import argparse
+import csv
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from load_capacity import CASES, capacities, check_catalog, load_profiles, published_capacities, section_arrays
+
+ROOT = Path(__file__).resolve().parent
+DEFAULT_STEP_MM = 10
+DEFAULT_MAX_SPAN_MM = 3000
+
+FAMILIES = {
+    'strut': 'data/strut-channel-catalog.json',
+    'c-channel': 'data/c-channel-catalog.json',
+}
+
+
+class CapacityIndex:
+    """Weight-ordered running capacity per (case, span grid point)"""
+
+    def __init__(self, profiles, running, step, max_span):
+        self.profiles = profiles      # weight order
+        self.running = running        # (cases, grid spans, profiles)
+        self.step = step
+        self.max_span = max_span
+        self.excluded = []            # profiles with neither trusted properties nor a table
+
+    @classmethod
+    def build(cls, families=None, step=DEFAULT_STEP_MM, max_span=DEFAULT_MAX_SPAN_MM, root=ROOT):
+        wanted = {FAMILIES[name] for name in (families or FAMILIES)}
+        grid = np.arange(step, max_span + step, step, dtype=float)
+        profiles, blocks = [], []
+
+        excluded = []
+        for rel_path, settings, products in load_profiles(root):
+            if rel_path not in wanted:
+                continue
+            # Profiles whose section properties reproduce their published table are
+            # computed; the others are read off the table itself
+            report = check_catalog(products, settings)
+            trusted = [p for p, entry in zip(products, report) if entry['status'] == 'ok']
+            tabled = [p for p, entry in zip(products, report) if entry['status'] != 'ok' and entry['rows']]
+            excluded += [f"{entry['id']} ({entry['status']})" for entry in report
+                         if entry['status'] != 'ok' and not entry['rows']]
+            if trusted:
+                modulus, inertia = section_arrays(trusted, settings)
+                blocks.append(capacities(modulus, inertia, grid, settings['elastic_modulus'])['load'])
+            if tabled:
+                blocks.append(np.stack([published_capacities(p, settings, grid) for p in tabled]))
+            for product, basis in [(p, 'section properties') for p in trusted] + [(p, 'published table') for p in tabled]:
+                properties = product.get('properties', {})
+                profiles.append({
+                    'id': product['id'],
+                    'identification': properties.get('identification', product['id']),
+                    'weight_kg_m': float(properties.get('weight_kg_m') or 0),
+                    'basis': basis,
+                })
+
+        if not profiles:
+            raise ValueError("No profiles with usable section properties or load tables")
+
+        load = np.concatenate(blocks)                  # (profiles, spans, cases)
+        order = np.argsort([p['weight_kg_m'] for p in profiles], kind='stable')
+        load = load[order].transpose(2, 1, 0)          # (cases, spans, profiles)
+        running = np.maximum.accumulate(load, axis=2)
+        index = cls([profiles[i] for i in order], running, step, max_span)
+        index.excluded = excluded
+        return index
+
+    def select(self, spans, cases, loads):
+        """
+        Lightest adequate profile per support
+        spans (mm), cases (0-based case index), loads (N): equal-length arrays.
+        Returns (profile index into self.profiles or -1, capacity in N or nan).
+        """
+        spans = np.asarray(spans, dtype=float)
+        cases = np.asarray(cases, dtype=int)
+        loads = np.asarray(loads, dtype=float)
+
+        valid = (spans > 0) & (spans <= self.max_span) & (cases >= 0) & (cases < len(CASES))
+        grid = np.where(valid, np.ceil(spans / self.step).astype(int) - 1, 0)
+        case_index = np.where(valid, cases, 0)
+        running = self.running[case_index, grid]       # (supports, profiles), each row ascending
+
+        # Vectorized lower-bound binary search: first profile with running capacity >= load
+        low = np.zeros(len(loads), dtype=int)
+        high = np.full(len(loads), running.shape[1])
+        rows = np.arange(len(loads))
+        while (low < high).any():
+            active = low < high
+            mid = (low + high) // 2
+            below = running[rows, np.minimum(mid, running.shape[1] - 1)] < loads
+            low = np.where(active & below, mid + 1, low)
+            high = np.where(active & ~below, mid, high)
+
+        found = valid & (low < running.shape[1])
+        choice = np.where(found, low, -1)
+        capacity = np.where(found, running[rows, np.minimum(low, running.shape[1] - 1)], np.nan)
+        return choice, capacity
+
+
+def parse_case(value):
+    """'3', 'case3', 'CASE 3' -> 2; anything else -> -1"""
+    digits = ''.join(ch for ch in str(value) if ch.isdigit())
+    return int(digits) - 1 if digits else -1
+
+
+def parse_number(value):
+    """'1250' -> 1250.0; blank, non-numeric, nan or inf -> None"""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def check_row(span, case, load, max_span):
+    """Why a support cannot be looked up ('invalid input: <field> ...'), or None"""
+    if span is None:
+        return "invalid input: span_mm"
+    if not 0 < span <= max_span:
+        return f"invalid input: span_mm outside 0-{max_span:g}"
+    if not 0 <= case < len(CASES):
+        return f"invalid input: case (1-{len(CASES)})"
+    if load is None or load <= 0:
+        return "invalid input: load_N"
+    return None
+
+
+def select_schedule(rows, index):
+    """
+    Annotate CSV rows (dicts) with the selected profile; returns the new rows
+    Rows with a bad span, case or load get an 'invalid input' status naming
+    the field; 'no adequate profile' means no profile carries the load.
+    """
+    spans = [parse_number(row.get('span_mm')) for row in rows]
+    cases = [parse_case(row.get('case', '')) for row in rows]
+    loads = [parse_number(row.get('load_N')) for row in rows]
+    problems = [check_row(span, case, load, index.max_span) for span, case, load in zip(spans, cases, loads)]
+    choice, capacity = index.select([span if problem is None else 0 for span, problem in zip(spans, problems)],
+                                    cases,
+                                    [load if problem is None else 0 for load, problem in zip(loads, problems)])
+
+    selected = []
+    for row, i, cap, load, problem in zip(rows, choice, capacity, loads, problems):
+        out = dict(row)
+        if i < 0:
+            out.update({'profile': '', 'identification': '', 'weight_kg_m': '', 'basis': '',
+                        'capacity_N': '', 'utilization': '', 'status': problem or 'no adequate profile'})
+        else:
+            profile = index.profiles[i]
+            out.update({
+                'profile': profile['id'],
+                'identification': profile['identification'],
+                'weight_kg_m': profile['weight_kg_m'],
+                'basis': profile['basis'],
+                'capacity_N': int(cap),
+                'utilization': round(load / cap, 3) if cap else '',
+                'status': 'ok',
+            })
+        selected.append(out)
+    return selected
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pick the lightest adequate profile for each support in a CSV")
+    parser.add_argument('schedule', type=Path, help="CSV with span_mm, case and load_N columns")
+    parser.add_argument('-o', '--output', type=Path, help="output CSV (default: stdout)")
+    parser.add_argument('--family', choices=sorted(FAMILIES), action='append',
+                        help="limit to a profile family (repeatable; default: all)")
+    parser.add_argument('--step', type=float, default=DEFAULT_STEP_MM,
+                        help=f"span grid step in mm (default: {DEFAULT_STEP_MM})")
+    parser.add_argument('--max-span', type=float, default=DEFAULT_MAX_SPAN_MM,
+                        help=f"longest span in mm (default: {DEFAULT_MAX_SPAN_MM})")
+    args = parser.parse_args(argv)
+    if args.step <= 0 or args.max_span <= 0:
+        parser.error("--step and --max-span must be positive")
+
+    with open(args.schedule, 'r', encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))
+
+    start = time.perf_counter()
+    index = CapacityIndex.build(args.family, step=args.step, max_span=args.max_span)
+    built = time.perf_counter()
+    tabled = [p['id'] for p in index.profiles if p['basis'] == 'published table']
+    if tabled:
+        print(f"⚠️  {len(tabled)} profiles read off their published tables (properties disagree): "
+              f"{', '.join(tabled)}", file=sys.stderr)
+    if index.excluded:
+        print(f"⚠️  Excluded (no usable properties or table): {', '.join(index.excluded)}", file=sys.stderr)
+    selected = select_schedule(rows, index)
+    done = time.perf_counter()
+
+    if selected:
+        out = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+        try:
+            writer = csv.DictWriter(out, fieldnames=list(selected[0]))
+            writer.writeheader()
+            writer.writerows(selected)
+        finally:
+            if args.output:
+                out.close()
+
+    invalid = sum(1 for row in selected if row['status'].startswith('invalid input'))
+    unresolved = sum(1 for row in selected if row['status'] == 'no adequate profile')
+    print(f"Selected profiles for {len(selected)} supports ({unresolved} without an adequate profile, "
+          f"{invalid} with invalid input): "
+          f"index {(built - start) * 1000:.0f} ms, selection {(done - built) * 1000:.0f} ms",
+          file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,93 +1,222 @@
 // Service Worker for caching static assets
-const CACHE_NAME = 'greenman-v1';
-const ASSETS_TO_CACHE = [
-  '/',
-  '/index.html',
-  '/navbar.html',
-  '/footer.html',
-  '/navbar.css',
-  '/styles.css',
-  '/tailwind.min.css',
-  '/navbar.js',
-  '/assets/favicon.svg'
-];
-
-// Install event - cache critical assets
+//
+// - Site shell: precached from PRECACHE_MANIFEST (written by build_precache.py),
+//   keyed by content hash so a deploy only re-fetches files that changed
+// - data/*.json: stale-while-revalidate, so updated catalogues show up on the next visit
+// - Images: LRU cache capped by entry count and bytes
+// - Other pages/scripts/styles: stale-while-revalidate, capped by entry count
+//
+// Cache hits and misses are counted per cache; read them from a page with
+//   const channel = new MessageChannel();
+//   channel.port1.onmessage = (e) => console.table(e.data.caches);
+//   navigator.serviceWorker.controller.postMessage({ type: 'cache-stats' }, [channel.port2]);
+
+// <precache-manifest> (generated by build_precache.py - do not edit)
+const PRECACHE_MANIFEST = {"version":"f069e22645bc6593","files":[["/index.html","619dd9cb0c9b7bab"],["/navbar.css","cba215cf28660696"],["/styles.css","3477c2df7b26bd78"],["/tailwind.min.css","20bf64e5d8af837f"],["/navbar.js","3eb59ccb91f24e58"],["/assets/favicon.svg","e7a270abdb11b6bb"],["/js/catalog-worker.js","659beb58e025076a"],["/js/ggip-table-rows.js","6f2f3149a039440d"],["/js/partials.js","8e6cddef952e07eb"],["/js/product-renderer.js","697764bdfcdba5cd"],["/js/responsive-images.js","4714af452ae8af6d"],["/js/table-utils.js","a6d5c505168c614c"],["/js/table-window.js","55903619eb1c50b6"]]};
+// </precache-manifest>
+
+const PRECACHE = 'greenman-precache';
+const DATA_CACHE = 'greenman-data';
+const PAGE_CACHE = 'greenman-pages';
+const IMAGE_CACHE = 'greenman-images';
+
+const PAGE_CACHE_MAX_ENTRIES = 100;
+const IMAGE_CACHE_MAX_ENTRIES = 300;
+const IMAGE_CACHE_MAX_BYTES = 50 * 1024 * 1024;
+const SIZE_HEADER = 'X-SW-Bytes';
+
+const IMAGE_EXTENSIONS = /\.(png|jpe?g|gif|svg|webp|avif)$/i;
+const STATIC_EXTENSIONS = /\.(html|css|js|woff2?)$/i;
+
+// path -> cache key with the content hash, e.g. /styles.css -> /styles.css?__v=3fa9c2...
+const precacheKeys = new Map(
+  (PRECACHE_MANIFEST.files || []).map(([path, hash]) => [path, `${path}?__v=${hash}`])
+);
+if (precacheKeys.has('/index.html')) precacheKeys.set('/', precacheKeys.get('/index.html'));
+
+const stats = {};
+function count(cacheName, outcome) {
+  stats[cacheName] = stats[cacheName] || { hit: 0, miss: 0, revalidated: 0, evicted: 0 };
+  stats[cacheName][outcome] += 1;
+}
+
+// Install event - fetch only the precache entries not already stored under their hash
 self.addEventListener('install', (event) => {
   event.waitUntil(
-    caches.open(CACHE_NAME)
-      .then((cache) => {
-        console.log('Caching critical assets');
-        return cache.addAll(ASSETS_TO_CACHE);
+    caches.open(PRECACHE)
+      .then(async (cache) => {
+        const missing = [];
+        for (const [path, key] of precacheKeys) {
+          if (path !== '/' && !(await cache.match(key))) missing.push([path, key]);
+        }
+        console.log(`Precache ${PRECACHE_MANIFEST.version}: fetching ${missing.length} of ${precacheKeys.size} files`);
+        return Promise.all(missing.map(async ([path, key]) => {
+          // Bypass the HTTP cache - .js/.css are served as immutable
+          const response = await fetch(path, { cache: 'reload' });
+          if (!response.ok) throw new Error(`${path}: HTTP ${response.status}`);
+          return cache.put(key, response);
+        }));
       })
       .then(() => self.skipWaiting())
   );
 });
 
-// Activate event - clean up old caches
+// Activate event - drop old caches and precache entries from previous manifests
 self.addEventListener('activate', (event) => {
+  const current = [PRECACHE, DATA_CACHE, PAGE_CACHE, IMAGE_CACHE];
+  const keep = new Set([...precacheKeys.values()].map((key) => new URL(key, self.location).href));
   event.waitUntil(
-    caches.keys().then((cacheNames) => {
-      return Promise.all(
-        cacheNames.map((cacheName) => {
-          if (cacheName !== CACHE_NAME) {
+    caches.keys()
+      .then((cacheNames) => Promise.all(
+        cacheNames
+          .filter((cacheName) => !current.includes(cacheName))
+          .map((cacheName) => {
             console.log('Deleting old cache:', cacheName);
             return caches.delete(cacheName);
-          }
-        })
-      );
-    }).then(() => self.clients.claim())
+          })
+      ))
+      .then(() => caches.open(PRECACHE))
+      .then(async (cache) => {
+        const stale = (await cache.keys()).filter((request) => !keep.has(request.url));
+        return Promise.all(stale.map((request) => cache.delete(request)));
+      })
+      .then(() => self.clients.claim())
   );
 });
 
-// Fetch event - serve from cache, fallback to network
+// Precached shell: cache first, the key changes whenever the file does
+async function fromPrecache(request, key) {
+  const cache = await caches.open(PRECACHE);
+  const cached = await cache.match(key);
+  count(PRECACHE, cached ? 'hit' : 'miss');
+  if (cached) return cached;
+
+  const response = await fetch(request);
+  if (response.ok) cache.put(key, response.clone());
+  return response;
+}
+
+// Serve the cached copy at once and refresh it in the background
+async function staleWhileRevalidate(event, cacheName, maxEntries) {
+  const cache = await caches.open(cacheName);
+  const cached = await cache.match(event.request);
+  count(cacheName, cached ? 'hit' : 'miss');
+
+  const network = fetch(event.request).then(async (response) => {
+    if (response && response.status === 200) {
+      await cache.put(event.request, response.clone());
+      if (cached) count(cacheName, 'revalidated');
+      if (maxEntries) await trimEntries(cache, cacheName, maxEntries);
+    }
+    return response;
+  });
+
+  if (cached) {
+    event.waitUntil(network.catch(() => {}));
+    return cached;
+  }
+  return network;
+}
+
+async function trimEntries(cache, cacheName, maxEntries) {
+  // keys() is in insertion order, oldest first
+  const keys = await cache.keys();
+  for (const request of keys.slice(0, Math.max(0, keys.length - maxEntries))) {
+    await cache.delete(request);
+    count(cacheName, 'evicted');
+  }
+}
+
+// Images: least recently used first out, within IMAGE_CACHE_MAX_ENTRIES / _BYTES.
+// A hit is re-inserted so keys() order doubles as the recency order; each
+// entry carries its size in SIZE_HEADER so trimming never reads bodies.
+async function fromImageCache(event) {
+  const cache = await caches.open(IMAGE_CACHE);
+  const cached = await cache.match(event.request);
+  count(IMAGE_CACHE, cached ? 'hit' : 'miss');
+
+  if (cached) {
+    const copy = cached.clone();
+    event.waitUntil(cache.delete(event.request).then(() => cache.put(event.request, copy)));
+    return cached;
+  }
+
+  const response = await fetch(event.request);
+  // Opaque (cross-origin) responses have no readable size; leave them to the HTTP cache
+  if (response && response.status === 200 && response.type !== 'opaque') {
+    const copy = response.clone();
+    event.waitUntil((async () => {
+      const body = await copy.blob();
+      if (body.size > IMAGE_CACHE_MAX_BYTES) return;
+      const headers = new Headers(copy.headers);
+      headers.set(SIZE_HEADER, String(body.size));
+      await cache.put(event.request, new Response(body, { status: copy.status, statusText: copy.statusText, headers }));
+      await trimImages(cache);
+    })());
+  }
+  return response;
+}
+
+async function trimImages(cache) {
+  const keys = await cache.keys();
+  const sizes = await Promise.all(keys.map(async (request) => {
+    const response = await cache.match(request);
+    return Number(response && response.headers.get(SIZE_HEADER)) || 0;
+  }));
+
+  let entries = keys.length;
+  let bytes = sizes.reduce((total, size) => total + size, 0);
+  for (let i = 0; i < keys.length && (entries > IMAGE_CACHE_MAX_ENTRIES || bytes > IMAGE_CACHE_MAX_BYTES); i++) {
+    await cache.delete(keys[i]);
+    entries -= 1;
+    bytes -= sizes[i];
+    count(IMAGE_CACHE, 'evicted');
+  }
+}
+
+// Fetch event - route each request to its cache strategy
 self.addEventListener('fetch', (event) => {
   // Skip non-GET requests
   if (event.request.method !== 'GET') return;
-  
+
   // Skip chrome extensions and other protocols
   if (!event.request.url.startsWith('http')) return;
-  
+
+  const url = new URL(event.request.url);
+  const sameOrigin = url.origin === self.location.origin;
+  let handled;
+
+  if (sameOrigin && precacheKeys.has(url.pathname) && !url.search) {
+    handled = fromPrecache(event.request, precacheKeys.get(url.pathname));
+  } else if (sameOrigin && url.pathname.startsWith('/data/') && url.pathname.endsWith('.json')) {
+    handled = staleWhileRevalidate(event, DATA_CACHE);
+  } else if (event.request.destination === 'image' || IMAGE_EXTENSIONS.test(url.pathname)) {
+    handled = fromImageCache(event);
+  } else if (event.request.mode === 'navigate' || STATIC_EXTENSIONS.test(url.pathname) ||
+             url.hostname === 'fonts.googleapis.com' || url.hostname === 'fonts.gstatic.com') {
+    handled = staleWhileRevalidate(event, PAGE_CACHE, PAGE_CACHE_MAX_ENTRIES);
+  } else {
+    return;
+  }
+
   event.respondWith(
-    caches.match(event.request)
-      .then((cachedResponse) => {
-        // Return cached response if found
-        if (cachedResponse) {
-          return cachedResponse;
-        }
-        
-        // Otherwise fetch from network
-        return fetch(event.request).then((response) => {
-          // Don't cache non-successful responses
-          if (!response || response.status !== 200 || response.type === 'error') {
-            return response;
-          }
-          
-          // Cache certain file types
-          const url = new URL(event.request.url);
-          const shouldCache = 
-            url.pathname.endsWith('.css') ||
-            url.pathname.endsWith('.js') ||
-            url.pathname.endsWith('.json') ||
-            url.pathname.endsWith('.html') ||
-            url.pathname.endsWith('.png') ||
-            url.pathname.endsWith('.jpg') ||
-            url.pathname.endsWith('.svg') ||
-            url.pathname.endsWith('.webp');
-          
-          if (shouldCache) {
-            const responseToCache = response.clone();
-            caches.open(CACHE_NAME).then((cache) => {
-              cache.put(event.request, responseToCache);
-            });
-          }
-          
-          return response;
-        });
-      })
-      .catch(() => {
-        // Return offline page if available
-        return caches.match('/index.html');
-      })
+    handled.catch(async () => {
+      // Offline: fall back to the precached home page for navigations
+      if (event.request.mode === 'navigate' && precacheKeys.has('/index.html')) {
+        return caches.match(precacheKeys.get('/index.html'), { cacheName: PRECACHE });
+      }
+      return Response.error();
+    })
   );
 });
+
+// Cache statistics for debugging (see the usage note at the top)
+self.addEventListener('message', (event) => {
+  if (!event.data || event.data.type !== 'cache-stats') return;
+  const reply = { type: 'cache-stats', precache: PRECACHE_MANIFEST.version, caches: stats };
+  if (event.ports && event.ports[0]) {
+    event.ports[0].postMessage(reply);
+  } else if (event.source) {
+    event.source.postMessage(reply);
+  }
+});